@@ -0,0 +1,120 @@
+#
+# Honeybee-REVIVE: A Plugin for calculating Phius REVIVE using LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2024, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-REVIVE is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-REVIVE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_revive/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Calculate the Phius-REVIVE ADORB costs for many Honeybee-Models (HBJSON files) at once. 
+The models are calculated in parallel, by a pool of Python processes, and the results 
+are collected into a single table. A model which fails does not stop the others: it 
+is listed in 'failed_names_', and its log file has the full error.
+-
+EM October 17, 2026
+    Args:
+
+        _name_: (str) An optional name for the batch's output folder. Default: 'ADORB_batch'
+
+        _folder_: (str) An optional path to the folder you would like to save
+            the output files to. If none is passed, will use the default Honeybee
+            simulation path. The files are saved to a '<name>' folder inside it.
+
+        _hbjson_paths: (list[str]) The paths to the HBJSON files to calculate.
+
+        _sql_paths: (list[str]) The paths to the EnergyPlus results SQL files, one for 
+            each HBJSON file, in the same order. If only one is passed, it is used 
+            for every model.
+
+        _names_: (list[str]) Optional names for the models, in the same order as the
+            _hbjson_paths. Each name must be unique. If none are passed, the HBJSON
+            file names are used.
+
+        _max_jobs_: (int) Optional, the most models to calculate at the same time. 
+            Default: the number of CPUs.
+        
+        _run: (bool) Set to True to run the calculation.
+
+        _run_async_: (bool) Default=False. Set to True to run the calculation in the
+            background, so that Rhino is not blocked while it runs. The calculation's
+            progress is shown under the component, and the outputs are set once it is
+            finished.
+            
+    Returns:
+        results_csv_: The path to the results table: one row for each model with its 
+            status, run time and total present-value ADORB cost (by cost type).
+
+        yearly_csv_results_files_: The path to the output CSV file with the
+            ADORB cost calculated for each year, for each model (None if it failed).
+
+        cumulative_csv_results_files_: The path to the output CSV file with the
+            ADORB cost calculated cumulatively for each year, for each model (None if it failed).
+
+        failed_names_: The names of the models which failed.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+try:
+    from honeybee_revive_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_revive_rhino:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_revive_rhino._component_info_
+reload(honeybee_revive_rhino._component_info_)
+ghenv.Component.Name = "HB-REVIVE - Calculate ADORB Batch"
+DEV = honeybee_revive_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_revive_rhino.gh_compo_io.adorb import calc_ADORB_batch as gh_compo_io
+    reload(gh_compo_io)
+    
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_CalculateADORBBatch(
+        DEV,
+        IGH,
+        _name_, 
+        _folder_,
+        _hbjson_paths,
+        _sql_paths,
+        _names_,
+        _max_jobs_,
+        _run,
+        _run_async_,
+)
+results_csv_, yearly_csv_results_files_, cumulative_csv_results_files_, failed_names_ = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
@@ -22,7 +22,7 @@
 """
 Calculate the Phius-REVIVE ADORB costs for the Honeybee-Model.
 -
-EM December 11, 2024
+EM October 17, 2026
     Args:
 
         _name_: (str) An optional variant name to be used for all of the output 
@@ -39,6 +39,18 @@ EM December 11, 2024
         _hb_model: (Model) The Honeybee-Model to calculate the Phius REVIVE ADORB Costs for.
         
         _run: (bool) Set to True to run the calculation.
+
+        _reset_cache_: (bool) Default=False. Set to True to clear the stored
+            ADORB results. If the model and SQL file are unchanged since a previous
+            run, the stored results are returned without re-running the calculation.
+
+        _run_async_: (bool) Default=False. Set to True to run the calculation in the
+            background, so that Rhino is not blocked while it runs. The calculation's
+            progress is shown under the component, and the outputs are set once it is
+            finished.
+
+        _timeout_: (float) Default=120. The most minutes the calculation may run
+            for, before it is stopped. Set to 0 for no time limit.
             
     Returns:
         ADORB_costs_: <Not Implemented Yet>
@@ -51,6 +63,11 @@ EM December 11, 2024
 
         tables_: The path to the output folder with the detailed table-views from the 
             ADORB calculation.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
 """
 
 import scriptcontext as sc
@@ -93,5 +110,9 @@ gh_compo_interface = gh_compo_io.GHCompo_CalculateADORBCost(
         _sql_path,
         _hb_model,
         _run,
+        _reset_cache_,
+        _run_async_,
+        _timeout_,
 )
-yearly_csv_results_file_, cumulative_csv_results_file_, tables_ = gh_compo_interface.run()
\ No newline at end of file
+yearly_csv_results_file_, cumulative_csv_results_file_, tables_ = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
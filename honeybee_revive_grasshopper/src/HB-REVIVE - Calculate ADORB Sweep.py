@@ -0,0 +1,119 @@
+#
+# Honeybee-REVIVE: A Plugin for calculating Phius REVIVE using LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2024, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-REVIVE is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-REVIVE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_revive/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Calculate the Phius-REVIVE ADORB costs for several variants of one Honeybee-Model, 
+in a single run. Each variant is the base model with different REVIVE model properties 
+(analysis duration, envelope labor cost fraction, fuels, CO2 reduction measures, 
+grid region or national emissions). The model and the SQL file are only read once, 
+so this is much faster than re-running 'Calculate ADORB Costs' for each variant.
+-
+EM October 17, 2026
+    Args:
+
+        _name_: (str) An optional name used for the output folder and the default 
+            variant names. If none is passed, will use the Model's display_name
+
+        _folder_: (str) An optional path to the folder you would like to save
+            the output files to. If none is passed, will use the default Honeybee
+            simulation path. The files are saved to a '<name>_sweep' folder inside it.
+
+        _sql_path: (str) The path to the EnergyPlus results SQL file generated by Honeybee-Energy.
+
+        _hb_model: (Model) The base Honeybee-Model. Its Constructions, Equipment and PV
+            are used for every variant.
+
+        _variant_models: (list[Model]) The variants: the _hb_model passed through 
+            'Set Model Properties' and / or 'Add CO2 Reduction Measures to Model' with 
+            different inputs. Only the REVIVE model properties of each variant are used.
+
+        _variant_names_: (list[str]) Optional names for the variants, in the same 
+            order as the _variant_models. Each name must be unique. If none are passed,
+            the variants are named '<name>_01', '<name>_02', ...
+        
+        _run: (bool) Set to True to run the calculation.
+
+        _run_async_: (bool) Default=False. Set to True to run the calculation in the
+            background, so that Rhino is not blocked while it runs. The calculation's
+            progress is shown under the component, and the outputs are set once it is
+            finished.
+            
+    Returns:
+        variant_names_: The name of each variant.
+
+        yearly_csv_results_files_: The path to the output CSV file with the
+            ADORB cost calculated for each year, for each variant.
+
+        cumulative_csv_results_files_: The path to the output CSV file with the
+            ADORB cost calculated cumulatively for each year, for each variant.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+try:
+    from honeybee_revive_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_revive_rhino:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_revive_rhino._component_info_
+reload(honeybee_revive_rhino._component_info_)
+ghenv.Component.Name = "HB-REVIVE - Calculate ADORB Sweep"
+DEV = honeybee_revive_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_revive_rhino.gh_compo_io.adorb import calc_ADORB_sweep as gh_compo_io
+    reload(gh_compo_io)
+    
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_CalculateADORBSweep(
+        DEV,
+        IGH,
+        _name_, 
+        _folder_,
+        _sql_path,
+        _hb_model,
+        _variant_models,
+        _variant_names_,
+        _run,
+        _run_async_,
+)
+variant_names_, yearly_csv_results_files_, cumulative_csv_results_files_ = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
@@ -0,0 +1,145 @@
+#
+# Honeybee-REVIVE: A Plugin for calculating Phius REVIVE using LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2024, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-REVIVE is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-REVIVE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_revive/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Estimate how sensitive the Phius-REVIVE ADORB costs of the Honeybee-Model are to 
+uncertain inputs (fuel prices and their escalation, grid-region and national emission 
+factors, construction costs), using a Monte Carlo analysis. All of the samples are 
+evaluated together in a single calculation, and the percentile bands of the yearly 
+and cumulative ADORB costs are returned.
+-
+Each uncertain input is a distribution, written as one of:
+    - normal(mean, sd)
+    - uniform(low, high)
+    - triangular(low, mode, high)
+    - a single number (a fixed value)
+Except for the escalation rate, these are factors on the model's own values, 
+so ie: 'normal(1.0, 0.1)' is the model's value +/- 10% (one standard deviation).
+-
+EM October 17, 2026
+    Args:
+
+        _name_: (str) An optional name to be used for all of the output 
+            files. If none is passed, will use the Model's display_name
+
+        _folder_: (str) An optional path to the folder you would like to save
+            the output files to. If none is passed, will use the default Honeybee
+            simulation path.
+
+        _sql_path: (str) The path to the EnergyPlus results SQL file generated by Honeybee-Energy.
+
+        _hb_model: (Model) The Honeybee-Model to calculate the Phius REVIVE ADORB Costs for.
+
+        _electricity_price_: (str) Factor on the electricity purchase and sale prices 
+            and the annual base price. Default=1.0
+
+        _gas_price_: (str) Factor on the natural-gas purchase price and the annual 
+            base price. Default=1.0
+
+        _fuel_price_escalation_: (str) The annual rate at which the fuel costs rise
+            (ie: 0.02 = 2% per year). Default=0.0
+
+        _grid_emissions_: (str) Factor on the Grid-Region's hourly CO2 emission 
+            factors. Default=1.0
+
+        _national_emissions_: (str) Factor on the National Emissions kg-CO2 per USD
+            (the embodied CO2 of the constructions, equipment and CO2 measures). Default=1.0
+
+        _construction_cost_: (str) Factor on the cost per m2 of every construction. Default=1.0
+
+        _samples_: (int) The number of Monte Carlo samples. Default=1000
+
+        _seed_: (int) Optional seed for the random samples. Set a seed to get the 
+            same results each time the inputs are the same.
+
+        _percentiles_: (list[float]) The percentiles to output. Default=[5, 50, 95]
+        
+        _run: (bool) Set to True to run the calculation.
+
+        _run_async_: (bool) Default=False. Set to True to run the calculation in the
+            background, so that Rhino is not blocked while it runs.
+            
+    Returns:
+        yearly_csv_percentiles_file_: The path to the output CSV file with the 
+            percentiles of each ADORB cost column (and the total) for each year.
+
+        cumulative_csv_percentiles_file_: The path to the output CSV file with the 
+            percentiles of the cumulative ADORB costs for each year.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+try:
+    from honeybee_revive_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_revive_rhino:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_revive_rhino._component_info_
+reload(honeybee_revive_rhino._component_info_)
+ghenv.Component.Name = "HB-REVIVE - Calculate ADORB Uncertainty"
+DEV = honeybee_revive_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_revive_rhino.gh_compo_io.adorb import calc_ADORB_uncertainty as gh_compo_io
+    reload(gh_compo_io)
+    
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_CalculateADORBUncertainty(
+        DEV,
+        IGH,
+        _name_, 
+        _folder_,
+        _sql_path,
+        _hb_model,
+        _electricity_price_,
+        _gas_price_,
+        _fuel_price_escalation_,
+        _grid_emissions_,
+        _national_emissions_,
+        _construction_cost_,
+        _samples_,
+        _seed_,
+        _percentiles_,
+        _run,
+        _run_async_,
+)
+yearly_csv_percentiles_file_, cumulative_csv_percentiles_file_ = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
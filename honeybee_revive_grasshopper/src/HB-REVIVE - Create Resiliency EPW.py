@@ -25,7 +25,7 @@ simulations. This modified EPW will has adjustments maded to the outdoor dry-bub
 temperature and the outdoor air dew-point temperature in order to create a more 'stressful'
 climate for the building.
 -
-EM October 14, 2024
+EM October 17, 2026
     Args:
         _epw_file: The original EPW weather file to use as the base.
 
@@ -57,7 +57,12 @@ EM October 14, 2024
             resiliency assessment.
         
         summer_run_period_: The summer-critical-week period which is used for the Phius-REVIVE
-            resiliency assessment.     
+            resiliency assessment.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
 """
 
 import scriptcontext as sc
@@ -103,4 +108,5 @@ gh_compo_interface = gh_compo_io.GHCompo_CreateResiliencyEPWFile(
         _summer_20yr_dew_point_temp,
         _run,
 )
-epw_file_, winter_run_period_, summer_run_period_ = gh_compo_interface.run()
\ No newline at end of file
+epw_file_, winter_run_period_, summer_run_period_ = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
@@ -22,7 +22,7 @@
 """
 Output graphs of the calculated ADORB cost values.
 -
-EM November 15, 2024
+EM October 17, 2026
     Args:
         _adorb_costs_csv: The CSV file with the ADORB costs to graph
 
@@ -32,6 +32,11 @@ EM November 15, 2024
 
     Returns:       
         output_: The path to the output files.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
 """
 
 import scriptcontext as sc
@@ -72,4 +77,5 @@ gh_compo_interface = gh_compo_io.GHCompo_GenerateADORBGraphs(
         _adorb_costs_csv,
         _folder_,
 )
-output_ = gh_compo_interface.run()
\ No newline at end of file
+output_ = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
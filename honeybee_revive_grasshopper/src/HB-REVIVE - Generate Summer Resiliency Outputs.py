@@ -22,7 +22,7 @@
 """
 ............
 -
-EM October 26, 2024
+EM October 17, 2026
     Args:
         _folder_: (Optional) An optional path to a folder to save the graphs 
             to. If none is provided, the default Ladbybug Tools folder will be 
@@ -30,6 +30,14 @@ EM October 26, 2024
 
         _sql: The SQL file path from the Honeybee-Energy 'HB Model to OSM' component. 
 
+        _run_async_: (bool) Default=False. Set to True to generate the outputs in the
+            background, so that Rhino is not blocked while they are written. The
+            progress is shown under the component, and the outputs are set once it
+            is finished.
+
+        _timeout_: (float) Default=120. The most minutes the outputs may take to
+            generate, before the job is stopped. Set to 0 for no time limit.
+
     Returns:
         summer_caution_hours_: [LIMIT=NONE] The number of hours above 26.7C [80F] 
             and below 32.2C [90F] for each zone during the analysis period.
@@ -44,6 +52,11 @@ EM October 26, 2024
             51.7C [120F] for each zone during the analysis period.
         
         output_: The path to the output files.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
 """
 
 import scriptcontext as sc
@@ -82,6 +95,8 @@ gh_compo_interface = gh_compo_io.GHCompo_ResiliencySummerOutput(
         IGH,
         _sql,
         _folder_,
+        _run_async_,
+        _timeout_,
 )
 (   
     summer_caution_hours_,
@@ -89,4 +104,5 @@ gh_compo_interface = gh_compo_io.GHCompo_ResiliencySummerOutput(
     summer_danger_hours_,
     summer_extreme_danger_hours_,
     output_,
-) = gh_compo_interface.run()
\ No newline at end of file
+) = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
@@ -31,7 +31,7 @@ This new program will:
 - Turn off all Heating/Cooling equipment for the 'outage' periods
 - Reset the Ventilation flow rates to 5cfm (8.5 m3/h) / person
 -
-EM October 14, 2024
+EM October 17, 2026
     Args:
         _hb_obj: (list[Room] | Model) The Honeybee-Rooms or a Honeybee-Model.
 
@@ -49,8 +49,19 @@ EM October 14, 2024
             REVIVE Resiliency Program. In none is provided, the default Resiliency Program from
             the Standards library will be used.
 
+        _shallow_copy_: (bool) Default=False. Set True to have the new Rooms share their geometry (Faces,
+            Apertures, Doors and Shades) with the input Rooms instead of copying it, which is much
+            faster and uses less memory on large models. Only the Rooms' program, loads and HVAC are
+            changed here, so the output is the same, but do not edit the geometry (or the Face
+            properties) of the output Rooms downstream when this is on.
+
     Returns:
-        hb_obj_: The Honeybee-Rooms or Honeybee-Model with the new Program applied. 
+        hb_obj_: The Honeybee-Rooms or Honeybee-Model with the new Program applied.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
 """
 
 import scriptcontext as sc
@@ -95,6 +106,8 @@ gh_compo_interface = gh_compo_io.GHCompo_SetResiliencyProgram(
         _program_,
         _winter_run_period,
         _summer_run_period,
+        _shallow_copy_,
 )
 epw_file_ = _epw_file
-hb_obj_, program_, = gh_compo_interface.run()
\ No newline at end of file
+hb_obj_, program_, = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
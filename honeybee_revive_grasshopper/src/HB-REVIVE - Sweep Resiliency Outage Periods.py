@@ -0,0 +1,150 @@
+#
+# Honeybee-REVIVE: A Plugin for calculating Phius REVIVE using LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2024, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-REVIVE is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-REVIVE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_revive/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Run the Phius-REVIVE resiliency setup for many winter / summer outage weeks in one go, to 
+find the worst-case outage for the building. For each (winter, summer) pair of outage weeks,
+a resiliency EPW file is created (the same as the 'Create Resiliency EPW' component, but 
+using the weeks given rather than the STAT file's extreme weeks) and the 'Resiliency' program 
+is set on a copy of the model (the same as the 'Set Resiliency Program' component). The EPW 
+and STAT files are only read once for all of the variants.
+-
+Each variant's EPW and HBJSON file are saved to a '<name>/outage_NN' folder, and are listed
+in a 'manifest.csv' file (name, hbjson, epw, sim_par, winter_run_period, summer_run_period)
+which can be used to run all of the resiliency simulations in parallel.
+-
+EM October 17, 2026
+    Args:
+        _name_: (str) An optional name for the sweep's output folder. Default: 'resiliency_sweep'
+
+        _folder_: (str) An optional path to the folder you would like to save
+            the output files to. If none is passed, will use the default Honeybee
+            simulation path. The files are saved to a '<name>' folder inside it.
+
+        _epw_file: The original EPW weather file to use as the base.
+
+        _stat_file: The original STAT file. Only needed if no outage weeks are given
+            for one of the seasons, in which case the STAT file's extreme week is used.
+
+        _winter_10yr_dry_bulb_temp: The 10-year extreme (min) Dry-Bulb Air Temp. Use the 
+            ashrae-meteo.info website to find these "n-Year Return Period Values of Extreme Temp."
+
+        _winter_10yr_dew_point_temp: The 10-year extreme (min) Dew-Point Air Temp. Use the 
+            ashrae-meteo.info website to find these "n-Year Return Period Values of Extreme Temp."
+
+        _summer_20yr_dry_bulb_temp: The 20-year extreme (max) Dry-Bulb Air Temp. Use the 
+            ashrae-meteo.info website to find these "n-Year Return Period Values of Extreme Temp."
+
+        _summer_20yr_dew_point_temp: The 20-year extreme (max) Dew-Point Air Temp. Use the 
+            ashrae-meteo.info website to find these "n-Year Return Period Values of Extreme Temp."
+
+        _winter_outage_weeks: (list[AnalysisPeriod]) The winter outage weeks to test. Each must
+            be a full week (168 hours), ie: '2/1 to 2/7 between 0 and 23'. 
+
+        _summer_outage_weeks: (list[AnalysisPeriod]) The summer outage weeks to test, paired 
+            in order with the winter weeks. If only one week is given for a season, it is
+            used with every week of the other season.
+
+        _hb_model: (Model) The Honeybee-Model.
+
+        _total_num_dwelling_units: (int) The total number of dwelling units in the building.
+
+        _additional_elec_equip: (Optional) Default=None. Any additional electric equipment 
+            which should be operational during the resiliency simulations. See the
+            'Set Resiliency Program' component.
+
+        _program_: (Optional) Default=None. An optional base program to use when creating the 
+            Phius REVIVE Resiliency Program. In none is provided, the default Resiliency Program 
+            from the Standards library will be used.
+
+        _run: (bool) Set to True to run the sweep.
+
+    Returns:
+        manifest_: The path to the manifest CSV file, with one row for each variant.
+
+        epw_files_: The resiliency EPW file of each variant.
+
+        winter_run_periods_: The winter run period (outage week +/- 1 day) of each variant.
+
+        summer_run_periods_: The summer run period (outage week +/- 1 day) of each variant.
+
+        hb_models_: The Honeybee-Model of each variant, with its Resiliency program applied.
+            Note that the variants share their geometry with the input model, so do not edit
+            their geometry downstream.
+
+        perf_: The time taken by each step of the run, to find out where a slow run
+            spends its time. With the HBRV_PERF_LOG environment variable set, the memory
+            is shown too, and each run is also added to the log file:
+            '{simulation folder}/REVIVE/_perf/perf_log.jsonl'.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+try:
+    from honeybee_revive_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_revive_rhino:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_revive_rhino._component_info_
+reload(honeybee_revive_rhino._component_info_)
+ghenv.Component.Name = "HB-REVIVE - Sweep Resiliency Outage Periods"
+DEV = honeybee_revive_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_revive_rhino.gh_compo_io.resiliency import sweep_outage_periods as gh_compo_io
+    reload(gh_compo_io)
+    
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_SweepResiliencyOutagePeriods(
+        IGH,
+        _name_,
+        _folder_,
+        _epw_file,
+        _stat_file,
+        _winter_10yr_dry_bulb_temp,
+        _winter_10yr_dew_point_temp,
+        _summer_20yr_dry_bulb_temp,
+        _summer_20yr_dew_point_temp,
+        _winter_outage_weeks,
+        _summer_outage_weeks,
+        _hb_model,
+        _total_num_dwelling_units,
+        _additional_elec_equip,
+        _program_,
+        _run,
+)
+manifest_, epw_files_, winter_run_periods_, summer_run_periods_, hb_models_ = gh_compo_interface.run()
+perf_ = gh_compo_interface.perf.report_lines()
\ No newline at end of file
@@ -124,6 +124,24 @@ COMPONENT_PARAMS = {
         "Category": CATEGORY,
         "SubCategory": 2,
     },
+    "HB-REVIVE - Calculate ADORB Sweep": {
+        "NickName": "Calculate ADORB Sweep",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 2,
+    },
+    "HB-REVIVE - Calculate ADORB Uncertainty": {
+        "NickName": "Calculate ADORB Uncertainty",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 2,
+    },
+    "HB-REVIVE - Calculate ADORB Batch": {
+        "NickName": "Calculate ADORB Batch",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 2,
+    },
     "HB-REVIVE - Set ADORB Simulation Output Variables": {
         "NickName": "Set ADORB Simulation Output Variables",
         "Message": RELEASE_VERSION,
@@ -161,6 +179,12 @@ COMPONENT_PARAMS = {
         "Category": CATEGORY,
         "SubCategory": 2,
     },
+    "HB-REVIVE - Sweep Resiliency Outage Periods": {
+        "NickName": "Sweep Resiliency Outage Periods",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 2,
+    },
     "HB-REVIVE - Set Resiliency Simulation Output Variables": {
         "NickName": "Set Resiliency Simulation Output Variables",
         "Message": RELEASE_VERSION,
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Utility: Functions for the CSV files (ie: the manifests) written by the components."""
+
+try:
+    from typing import Any
+except ImportError:
+    pass  # IronPython 2.7
+
+
+def csv_line(_values):
+    # type: (list[Any] | tuple[Any, ...]) -> str
+    """Return the values as one line of CSV, each value quoted (file paths may include commas)."""
+    return ",".join('"{}"'.format(str(v).replace('"', '""')) for v in _values)
@@ -2,3 +2,6 @@ from honeybee_revive_rhino.gh_compo_io.adorb.calc_ADORB_costs import GHCompo_Cal
 from honeybee_revive_rhino.gh_compo_io.adorb.set_ADORB_output_variables import GHCompo_SetADORBSimulationOutputVariables
 from honeybee_revive_rhino.gh_compo_io.adorb.generate_graphs import GHCompo_GenerateADORBGraphs
 from honeybee_revive_rhino.gh_compo_io.adorb.create_fuel import GHCompo_CreateADORBFuelType
+from honeybee_revive_rhino.gh_compo_io.adorb.calc_ADORB_sweep import GHCompo_CalculateADORBSweep
+from honeybee_revive_rhino.gh_compo_io.adorb.calc_ADORB_uncertainty import GHCompo_CalculateADORBUncertainty
+from honeybee_revive_rhino.gh_compo_io.adorb.calc_ADORB_batch import GHCompo_CalculateADORBBatch
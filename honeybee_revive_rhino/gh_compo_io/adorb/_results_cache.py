@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""A content-addressed disk cache for the ADORB cost-calculation results."""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+try:
+    from typing import Any, Iterator
+except ImportError:
+    pass  # IronPython 2.7
+
+
+# -----------------------------------------------------------------------------
+# -- Cache Keys
+
+
+def file_signature(_file_path, _full_hash=False):
+    # type: (str, bool) -> str
+    """Return a signature string for a file: its size and modified-time, or (optionally) a hash of its bytes.
+
+    ### Arguments:
+        * _file_path: The path to the file.
+        * _full_hash: Set True to hash the entire file contents (slow for large SQL files).
+    ### Returns:
+        * str: The signature string for the file, or "" if the file does not exist.
+    """
+    if not _file_path or not os.path.isfile(_file_path):
+        return ""
+
+    if _full_hash:
+        hasher = hashlib.sha256()
+        with open(_file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    stat = os.stat(_file_path)
+    return "{}:{}".format(stat.st_size, int(stat.st_mtime))
+
+
+def build_cache_key(_model_json_hash, _sql_path, _script_paths, _full_sql_hash=False):
+    # type: (str, str, list[str], bool) -> str
+    """Return the cache key for a single ADORB calculation.
+
+    The key covers everything the calculation depends on: the serialized model, the
+    EnergyPlus SQL results, and the Python-3 scripts which calculate the results (so that
+    changing any of them, or upgrading ph_adorb, invalidates any older results).
+
+    ### Arguments:
+        * _model_json_hash: The hex-digest of the serialized (sort_keys=True) revive-extract JSON.
+        * _sql_path: The path to the EnergyPlus SQL file.
+        * _script_paths: The paths to the Python-3 files the calculation depends on.
+        * _full_sql_hash: Set True to hash the full SQL file rather than its size + modified-time.
+    ### Returns:
+        * str: The hex-digest cache key.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(_model_json_hash.encode("utf-8"))
+    hasher.update(file_signature(_sql_path, _full_sql_hash).encode("utf-8"))
+    for script_path in _script_paths:
+        hasher.update(file_signature(script_path).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# -- Cache
+
+
+def _folder_size(_path):
+    # type: (str) -> int
+    """Return the total size (bytes) of all the files in a folder."""
+    total = 0
+    for root, _, files in os.walk(_path):
+        for f in files:
+            total += os.path.getsize(os.path.join(root, f))
+    return total
+
+
+def _replace_folder(_source, _destination):
+    # type: (str, str) -> None
+    """Copy a folder, replacing the destination folder if it already exists."""
+    if os.path.isdir(_destination):
+        shutil.rmtree(_destination)
+    shutil.copytree(_source, _destination)
+
+
+def _replace_file(_source, _destination):
+    # type: (str, str) -> None
+    """Move a file over the destination file, in one step where the platform allows it."""
+    replace = getattr(os, "replace", None)
+    if replace:
+        replace(_source, _destination)
+        return
+
+    # -- IronPython 2.7 has no os.replace, and its os.rename will not overwrite a file on Windows
+    try:
+        os.rename(_source, _destination)
+    except OSError:
+        os.remove(_destination)
+        os.rename(_source, _destination)
+
+
+class ADORBResultsCache(object):
+    """A disk cache of ADORB results (yearly CSV, cumulative CSV, tables folder) with LRU eviction.
+
+    Each entry is stored in its own folder (named by the cache key) under the cache root, and
+    an 'index.json' file records the size and last-access time of each entry. When the cache
+    grows past either limit, the least-recently-used entries are removed.
+
+    The index is shared by every Rhino instance using the same simulation folder, so each
+    update of it is made while holding a lock file ('index.lock'), and the new index is
+    written to a temporary file first, then moved over the old one.
+    """
+
+    INDEX_FILENAME = "index.json"
+    LOCK_FILENAME = "index.lock"
+    # -- The index is only locked for a few milliseconds: an older lock file was left by a crashed run.
+    LOCK_STALE_SECONDS = 10.0
+    LOCK_RETRY_SECONDS = 0.05
+    YEARLY_FILENAME = "yearly.csv"
+    CUMULATIVE_FILENAME = "cumulative.csv"
+    TABLES_FOLDERNAME = "tables"
+    STDOUT_FILENAME = "stdout.txt"
+
+    def __init__(self, _cache_dir, _max_entries=20, _max_size_mb=500):
+        # type: (str, int, float) -> None
+        self.cache_dir = _cache_dir
+        self.max_entries = _max_entries
+        self.max_size_bytes = int(_max_size_mb * 1024 * 1024)
+
+    @property
+    def index_file_path(self):
+        # type: () -> str
+        return os.path.join(self.cache_dir, self.INDEX_FILENAME)
+
+    def _read_index(self):
+        # type: () -> dict[str, dict[str, Any]]
+        if not os.path.isfile(self.index_file_path):
+            return {}
+        try:
+            with open(self.index_file_path, "r") as f:
+                return json.load(f)
+        except ValueError:
+            # -- A corrupt index: start over, the entry folders will be re-built as needed.
+            return {}
+
+    def _write_index(self, _index):
+        # type: (dict[str, dict[str, Any]]) -> None
+        """Write the index to a temporary file, then move it over the old one (so it is never read half-written)."""
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        temp_file_path = "{}.{}.tmp".format(self.index_file_path, os.getpid())
+        with open(temp_file_path, "w") as f:
+            json.dump(_index, f, indent=2)
+        _replace_file(temp_file_path, self.index_file_path)
+
+    @property
+    def lock_file_path(self):
+        # type: () -> str
+        return os.path.join(self.cache_dir, self.LOCK_FILENAME)
+
+    def _lock_is_stale(self):
+        # type: () -> bool
+        try:
+            return time.time() - os.path.getmtime(self.lock_file_path) > self.LOCK_STALE_SECONDS
+        except OSError:
+            return False  # -- Already removed by its owner
+
+    @contextmanager
+    def _locked_index(self):
+        # type: () -> Iterator[dict[str, dict[str, Any]]]
+        """Hold the index lock, and yield the index. The index is written back when the block is done.
+
+        ### Usage:
+        >>> with self._locked_index() as index:
+        >>>     index[_key] = {...}
+        """
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+        while True:
+            try:
+                os.close(os.open(self.lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except OSError as e:
+                # -- Windows gives EACCES while another process is removing the lock file
+                if e.errno not in (errno.EEXIST, errno.EACCES):
+                    raise
+            if self._lock_is_stale():
+                print("Removing a stale ADORB results cache lock: {}".format(self.lock_file_path))
+                try:
+                    os.remove(self.lock_file_path)
+                except OSError:
+                    pass
+                continue
+            time.sleep(self.LOCK_RETRY_SECONDS)
+
+        try:
+            index = self._read_index()
+            yield index
+            self._write_index(index)
+        finally:
+            try:
+                os.remove(self.lock_file_path)
+            except OSError:
+                pass
+
+    def entry_dir(self, _key):
+        # type: (str) -> str
+        return os.path.join(self.cache_dir, _key)
+
+    def _entry_is_complete(self, _key):
+        # type: (str) -> bool
+        entry_dir = self.entry_dir(_key)
+        return (
+            os.path.isfile(os.path.join(entry_dir, self.YEARLY_FILENAME))
+            and os.path.isfile(os.path.join(entry_dir, self.CUMULATIVE_FILENAME))
+            and os.path.isdir(os.path.join(entry_dir, self.TABLES_FOLDERNAME))
+        )
+
+    def get(self, _key, _yearly_csv_path, _cumulative_csv_path, _tables_folder_path):
+        # type: (str, str, str, str) -> str | None
+        """Copy a cached result out to the requested paths.
+
+        ### Arguments:
+            * _key: The cache key for the calculation.
+            * _yearly_csv_path: The path to copy the yearly CSV to.
+            * _cumulative_csv_path: The path to copy the cumulative CSV to.
+            * _tables_folder_path: The folder path to copy the tables to.
+        ### Returns:
+            * str | None: The cached stdout from the original run, or None if the key is not in the cache.
+        """
+        index = self._read_index()
+        if _key not in index or not self._entry_is_complete(_key):
+            return None
+
+        entry_dir = self.entry_dir(_key)
+        shutil.copyfile(os.path.join(entry_dir, self.YEARLY_FILENAME), _yearly_csv_path)
+        shutil.copyfile(os.path.join(entry_dir, self.CUMULATIVE_FILENAME), _cumulative_csv_path)
+        _replace_folder(os.path.join(entry_dir, self.TABLES_FOLDERNAME), _tables_folder_path)
+
+        with self._locked_index() as index:
+            if _key in index:
+                index[_key]["last_access"] = time.time()
+
+        stdout_path = os.path.join(entry_dir, self.STDOUT_FILENAME)
+        if not os.path.isfile(stdout_path):
+            return ""
+        with open(stdout_path, "r") as f:
+            return f.read()
+
+    def put(self, _key, _yearly_csv_path, _cumulative_csv_path, _tables_folder_path, _stdout=""):
+        # type: (str, str, str, str, Any) -> None
+        """Add a new calculation result to the cache, then evict any old entries over the limits.
+
+        ### Arguments:
+            * _key: The cache key for the calculation.
+            * _yearly_csv_path: The path to the yearly CSV to store.
+            * _cumulative_csv_path: The path to the cumulative CSV to store.
+            * _tables_folder_path: The folder path of the tables to store.
+            * _stdout: The stdout from the calculation (stored so warnings can be re-issued on a hit).
+        """
+        if not os.path.isfile(_yearly_csv_path) or not os.path.isfile(_cumulative_csv_path):
+            return
+
+        entry_dir = self.entry_dir(_key)
+        if os.path.isdir(entry_dir):
+            shutil.rmtree(entry_dir)
+        os.makedirs(entry_dir)
+
+        shutil.copyfile(_yearly_csv_path, os.path.join(entry_dir, self.YEARLY_FILENAME))
+        shutil.copyfile(_cumulative_csv_path, os.path.join(entry_dir, self.CUMULATIVE_FILENAME))
+        if os.path.isdir(_tables_folder_path):
+            shutil.copytree(_tables_folder_path, os.path.join(entry_dir, self.TABLES_FOLDERNAME))
+        else:
+            os.makedirs(os.path.join(entry_dir, self.TABLES_FOLDERNAME))
+        with open(os.path.join(entry_dir, self.STDOUT_FILENAME), "w") as f:
+            f.write(str(_stdout))
+
+        size = _folder_size(entry_dir)
+        with self._locked_index() as index:
+            index[_key] = {"last_access": time.time(), "size": size}
+            self._evict(index)
+
+    def _evict(self, _index):
+        # type: (dict[str, dict[str, Any]]) -> None
+        """Remove the least-recently-used entries until the cache is within its limits."""
+        lru_keys = sorted(_index.keys(), key=lambda k: _index[k].get("last_access", 0))
+        total_size = sum(entry.get("size", 0) for entry in _index.values())
+
+        while lru_keys and (len(_index) > self.max_entries or total_size > self.max_size_bytes):
+            key = lru_keys.pop(0)
+            total_size -= _index.pop(key).get("size", 0)
+            if os.path.isdir(self.entry_dir(key)):
+                shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+
+    def clear(self):
+        # type: () -> None
+        """Remove every entry from the cache."""
+        if os.path.isdir(self.cache_dir):
+            print("Clearing the ADORB results cache: {}".format(self.cache_dir))
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Write only the parts of a Honeybee-Model which the ADORB calculation uses, instead of the full HBJSON.
+
+The ADORB calculation never looks at the model's geometry: it only needs the area of each
+Construction, and the REVIVE cost properties of the Constructions, Appliances (Process loads),
+Lighting, HVAC equipment and PV. The 'revive extract' file holds just that:
+
+    {
+        "type": "ReviveADORBExtract",
+        "version": 1,
+        "identifier": ..., "display_name": ...,
+        "properties": {"revive": {...}},          # -- The ModelReviveProperties, as in the HBJSON
+        "constructions": [{...}, ...],            # -- Every Construction in the model (full dicts)
+        "construction_areas_m2": {id: m2, ...},   # -- The Face and Aperture areas of each Construction
+        "lighting": [{...}, ...],                 # -- The unique Lighting, Process and HVAC objects
+        "process_loads": [{...}, ...],
+        "hvac_systems": [{...}, ...],
+        "rooms": [{"lighting": 0, "process_loads": [0, 1], "hvac": 0}, ...],  # -- indexes into the lists
+        "pv_properties": [{...}, ...]             # -- The PV of each Shade which has any
+    }
+
+The Python-3 side (`py3_scripts/revive_extract.py`) reads this in place of the HBJSON file (or from stdin).
+"""
+
+import json
+
+try:
+    from typing import Any, Iterator
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.model import Model
+    from honeybee.units import conversion_factor_to_meters
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+
+EXTRACT_TYPE = "ReviveADORBExtract"
+
+# -- Increase when the extract's content changes (it is also part of the results-cache key)
+EXTRACT_VERSION = 1
+
+
+# -- The model file path which tells the Python-3 scripts to read the model data from stdin.
+MODEL_FROM_STDIN = "-"
+
+# -- The extract's lists of Honeybee objects. These are converted to dicts and written one object at a time.
+OBJECT_LIST_KEYS = ("constructions", "lighting", "process_loads", "hvac_systems", "pv_properties")
+
+
+class _UniqueObjects(object):
+    """The unique objects (by identity), with an index for each."""
+
+    def __init__(self):
+        self._indexes = {}  # type: dict[int, int]
+        self.objects = []  # type: list[Any]
+
+    def index(self, _obj):
+        # type: (Any) -> int | None
+        if _obj is None:
+            return None
+        key = id(_obj)
+        if key not in self._indexes:
+            self._indexes[key] = len(self.objects)
+            self.objects.append(_obj)
+        return self._indexes[key]
+
+
+def construction_areas_m2(_hb_model):
+    # type: (Model) -> dict[str, float]
+    """Return the total area (m2) of each Construction, counting the Faces and their Apertures (as ph_adorb does)."""
+    area_factor = conversion_factor_to_meters(_hb_model.units) ** 2
+    areas = {}  # type: dict[str, float]
+    for face in _hb_model.faces:
+        for ap in face.apertures:
+            identifier = ap.properties.energy.construction.identifier
+            areas[identifier] = areas.get(identifier, 0.0) + ap.area * area_factor
+        identifier = face.properties.energy.construction.identifier
+        areas[identifier] = areas.get(identifier, 0.0) + face.area * area_factor
+    return areas
+
+
+def _revive_extract_fields(_hb_model):
+    # type: (Model) -> dict[str, Any]
+    """Return the 'revive extract' fields of the HB-Model (see the module docstring), with the lists as objects."""
+    lighting, process_loads, hvac_systems = _UniqueObjects(), _UniqueObjects(), _UniqueObjects()
+
+    rooms = []
+    for room in _hb_model.rooms:
+        room_prop_e = room.properties.energy
+        rooms.append(
+            {
+                "lighting": lighting.index(room_prop_e.lighting),
+                "process_loads": [process_loads.index(p) for p in room_prop_e.process_loads],
+                "hvac": hvac_systems.index(room_prop_e.hvac),
+            }
+        )
+
+    pv_properties = []
+    for shade in _hb_model.shades:
+        pv = shade.properties.energy.pv_properties
+        if pv:
+            pv_properties.append(pv)
+
+    return {
+        "type": EXTRACT_TYPE,
+        "version": EXTRACT_VERSION,
+        "identifier": _hb_model.identifier,
+        "display_name": _hb_model.display_name,
+        "properties": _hb_model.properties.revive.to_dict(),
+        "constructions": _hb_model.properties.energy.constructions,
+        "construction_areas_m2": construction_areas_m2(_hb_model),
+        "lighting": lighting.objects,
+        "process_loads": process_loads.objects,
+        "hvac_systems": hvac_systems.objects,
+        "rooms": rooms,
+        "pv_properties": pv_properties,
+    }
+
+
+def _dumps(_obj):
+    # type: (Any) -> str
+    return json.dumps(_obj, ensure_ascii=False, sort_keys=True)
+
+
+def iter_revive_extract_json(_hb_model):
+    # type: (Model) -> Iterator[str]
+    """Yield the HB-Model's 'revive extract' JSON text in pieces.
+
+    The joined pieces are the same text as `json.dumps(extract, ensure_ascii=False, sort_keys=True)`, but
+    only one Construction (or Lighting, Process, HVAC or PV object) is converted to a dict at a time.
+
+    ### Arguments:
+        * _hb_model: The Honeybee Model to serialize.
+    ### Yields:
+        * str: The next piece of the JSON text.
+    """
+    fields = _revive_extract_fields(_hb_model)
+
+    yield "{"
+    for i, key in enumerate(sorted(fields)):
+        yield "{}{}: ".format(", " if i else "", _dumps(key))
+        if key not in OBJECT_LIST_KEYS:
+            yield _dumps(fields[key])
+            continue
+
+        yield "["
+        for j, obj in enumerate(fields[key]):
+            if j:
+                yield ", "
+            yield _dumps(obj.to_dict())
+        yield "]"
+    yield "}"
+
+
+def revive_extract_json_bytes(_hb_model):
+    # type: (Model) -> bytes
+    """Return the HB-Model's 'revive extract' as UTF-8 encoded JSON."""
+    return b"".join(piece.encode("utf-8") for piece in iter_revive_extract_json(_hb_model))
+
+
+def write_revive_extract_json(_hb_model, _file_path, _hasher=None):
+    # type: (Model, str, Any) -> str
+    """Write the HB-Model's 'revive extract' to a UTF-8 JSON file, one piece at a time (see `iter_revive_extract_json`).
+
+    ### Arguments:
+        * _hb_model: The Honeybee Model to write.
+        * _file_path: The full file path to write to.
+        * _hasher: Optional, a hashlib object which is also updated with the bytes written.
+    ### Returns:
+        * str: The full file path written to.
+    """
+    with open(_file_path, "wb") as fp:
+        for piece in iter_revive_extract_json(_hb_model):
+            data = piece.encode("utf-8")
+            fp.write(data)
+            if _hasher:
+                _hasher.update(data)
+    return _file_path
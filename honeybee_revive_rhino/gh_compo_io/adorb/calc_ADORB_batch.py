@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GH-Component Interface: HB-REVIVE - Calculate ADORB Batch."""
+
+import csv
+import hashlib
+import os
+
+try:
+    from typing import Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io import background_jobs
+    from honeybee_revive_rhino.gh_compo_io._csv_files import csv_line
+    from honeybee_revive_rhino.gh_compo_io.run_subprocess import PY3_SCRIPTS_DIR, run_subprocess_in_worker
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+from honeybee_revive_rhino.gh_compo_io import perf
+
+# -- The results table written by 'py3_scripts/adorb_batch.py'
+RESULTS_FILE_NAME = "adorb_batch_results.csv"
+
+
+def run_ADORB_batch(_manifest_file_path, _output_folder, _max_jobs=None, _on_output=None):
+    # type: (str, str, int | None, Callable[[str], None] | None) -> tuple[str, str]
+    """Using Ladybug's Python-3 interpreter: calculate the ADORB costs of every model in the manifest.
+
+    ### Arguments:
+        * _manifest_file_path: The path to the manifest CSV file ('name', 'hbjson' and 'sql' columns).
+        * _output_folder: The folder to write the results to.
+        * _max_jobs: Optional, the most models to calculate at the same time (default: the number of CPUs).
+        * _on_output: Optional, called with each line the calculation prints, while it runs.
+
+    ### Returns:
+        * tuple
+            - [0] (str): The stdout from the subprocess.
+            - [1] (str): The stderr from the subprocess.
+    """
+    py3_script_filepath = os.path.join(PY3_SCRIPTS_DIR, "adorb_batch.py")
+    assert os.path.isfile(py3_script_filepath), "No Python file to run found at: {}".format(py3_script_filepath)
+
+    print("Using Python-3 interpreter: '{}'".format(hb_folders.python_exe_path))
+    print("Running Python-3 script: '{}'".format(py3_script_filepath))
+    commands = [
+        hb_folders.python_exe_path,  # --- The interpreter to use
+        py3_script_filepath,  # ---------- The script to run
+        _manifest_file_path,  # ---------- The models to calculate
+        _output_folder,  # --------------- The folder to save the results to
+        str(_max_jobs or ""),  # --------- The number of models to calculate at once ('' for the CPU count)
+    ]
+    # -- No time limit: a large batch may well run for hours (it can still be cancelled).
+    return run_subprocess_in_worker(commands, _on_output, _timeout=None)
+
+
+def read_results_table(_file_path):
+    # type: (str) -> list[dict[str, str]]
+    """Return the rows of the batch results table."""
+    with open(_file_path) as fp:
+        return list(csv.DictReader(fp))
+
+
+# -----------------------------------------------------------------------------
+# -- Grasshopper Interface
+
+
+class GHCompo_CalculateADORBBatch(object):
+    """GHCompo Interface: HB-REVIVE - Calculate ADORB Batch."""
+
+    def __init__(
+        self,
+        _DEBUG,
+        _IGH,
+        _batch_name,
+        _save_dir,
+        _hbjson_paths,
+        _sql_paths,
+        _names,
+        _max_jobs,
+        _calculate_ADORB,
+        _run_async=False,
+        *args,
+        **kwargs
+    ):
+        # type: (bool, gh_io.IGH, str, str, list[str], list[str], list[str], int, bool, bool, list, dict) -> None
+        self.DEBUG = _DEBUG
+        self.IGH = _IGH
+        self.batch_name = _batch_name or "ADORB_batch"
+        self.save_dir = _save_dir or os.path.join(hb_folders.default_simulation_folder, "REVIVE")
+        self.hbjson_paths = [p for p in (_hbjson_paths or []) if p]
+        self.sql_paths = [p for p in (_sql_paths or []) if p]
+        self.names = _names or []
+        self.max_jobs = int(_max_jobs) if _max_jobs else None
+        self.calculate_ADORB = _calculate_ADORB
+        self.run_async = _run_async or False
+
+    @property
+    def batch_folder_path(self):
+        # type: () -> str
+        return os.path.join(self.save_dir, self.batch_name)
+
+    @property
+    def manifest_file_path(self):
+        # type: () -> str
+        return os.path.join(self.batch_folder_path, "manifest.csv")
+
+    @property
+    def results_file_path(self):
+        # type: () -> str
+        return os.path.join(self.batch_folder_path, RESULTS_FILE_NAME)
+
+    def manifest_rows(self):
+        # type: () -> list[tuple[str, str, str]]
+        """Return the (name, hbjson, sql) of each model. A single SQL file path is used for every model."""
+        sql_paths = self.sql_paths
+        if len(sql_paths) == 1:
+            sql_paths = sql_paths * len(self.hbjson_paths)
+        if len(sql_paths) != len(self.hbjson_paths):
+            raise ValueError(
+                "Got {} HBJSON files but {} SQL files. Please provide one SQL file for each HBJSON file.".format(
+                    len(self.hbjson_paths), len(self.sql_paths)
+                )
+            )
+
+        rows = []
+        for i, (hbjson_path, sql_path) in enumerate(zip(self.hbjson_paths, sql_paths)):
+            try:
+                name = self.names[i]
+            except IndexError:
+                name = None
+            rows.append((name or os.path.splitext(os.path.basename(hbjson_path))[0], hbjson_path, sql_path))
+        return rows
+
+    def write_manifest(self):
+        # type: () -> str
+        """Write the manifest CSV file for the Python-3 script. Returns the hex-digest of its content."""
+        lines = [csv_line(["name", "hbjson", "sql"])] + [csv_line(row) for row in self.manifest_rows()]
+        data = "\n".join(lines) + "\n"
+        with open(self.manifest_file_path, "w") as fp:
+            fp.write(data)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        """Return True if the component is ready to run."""
+        if not self.calculate_ADORB or not self.hbjson_paths or not self.sql_paths:
+            return False
+        return True
+
+    @perf.instrument
+    def run(self):
+        # type: () -> tuple[str | None, list[str], list[str], list[str]]
+        if not self.ready:
+            # -- Setting '_run' to False stops a calculation running in the background
+            background_jobs.cancel(self.IGH, "ADORB Batch")
+            msg = "Please provide all the required inputs and set '_run' to 'True'."
+            self.IGH.warning(msg)
+            print(msg)
+            return (None, [], [], [])
+
+        if self.run_async and background_jobs.is_running(self.IGH, "ADORB Batch"):
+            self.IGH.remark("The ADORB batch is still running. The inputs are re-checked when it finishes.")
+            return (None, [], [], [])
+
+        if not os.path.isdir(self.batch_folder_path):
+            print("Creating folder: {}".format(self.batch_folder_path))
+            os.makedirs(self.batch_folder_path)
+
+        with perf.phase("write_manifest"):
+            manifest_digest = self.write_manifest()
+        print("Running the ADORB cost calculation for {} models...".format(len(self.hbjson_paths)))
+
+        def _calculate(_on_output=None):
+            # type: (Callable[[str], None] | None) -> str
+            with perf.phase("calculate"):
+                stdout, _ = run_ADORB_batch(self.manifest_file_path, self.batch_folder_path, self.max_jobs, _on_output)
+            return stdout
+
+        if self.run_async:
+            signature = (manifest_digest, self.batch_folder_path, self.max_jobs)
+            job = background_jobs.submit(self.IGH, "ADORB Batch", signature, _calculate)
+            if not job.done:
+                self.IGH.remark("The ADORB batch is running in the background...")
+                return (None, [], [], [])
+            stdout = job.result()
+        else:
+            stdout = _calculate()
+
+        for line in str(stdout).split("\n"):
+            if "WARNING:" in line:
+                self.IGH.warning(line)
+
+        with perf.phase("read_results"):
+            rows = read_results_table(self.results_file_path)
+        for row in rows:
+            if row["status"] != "ok":
+                self.IGH.warning("'{}' failed: {} (see: {})".format(row["name"], row["error"], row["log"]))
+
+        print("ADORB batch results table output to: {}".format(self.results_file_path))
+        return (
+            self.results_file_path,
+            [row["yearly_csv"] or None for row in rows],
+            [row["cumulative_csv"] or None for row in rows],
+            [row["name"] for row in rows if row["status"] != "ok"],
+        )
@@ -3,13 +3,13 @@
 
 """GH-Component Interface: HB-REVIVE - Calculate ADORB Cost."""
 
-import json
+import gzip
+import hashlib
+import io
 import os
-import sys
-from contextlib import contextmanager
 
 try:
-    from typing import Generator
+    from typing import Any, Callable
 except ImportError:
     pass  # IronPython 2.7
 
@@ -25,33 +25,69 @@ except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
 try:
-    from honeybee_revive_rhino.gh_compo_io.run_subprocess import run_subprocess
+    from honeybee_revive_rhino.gh_compo_io import background_jobs
+    from honeybee_revive_rhino.gh_compo_io.adorb._results_cache import ADORBResultsCache, build_cache_key
+    from honeybee_revive_rhino.gh_compo_io.adorb._revive_extract import (
+        MODEL_FROM_STDIN,
+        revive_extract_json_bytes,
+        write_revive_extract_json,
+    )
+    from honeybee_revive_rhino.gh_compo_io.run_subprocess import (
+        DEFAULT_JOB_TIMEOUT,
+        PY3_SCRIPTS_DIR,
+        job_timeout,
+        run_subprocess_in_worker,
+    )
 except ImportError as e:
-    raise ImportError("\nFailed to import run_subprocess:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
 
 # -----------------------------------------------------------------------------
 # -- Python-3 ADORB Runner Functions
 
 
+# -- The Python-3 scripts (in 'py3_scripts') which calculate the ADORB costs.
+ADORB_CALCULATOR_SCRIPTS = ("adorb_costs.py", "revive_extract.py", "cambium_factors.py")
+
+
+def ADORB_calculator_script_paths():
+    # type: () -> list[str]
+    """Return the paths to the Python-3 files the ADORB results depend on (their signatures go in the cache-key).
+
+    These are the scripts which calculate the costs, plus ph_adorb's own calculation script (inside
+    Ladybug's Python-3 site-packages). That script is not run, but it changes when ph_adorb is upgraded.
+    """
+    paths = [os.path.join(PY3_SCRIPTS_DIR, name) for name in ADORB_CALCULATOR_SCRIPTS]
+    paths.append(os.path.join(hb_folders.python_package_path, "ph_adorb", "run", "calc_HBJSON_ADORB_costs.py"))
+    return paths
+
+
 def run_ADORB_calculator(
     _hbjson_filepath,
     _sql_path,
     _yearly_results_file_path,
     _cumulative_results_file_path,
     _tables_folder_path,
+    _on_output=None,
+    _model_data=None,
+    _timeout=DEFAULT_JOB_TIMEOUT,
     *args,
     **kwargs
 ):
-    # type: (str, str, str, str, str, list, dict) -> tuple[bytes, bytes, str, str, str]
+    # type: (str | None, str, str, str, str, Callable[[str], None] | None, bytes | None, float | None, list, dict) -> tuple[bytes, bytes, str, str, str]
     """Using Ladybug's Python-3 interpreter: read in a HBJSON model file and calculate the ADORB costs.
 
     ### Arguments:
-        * _hbjson_filepath: File path to the HBJSON model file to calculate ADORB for.
+        * _hbjson_filepath: File path to the HBJSON model file to calculate ADORB for. (ignored if `_model_data` is given)
         * _sql_path: The path to the EnergyPlus SQL file to use for the calculation.
         * _yearly_results_file_path: The ADORB Results CSV file path.
         * _cumulative_results_file_path: The ADORB Results CSV file path.
         * _tables_folder_path: The folder path to save the tables to.
+        * _on_output: Optional, called with each line the calculation prints, while it runs.
+        * _model_data: Optional, the model data (JSON, may be gzip-compressed) to send over the job's
+            stdin instead of reading it from a file.
+        * _timeout: Optional, the most seconds the calculation may run for (None for no limit).
         * args: Additional arguments to pass to the subprocess. (ignored)
         * kwargs: Additional keyword arguments to pass to the subprocess. (ignored)
 
@@ -65,27 +101,33 @@ def run_ADORB_calculator(
     """
 
     # -- Specify the path to the actual subprocess python-3 script to run
-    py3_script_filepath = os.path.join(hb_folders.python_package_path, "ph_adorb", "run", "calc_HBJSON_ADORB_costs.py")
+    py3_script_filepath = os.path.join(PY3_SCRIPTS_DIR, "adorb_costs.py")
 
     # -- check the file paths
-    assert os.path.isfile(_hbjson_filepath), "No HBJSON file found at {}.".format(_hbjson_filepath)
+    if _model_data is None:
+        assert os.path.isfile(_hbjson_filepath), "No HBJSON file found at {}.".format(_hbjson_filepath)
     assert os.path.isfile(py3_script_filepath), "No Python file to run found at: {}".format(py3_script_filepath)
 
     # -------------------------------------------------------------------------
     # -- Read in the HBJSON, convert to WUFI XML
     print("Using Python-3 interpreter: '{}'".format(hb_folders.python_exe_path))
     print("Running Python-3 script: '{}'".format(py3_script_filepath))
-    print("With the HBJSON file: '{}'".format(_hbjson_filepath))
+    if _model_data is None:
+        model_arg = _hbjson_filepath
+        print("With the HBJSON file: '{}'".format(_hbjson_filepath))
+    else:
+        model_arg = MODEL_FROM_STDIN
+        print("With the model data sent over stdin ({:,} bytes)".format(len(_model_data)))
     commands = [
         hb_folders.python_exe_path,  # --- The interpreter to use
         py3_script_filepath,  # ---------- The script to run
-        _hbjson_filepath,  # ------------- The HBJSON file to read in
+        model_arg,  # -------------------- The revive-extract file to read in (or '-' for stdin)
         _sql_path,  # -------------------- The SQL file to use for the calculation
         _yearly_results_file_path,  # ---- The Yearly CSV file path to save the results to
         _cumulative_results_file_path,  # - The Cumulative CSV file path to save the results to
         _tables_folder_path,  # ---------- The folder path to save the tables to
     ]
-    stdout, stderr = run_subprocess(commands)
+    stdout, stderr = run_subprocess_in_worker(commands, _on_output, _model_data, _timeout)
 
     # -------------------------------------------------------------------------
     # -- return the dir and filename of the xml created
@@ -93,82 +135,59 @@ def run_ADORB_calculator(
 
 
 # -----------------------------------------------------------------------------
-# -- Utility Functions to create HBJSON file from Model
+# -- Utility Functions to write the Model's 'revive extract' file
 
 
-def _using_python_2():
-    # type: () -> bool
-    """Utility function: Returns True if the current Python interpreter is Python 2."""
-    return sys.version_info < (3, 0)
+def write_revive_extract_file(_hb_model, _output_file_path, _hasher=None):
+    # type: (Model, str, Any) -> str
+    """Write out the HB Model's 'revive extract' to a JSON file.
 
-
-def write_hb_model_to_json_file(_hb_model, _sql_path, _hbjson_output_file_path):
-    # type: (Model, str, str) -> str
-    """Write out a HB Model to a JSON file.
-
-    Adapted from the Grasshopper "Honeybee - HB Dump Objects" Component
+    Only the data used by the ADORB calculation is written (see `_revive_extract.py`), not the full HBJSON.
 
     ### Arguments:
         * _hb_model: The Honeybee Model to write to a JSON file.
-        * _sql_path: The path to the EnergyPlus SQL file to use for the calculation.
-        * _hbjson_output_file_path: The full file path to write the JSON file to.
+        * _output_file_path: The full file path to write the JSON file to.
+        * _hasher: Optional, a hashlib object to update with the JSON written (for the cache key).
     ### Returns:
         * str: The full file path to the JSON file written.
     """
-    # -- Remove the HBJSON file if it already exists
+    # -- Remove the file if it already exists
     try:
-        if os.path.isfile(_hbjson_output_file_path):
-            os.remove(_hbjson_output_file_path)
+        if os.path.isfile(_output_file_path):
+            os.remove(_output_file_path)
     except Exception as e:
-        raise Exception("Failed to remove an existing json file at:'{}'\n\t{}".format(_hbjson_output_file_path, e))
-
-    # -- Create the dictionary to be written to a JSON file
-    obj_dict = _hb_model.to_dict()
-
-    # -- Write the Model dictionary to a JSON file
-    print("Writing HB-Model out to JSON file: {}".format(_hbjson_output_file_path))
-    if _using_python_2():
-        # -- We need to manually encode it as UTF-8
-        with open(_hbjson_output_file_path, "wb") as fp:
-            obj_str = json.dumps(obj_dict, ensure_ascii=False)
-            fp.write(obj_str.encode("utf-8"))
-    else:
-        with open(_hbjson_output_file_path, "w", encoding="utf-8") as fp:
-            obj_str = json.dump(obj_dict, fp, ensure_ascii=False)
+        raise Exception("Failed to remove an existing json file at:'{}'\n\t{}".format(_output_file_path, e))
 
-    return _hbjson_output_file_path
+    print("Writing the HB-Model's REVIVE data out to JSON file: {}".format(_output_file_path))
+    return write_revive_extract_json(_hb_model, _output_file_path, _hasher)
 
 
-@contextmanager
-def model_as_json_file(_hb_model, _sql_path, _hbjson_output_file_path, _DEBUG=False):
-    # type: (Model, str, str, bool) -> Generator[str, None, None]
-    """Create a temporary JSON file for a HB Model. Removes the file at the end of use.
+def gzip_bytes(_data):
+    # type: (bytes) -> bytes
+    """Return the data gzip-compressed (with a fixed timestamp, so the same data always gives the same bytes)."""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz:
+        gz.write(_data)
+    return buffer.getvalue()
 
-    ### Usage:
-    >>> with model_as_json_file(honeybee_model_object) as hb_json_filepath:
-    >>>    # do something with the file
+
+def remove_json_file(_hbjson_file_path, _DEBUG=False):
+    # type: (str | None, bool) -> None
+    """Remove the temporary HBJSON file once it has been used.
 
     ### Arguments:
-        * _hb_model: The Honeybee Model to write to a JSON file.
-        * _sql_path: The path to the EnergyPlus SQL file to use for the calculation.
-        * _hbjson_output_file_path: The full file path to write the JSON file to.
-    ### Yields:
-        * str: The full file path to the JSON file written.
+        * _hbjson_file_path: The full file path of the JSON file (or None if no file was written).
+        * _DEBUG: Set True to keep the JSON file.
     """
+    if _DEBUG:
+        # Don't delete the file if we are debugging
+        return
 
-    try:
-        hb_json_file = write_hb_model_to_json_file(_hb_model, _sql_path, _hbjson_output_file_path)
-        yield hb_json_file
-    finally:
-        if _DEBUG:
-            # Don't delete the file if we are debugging
-            return
-
-        if not os.path.isfile(hb_json_file):
-            return
+    if not _hbjson_file_path or not os.path.isfile(_hbjson_file_path):
+        return
 
-        print("Removing temporary JSON file: {}".format(hb_json_file))
-        os.remove(hb_json_file)
+    print("Removing temporary JSON file: {}".format(_hbjson_file_path))
+    os.remove(_hbjson_file_path)
 
 
 # -----------------------------------------------------------------------------
@@ -178,10 +197,27 @@ def model_as_json_file(_hb_model, _sql_path, _hbjson_output_file_path, _DEBUG=Fa
 class GHCompo_CalculateADORBCost(object):
     """GHCompo Interface: HB-REVIVE - Calculate ADORB Costs."""
 
+    # -- Send the model data to the ADORB job over its stdin (gzip-compressed), rather than
+    # -- through a temporary file. With _DEBUG on, the file is always written (and kept).
+    PIPE_MODEL_DATA = True
+    COMPRESS_MODEL_DATA = True
+
     def __init__(
-        self, _DEBUG, _IGH, _save_file_name, _save_dir, _sql_path, _hb_model, _calculate_ADORB, *args, **kwargs
+        self,
+        _DEBUG,
+        _IGH,
+        _save_file_name,
+        _save_dir,
+        _sql_path,
+        _hb_model,
+        _calculate_ADORB,
+        _reset_cache=False,
+        _run_async=False,
+        _timeout=None,
+        *args,
+        **kwargs
     ):
-        # type: (bool, gh_io.IGH, str, str, str, Model, bool, list, dict) -> None
+        # type: (bool, gh_io.IGH, str, str, str, Model, bool, bool, bool, float | None, list, dict) -> None
         self.DEBUG = _DEBUG
         self.IGH = _IGH
         self._save_filename = _save_file_name
@@ -189,6 +225,10 @@ class GHCompo_CalculateADORBCost(object):
         self.sql_path = _sql_path
         self.hb_model = _hb_model
         self.calculate_ADORB = _calculate_ADORB
+        self.reset_cache = _reset_cache or False
+        self.run_async = _run_async or False
+        self.timeout = job_timeout(_timeout)
+        self.cache = ADORBResultsCache(os.path.join(hb_folders.default_simulation_folder, "REVIVE", "_ADORB_cache"))
 
     def give_user_warnings(self, _stdout):
         # type: (bytes) -> None
@@ -226,10 +266,33 @@ class GHCompo_CalculateADORBCost(object):
         return os.path.join(self.save_dir, "{}_tables".format(self.save_filename))
 
     @property
-    def hbjson_output_file_path(self):
+    def revive_extract_file_path(self):
         # type: () -> str
-        """Return the full output HBJSON file path."""
-        return os.path.join(self.save_dir, "{}.hbjson".format(self.save_filename))
+        """Return the full path of the model-data file passed to the ADORB calculation."""
+        return os.path.join(self.save_dir, "{}_revive_extract.json".format(self.save_filename))
+
+    def prepare_model_data(self):
+        # type: () -> tuple[str | None, bytes | None, str]
+        """Return the model data for the ADORB calculation: written to a file, or held in memory to send over stdin.
+
+        Only the model data used by the ADORB calculation is included (no geometry, see `_revive_extract.py`).
+
+        ### Returns:
+            * tuple
+                - [0] (str | None): The path to the file written, or None if the data is to be piped.
+                - [1] (bytes | None): The data to send over the job's stdin, or None if a file was written.
+                - [2] (str): The hex-digest of the (uncompressed) model data, for the results-cache key.
+        """
+        if self.DEBUG or not self.PIPE_MODEL_DATA:
+            hasher = hashlib.sha256()
+            file_path = write_revive_extract_file(self.hb_model, self.revive_extract_file_path, hasher)
+            return file_path, None, hasher.hexdigest()
+
+        data = revive_extract_json_bytes(self.hb_model)
+        digest = hashlib.sha256(data).hexdigest()
+        if self.COMPRESS_MODEL_DATA:
+            data = gzip_bytes(data)
+        return None, data, digest
 
     @property
     def ready(self):
@@ -239,32 +302,82 @@ class GHCompo_CalculateADORBCost(object):
             return False
         return True
 
+    @perf.instrument
     def run(self):
         # type: () -> tuple[str | None, str | None, str | None]
+        if self.reset_cache:
+            self.cache.clear()
+
         if not self.ready:
+            # -- Setting '_run' to False stops a calculation running in the background
+            background_jobs.cancel(self.IGH, "ADORB")
             msg = "Please provide all the required inputs and set '_run' to 'True'."
             self.IGH.warning(msg)
             print(msg)
             return (None, None, None)
 
-        print("Running ADORB cost calculation...")
         if not os.path.isdir(self.save_dir):
             print("Creating folder: {}".format(self.save_dir))
             os.makedirs(self.save_dir)
 
-        with model_as_json_file(
-            self.hb_model, self.sql_path, self.hbjson_output_file_path, self.DEBUG
-        ) as hb_json_filepath:
-            stdout, stderr, yearly_csv_file_path, cumulative_csv_file_path, tables_folder_path = run_ADORB_calculator(
-                _hbjson_filepath=hb_json_filepath,
-                _sql_path=self.sql_path,
-                _yearly_results_file_path=self.yearly_csv_file_path,
-                _cumulative_results_file_path=self.cumulative_csv_file_path,
-                _tables_folder_path=self.tables_folder_path,
+        if self.run_async and background_jobs.is_running(self.IGH, "ADORB"):
+            self.IGH.remark("The ADORB calculation is still running. The inputs are re-checked when it finishes.")
+            return (None, None, None)
+
+        with perf.phase("prepare_model_data"):
+            hbjson_file_path, model_data, model_digest = self.prepare_model_data()
+
+        # -- If the model and SQL are unchanged since a previous run, just re-use those results.
+        with perf.phase("cache_get"):
+            cache_key = build_cache_key(model_digest, self.sql_path, ADORB_calculator_script_paths())
+            cached_stdout = self.cache.get(
+                cache_key, self.yearly_csv_file_path, self.cumulative_csv_file_path, self.tables_folder_path
             )
-            self.give_user_warnings(stdout)
-            print("ADORB yearly costs output to: {}".format(self.yearly_csv_file_path))
-            print("ADORB cumulative costs output to: {}".format(self.cumulative_csv_file_path))
-            print("ADORB tables output to: {}".format(self.tables_folder_path))
+        if cached_stdout is not None:
+            print("Using cached ADORB results (key: {})".format(cache_key))
+            remove_json_file(hbjson_file_path, self.DEBUG)
+            self.give_user_warnings(cached_stdout)
+            return self.yearly_csv_file_path, self.cumulative_csv_file_path, self.tables_folder_path
+
+        print("Running ADORB cost calculation...")
+
+        def _calculate(_on_output=None):
+            # type: (Callable[[str], None] | None) -> tuple[str, str, str, str]
+            try:
+                with perf.phase("calculate"):
+                    stdout, _, yearly_csv_file_path, cumulative_csv_file_path, tables_folder_path = (
+                        run_ADORB_calculator(
+                            _hbjson_filepath=hbjson_file_path,
+                            _sql_path=self.sql_path,
+                            _yearly_results_file_path=self.yearly_csv_file_path,
+                            _cumulative_results_file_path=self.cumulative_csv_file_path,
+                            _tables_folder_path=self.tables_folder_path,
+                            _on_output=_on_output,
+                            _model_data=model_data,
+                            _timeout=self.timeout,
+                        )
+                    )
+            finally:
+                remove_json_file(hbjson_file_path, self.DEBUG)
+            with perf.phase("cache_put"):
+                self.cache.put(cache_key, yearly_csv_file_path, cumulative_csv_file_path, tables_folder_path, stdout)
+            return stdout, yearly_csv_file_path, cumulative_csv_file_path, tables_folder_path
+
+        if self.run_async:
+            signature = (cache_key, self.yearly_csv_file_path, self.cumulative_csv_file_path, self.tables_folder_path)
+            job = background_jobs.submit(self.IGH, "ADORB", signature, _calculate)
+            if not job.done:
+                self.IGH.remark("The ADORB calculation is running in the background...")
+                return (None, None, None)
+            # -- A finished job was handed back: the HBJSON file written above is not needed.
+            remove_json_file(hbjson_file_path, self.DEBUG)
+            stdout, yearly_csv_file_path, cumulative_csv_file_path, tables_folder_path = job.result()
+        else:
+            stdout, yearly_csv_file_path, cumulative_csv_file_path, tables_folder_path = _calculate()
+
+        self.give_user_warnings(stdout)
+        print("ADORB yearly costs output to: {}".format(yearly_csv_file_path))
+        print("ADORB cumulative costs output to: {}".format(cumulative_csv_file_path))
+        print("ADORB tables output to: {}".format(tables_folder_path))
 
         return yearly_csv_file_path, cumulative_csv_file_path, tables_folder_path
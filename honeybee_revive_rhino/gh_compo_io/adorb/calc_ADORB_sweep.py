@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GH-Component Interface: HB-REVIVE - Calculate ADORB Sweep."""
+
+import hashlib
+import json
+import os
+
+try:
+    from typing import Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders
+    from honeybee.model import Model
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io import background_jobs
+    from honeybee_revive_rhino.gh_compo_io.adorb._revive_extract import (
+        MODEL_FROM_STDIN,
+        revive_extract_json_bytes,
+        write_revive_extract_json,
+    )
+    from honeybee_revive_rhino.gh_compo_io.adorb.calc_ADORB_costs import gzip_bytes
+    from honeybee_revive_rhino.gh_compo_io.run_subprocess import PY3_SCRIPTS_DIR, run_subprocess_in_worker
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+from honeybee_revive_rhino.gh_compo_io import perf
+
+
+def variant_dict(_name, _variant_model):
+    # type: (str, Model) -> dict
+    """Return the sweep-variant dict: the variant's name and its REVIVE model properties (nothing else is used)."""
+    return {"name": _name, "properties": _variant_model.properties.revive.to_dict()}
+
+
+def run_ADORB_sweep(_model_arg, _sql_path, _variants_file_path, _output_folder, _on_output=None, _model_data=None):
+    # type: (str, str, str, str, Callable[[str], None] | None, bytes | None) -> tuple[str, str]
+    """Using Ladybug's Python-3 interpreter: calculate the ADORB costs for each variant in the variants file.
+
+    ### Arguments:
+        * _model_arg: The path to the revive-extract file, or '-' if the `_model_data` is sent over stdin.
+        * _sql_path: The path to the EnergyPlus SQL file to use for the calculation.
+        * _variants_file_path: The path to the variants JSON file.
+        * _output_folder: The folder to write each variant's CSV files to.
+        * _on_output: Optional, called with each line the calculation prints, while it runs.
+        * _model_data: Optional, the model data to send over the job's stdin.
+
+    ### Returns:
+        * tuple
+            - [0] (str): The stdout from the subprocess.
+            - [1] (str): The stderr from the subprocess.
+    """
+    py3_script_filepath = os.path.join(PY3_SCRIPTS_DIR, "adorb_sweep.py")
+    assert os.path.isfile(py3_script_filepath), "No Python file to run found at: {}".format(py3_script_filepath)
+
+    print("Using Python-3 interpreter: '{}'".format(hb_folders.python_exe_path))
+    print("Running Python-3 script: '{}'".format(py3_script_filepath))
+    commands = [
+        hb_folders.python_exe_path,  # --- The interpreter to use
+        py3_script_filepath,  # ---------- The script to run
+        _model_arg,  # ------------------- The revive-extract file to read in (or '-' for stdin)
+        _sql_path,  # -------------------- The SQL file to use for the calculation
+        _variants_file_path,  # ---------- The variants to calculate
+        _output_folder,  # --------------- The folder to save the CSV files to
+    ]
+    return run_subprocess_in_worker(commands, _on_output, _model_data)
+
+
+# -----------------------------------------------------------------------------
+# -- Grasshopper Interface
+
+
+class GHCompo_CalculateADORBSweep(object):
+    """GHCompo Interface: HB-REVIVE - Calculate ADORB Sweep."""
+
+    def __init__(
+        self,
+        _DEBUG,
+        _IGH,
+        _save_file_name,
+        _save_dir,
+        _sql_path,
+        _hb_model,
+        _variant_models,
+        _variant_names,
+        _calculate_ADORB,
+        _run_async=False,
+        *args,
+        **kwargs
+    ):
+        # type: (bool, gh_io.IGH, str, str, str, Model, list[Model], list[str], bool, bool, list, dict) -> None
+        self.DEBUG = _DEBUG
+        self.IGH = _IGH
+        self._save_filename = _save_file_name
+        self.save_dir = _save_dir or os.path.join(hb_folders.default_simulation_folder, "REVIVE")
+        self.sql_path = _sql_path
+        self.hb_model = _hb_model
+        self.variant_models = [m for m in (_variant_models or []) if m]
+        self._variant_names = _variant_names or []
+        self.calculate_ADORB = _calculate_ADORB
+        self.run_async = _run_async or False
+
+    @property
+    def save_filename(self):
+        # type: () -> str
+        """Return the base output name."""
+        if self._save_filename:
+            return self._save_filename
+        else:
+            if self.hb_model.display_name:
+                return self.hb_model.display_name
+            else:
+                return "unnamed"
+
+    @property
+    def sweep_folder_path(self):
+        # type: () -> str
+        """Return the folder the variants file and every variant's CSV files are written to."""
+        return os.path.join(self.save_dir, "{}_sweep".format(self.save_filename))
+
+    @property
+    def variant_names(self):
+        # type: () -> list[str]
+        """Return the name of each variant: the one given, or '<save-name>_<number>'."""
+        names = []
+        for i, _ in enumerate(self.variant_models):
+            try:
+                name = self._variant_names[i]
+            except IndexError:
+                name = None
+            names.append(name or "{}_{:02d}".format(self.save_filename, i + 1))
+
+        if len(set(names)) != len(names):
+            raise ValueError("Each ADORB sweep variant needs a unique name. Got: {}".format(names))
+        return names
+
+    def csv_file_paths(self, _names):
+        # type: (list[str]) -> tuple[list[str], list[str]]
+        """Return the yearly and the cumulative CSV file path of each variant."""
+        yearly = [os.path.join(self.sweep_folder_path, "{}_yearly.csv".format(n)) for n in _names]
+        cumulative = [os.path.join(self.sweep_folder_path, "{}_cumulative.csv".format(n)) for n in _names]
+        return yearly, cumulative
+
+    def write_variants_file(self, _names):
+        # type: (list[str]) -> tuple[str, str]
+        """Write the variants JSON file for the Python-3 script.
+
+        ### Returns:
+            * tuple
+                - [0] (str): The path to the variants file.
+                - [1] (str): The hex-digest of the variants file's content.
+        """
+        variants_file_path = os.path.join(self.sweep_folder_path, "variants.json")
+        variants = [variant_dict(n, m) for n, m in zip(_names, self.variant_models)]
+        data = json.dumps(variants, sort_keys=True)
+        with open(variants_file_path, "w") as fp:
+            fp.write(data)
+        return variants_file_path, hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def prepare_model_data(self):
+        # type: () -> tuple[str, bytes | None]
+        """Return the model argument for the Python-3 script, and the data to send over stdin (if any).
+
+        With _DEBUG on, the revive-extract file is written (and kept) instead of piped.
+        """
+        if self.DEBUG:
+            file_path = os.path.join(self.sweep_folder_path, "{}_revive_extract.json".format(self.save_filename))
+            return write_revive_extract_json(self.hb_model, file_path), None
+        return MODEL_FROM_STDIN, gzip_bytes(revive_extract_json_bytes(self.hb_model))
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        """Return True if the component is ready to run."""
+        if not self.calculate_ADORB or not self.hb_model or not self.sql_path or not self.variant_models:
+            return False
+        return True
+
+    @perf.instrument
+    def run(self):
+        # type: () -> tuple[list[str], list[str], list[str]]
+        if not self.ready:
+            # -- Setting '_run' to False stops a calculation running in the background
+            background_jobs.cancel(self.IGH, "ADORB Sweep")
+            msg = "Please provide all the required inputs (including at least one variant) and set '_run' to 'True'."
+            self.IGH.warning(msg)
+            print(msg)
+            return ([], [], [])
+
+        if self.run_async and background_jobs.is_running(self.IGH, "ADORB Sweep"):
+            self.IGH.remark("The ADORB sweep is still running. The inputs are re-checked when it finishes.")
+            return ([], [], [])
+
+        if not os.path.isdir(self.sweep_folder_path):
+            print("Creating folder: {}".format(self.sweep_folder_path))
+            os.makedirs(self.sweep_folder_path)
+
+        names = self.variant_names
+        yearly_csv_file_paths, cumulative_csv_file_paths = self.csv_file_paths(names)
+        with perf.phase("write_variants"):
+            variants_file_path, variants_digest = self.write_variants_file(names)
+        with perf.phase("prepare_model_data"):
+            model_arg, model_data = self.prepare_model_data()
+
+        print("Running the ADORB cost calculation for {} variants...".format(len(names)))
+
+        def _calculate(_on_output=None):
+            # type: (Callable[[str], None] | None) -> str
+            with perf.phase("calculate"):
+                stdout, _ = run_ADORB_sweep(
+                    model_arg, self.sql_path, variants_file_path, self.sweep_folder_path, _on_output, model_data
+                )
+            return stdout
+
+        if self.run_async:
+            model_digest = hashlib.sha256(model_data).hexdigest() if model_data else model_arg
+            signature = (variants_digest, model_digest, self.sql_path, self.sweep_folder_path)
+            job = background_jobs.submit(self.IGH, "ADORB Sweep", signature, _calculate)
+            if not job.done:
+                self.IGH.remark("The ADORB sweep is running in the background...")
+                return ([], [], [])
+            stdout = job.result()
+        else:
+            stdout = _calculate()
+
+        for line in str(stdout).split("\n"):
+            if "WARNING:" in line:
+                self.IGH.warning(line)
+
+        print("ADORB sweep results output to: {}".format(self.sweep_folder_path))
+        return names, yearly_csv_file_paths, cumulative_csv_file_paths
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GH-Component Interface: HB-REVIVE - Calculate ADORB Uncertainty."""
+
+import hashlib
+import json
+import os
+import re
+
+try:
+    from typing import Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders
+    from honeybee.model import Model
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io import background_jobs
+    from honeybee_revive_rhino.gh_compo_io.adorb._revive_extract import (
+        MODEL_FROM_STDIN,
+        revive_extract_json_bytes,
+        write_revive_extract_json,
+    )
+    from honeybee_revive_rhino.gh_compo_io.adorb.calc_ADORB_costs import gzip_bytes
+    from honeybee_revive_rhino.gh_compo_io.run_subprocess import PY3_SCRIPTS_DIR, run_subprocess_in_worker
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+from honeybee_revive_rhino.gh_compo_io import perf
+
+# -- {distribution type: the names of its arguments, in order}
+DISTRIBUTION_ARGS = {
+    "fixed": ("value",),
+    "normal": ("mean", "sd"),
+    "uniform": ("low", "high"),
+    "triangular": ("low", "mode", "high"),
+}
+
+
+def parse_distribution(_text):
+    # type: (str | float | None) -> dict | None
+    """Return the distribution dict for a user input like 'normal(1.0, 0.1)', or a single number (fixed).
+
+    ### Arguments:
+        * _text: 'fixed(v)', 'normal(mean, sd)', 'uniform(low, high)', 'triangular(low, mode, high)'
+            or a single number. None or an empty string returns None (the model's own value is used).
+    ### Returns:
+        * dict | None: ie: {"type": "normal", "mean": 1.0, "sd": 0.1}
+    """
+    if _text is None or str(_text).strip() == "":
+        return None
+
+    text = str(_text).strip().lower()
+    try:
+        return {"type": "fixed", "value": float(text)}
+    except ValueError:
+        pass
+
+    match = re.match(r"^(\w+)\s*\((.*)\)$", text)
+    if not match or match.group(1) not in DISTRIBUTION_ARGS:
+        raise ValueError(
+            "Cannot read the distribution: '{}'. Use one of: {}".format(
+                _text, ", ".join("{}({})".format(k, ", ".join(v)) for k, v in sorted(DISTRIBUTION_ARGS.items()))
+            )
+        )
+
+    kind, arg_names = match.group(1), DISTRIBUTION_ARGS[match.group(1)]
+    values = [float(v) for v in match.group(2).split(",") if v.strip()]
+    if len(values) != len(arg_names):
+        raise ValueError("A '{}' distribution needs: ({}). Got: '{}'".format(kind, ", ".join(arg_names), _text))
+
+    distribution = {"type": kind}
+    distribution.update(zip(arg_names, values))
+    return distribution
+
+
+def run_ADORB_monte_carlo(
+    _model_arg,
+    _sql_path,
+    _settings_file_path,
+    _yearly_csv_path,
+    _cumulative_csv_path,
+    _on_output=None,
+    _model_data=None,
+):
+    # type: (str, str, str, str, str, Callable[[str], None] | None, bytes | None) -> tuple[str, str]
+    """Using Ladybug's Python-3 interpreter: calculate the percentile bands of the model's ADORB costs.
+
+    ### Arguments:
+        * _model_arg: The path to the revive-extract file, or '-' if the `_model_data` is sent over stdin.
+        * _sql_path: The path to the EnergyPlus SQL file to use for the calculation.
+        * _settings_file_path: The path to the Monte Carlo settings JSON file.
+        * _yearly_csv_path: The output yearly percentiles CSV file path.
+        * _cumulative_csv_path: The output cumulative percentiles CSV file path.
+        * _on_output: Optional, called with each line the calculation prints, while it runs.
+        * _model_data: Optional, the model data to send over the job's stdin.
+
+    ### Returns:
+        * tuple
+            - [0] (str): The stdout from the subprocess.
+            - [1] (str): The stderr from the subprocess.
+    """
+    py3_script_filepath = os.path.join(PY3_SCRIPTS_DIR, "adorb_monte_carlo.py")
+    assert os.path.isfile(py3_script_filepath), "No Python file to run found at: {}".format(py3_script_filepath)
+
+    print("Using Python-3 interpreter: '{}'".format(hb_folders.python_exe_path))
+    print("Running Python-3 script: '{}'".format(py3_script_filepath))
+    commands = [
+        hb_folders.python_exe_path,  # --- The interpreter to use
+        py3_script_filepath,  # ---------- The script to run
+        _model_arg,  # ------------------- The revive-extract file to read in (or '-' for stdin)
+        _sql_path,  # -------------------- The SQL file to use for the calculation
+        _settings_file_path,  # ---------- The samples / distributions to use
+        _yearly_csv_path,  # ------------- The Yearly percentiles CSV file path
+        _cumulative_csv_path,  # --------- The Cumulative percentiles CSV file path
+    ]
+    return run_subprocess_in_worker(commands, _on_output, _model_data)
+
+
+# -----------------------------------------------------------------------------
+# -- Grasshopper Interface
+
+
+class GHCompo_CalculateADORBUncertainty(object):
+    """GHCompo Interface: HB-REVIVE - Calculate ADORB Uncertainty."""
+
+    DEFAULT_SAMPLES = 1000
+    DEFAULT_PERCENTILES = [5.0, 50.0, 95.0]
+
+    def __init__(
+        self,
+        _DEBUG,
+        _IGH,
+        _save_file_name,
+        _save_dir,
+        _sql_path,
+        _hb_model,
+        _electricity_price,
+        _gas_price,
+        _fuel_price_escalation,
+        _grid_emissions,
+        _national_emissions,
+        _construction_cost,
+        _samples,
+        _seed,
+        _percentiles,
+        _calculate_ADORB,
+        _run_async=False,
+        *args,
+        **kwargs
+    ):
+        # type: (bool, gh_io.IGH, str, str, str, Model, str, str, str, str, str, str, int, int, list[float], bool, bool, list, dict) -> None
+        self.DEBUG = _DEBUG
+        self.IGH = _IGH
+        self._save_filename = _save_file_name
+        self.save_dir = _save_dir or os.path.join(hb_folders.default_simulation_folder, "REVIVE")
+        self.sql_path = _sql_path
+        self.hb_model = _hb_model
+        self.distribution_inputs = {
+            "electricity_price": _electricity_price,
+            "gas_price": _gas_price,
+            "fuel_price_escalation": _fuel_price_escalation,
+            "grid_emissions": _grid_emissions,
+            "national_emissions": _national_emissions,
+            "construction_cost": _construction_cost,
+        }
+        self.samples = int(_samples or self.DEFAULT_SAMPLES)
+        self.seed = _seed
+        self.percentiles = [float(p) for p in _percentiles or []] or self.DEFAULT_PERCENTILES
+        self.calculate_ADORB = _calculate_ADORB
+        self.run_async = _run_async or False
+
+    @property
+    def save_filename(self):
+        # type: () -> str
+        """Return the output filename (without extension)."""
+        if self._save_filename:
+            return self._save_filename
+        else:
+            if self.hb_model.display_name:
+                return self.hb_model.display_name
+            else:
+                return "unnamed"
+
+    @property
+    def yearly_csv_file_path(self):
+        # type: () -> str
+        return os.path.join(self.save_dir, "{}_yearly_percentiles.csv".format(self.save_filename))
+
+    @property
+    def cumulative_csv_file_path(self):
+        # type: () -> str
+        return os.path.join(self.save_dir, "{}_cumulative_percentiles.csv".format(self.save_filename))
+
+    @property
+    def settings_file_path(self):
+        # type: () -> str
+        return os.path.join(self.save_dir, "{}_monte_carlo.json".format(self.save_filename))
+
+    def settings(self):
+        # type: () -> dict
+        """Return the Monte Carlo settings for the Python-3 script."""
+        for p in self.percentiles:
+            if not 0 <= p <= 100:
+                raise ValueError("The percentiles must be between 0 and 100. Got: {}".format(p))
+        if self.samples < 1:
+            raise ValueError("The number of samples must be 1 or more. Got: {}".format(self.samples))
+
+        distributions = {}
+        for name, text in self.distribution_inputs.items():
+            distribution = parse_distribution(text)
+            if distribution:
+                distributions[name] = distribution
+
+        return {
+            "samples": self.samples,
+            "seed": int(self.seed) if self.seed is not None else None,
+            "percentiles": self.percentiles,
+            "distributions": distributions,
+        }
+
+    def write_settings_file(self):
+        # type: () -> tuple[str, str]
+        """Write the settings JSON file. Returns its path and the hex-digest of its content."""
+        data = json.dumps(self.settings(), sort_keys=True)
+        with open(self.settings_file_path, "w") as fp:
+            fp.write(data)
+        return self.settings_file_path, hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def prepare_model_data(self):
+        # type: () -> tuple[str, bytes | None]
+        """Return the model argument for the Python-3 script, and the data to send over stdin (if any).
+
+        With _DEBUG on, the revive-extract file is written (and kept) instead of piped.
+        """
+        if self.DEBUG:
+            file_path = os.path.join(self.save_dir, "{}_revive_extract.json".format(self.save_filename))
+            return write_revive_extract_json(self.hb_model, file_path), None
+        return MODEL_FROM_STDIN, gzip_bytes(revive_extract_json_bytes(self.hb_model))
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        """Return True if the component is ready to run."""
+        if not self.calculate_ADORB or not self.hb_model or not self.sql_path:
+            return False
+        return True
+
+    @perf.instrument
+    def run(self):
+        # type: () -> tuple[str | None, str | None]
+        if not self.ready:
+            # -- Setting '_run' to False stops a calculation running in the background
+            background_jobs.cancel(self.IGH, "ADORB Monte Carlo")
+            msg = "Please provide all the required inputs and set '_run' to 'True'."
+            self.IGH.warning(msg)
+            print(msg)
+            return (None, None)
+
+        if self.run_async and background_jobs.is_running(self.IGH, "ADORB Monte Carlo"):
+            self.IGH.remark("The ADORB Monte Carlo is still running. The inputs are re-checked when it finishes.")
+            return (None, None)
+
+        if not os.path.isdir(self.save_dir):
+            print("Creating folder: {}".format(self.save_dir))
+            os.makedirs(self.save_dir)
+
+        with perf.phase("write_settings"):
+            settings_file_path, settings_digest = self.write_settings_file()
+        with perf.phase("prepare_model_data"):
+            model_arg, model_data = self.prepare_model_data()
+
+        print("Running the ADORB Monte Carlo with {:,} samples...".format(self.samples))
+
+        def _calculate(_on_output=None):
+            # type: (Callable[[str], None] | None) -> str
+            with perf.phase("calculate"):
+                stdout, _ = run_ADORB_monte_carlo(
+                    model_arg,
+                    self.sql_path,
+                    settings_file_path,
+                    self.yearly_csv_file_path,
+                    self.cumulative_csv_file_path,
+                    _on_output,
+                    model_data,
+                )
+            return stdout
+
+        if self.run_async:
+            model_digest = hashlib.sha256(model_data).hexdigest() if model_data else model_arg
+            signature = (settings_digest, model_digest, self.sql_path, self.yearly_csv_file_path)
+            job = background_jobs.submit(self.IGH, "ADORB Monte Carlo", signature, _calculate)
+            if not job.done:
+                self.IGH.remark("The ADORB Monte Carlo is running in the background...")
+                return (None, None)
+            stdout = job.result()
+        else:
+            stdout = _calculate()
+
+        for line in str(stdout).split("\n"):
+            if "WARNING:" in line:
+                self.IGH.warning(line)
+
+        print("ADORB yearly percentiles output to: {}".format(self.yearly_csv_file_path))
+        print("ADORB cumulative percentiles output to: {}".format(self.cumulative_csv_file_path))
+        return self.yearly_csv_file_path, self.cumulative_csv_file_path
@@ -14,6 +14,7 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
 
 # -----------------------------------------------------------------------------
 # -- Grasshopper Interface
@@ -46,6 +47,7 @@ class GHCompo_CreateADORBFuelType(object):
         self.sales_price_per_kWH = _sales_price_per_kWH
         self.annual_base_cost = _annual_base_cost or 0.0
 
+    @perf.instrument
     def run(self):
         # type: () -> Fuel
         return Fuel(
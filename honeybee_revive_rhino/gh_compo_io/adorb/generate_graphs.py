@@ -16,9 +16,11 @@ except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
 try:
-    from honeybee_revive_rhino.gh_compo_io.run_subprocess import run_subprocess
+    from honeybee_revive_rhino.gh_compo_io.run_subprocess import run_subprocess_in_worker
 except ImportError as e:
-    raise ImportError("\nFailed to import run_subprocess:\n\t{}".format(e))
+    raise ImportError("\nFailed to import run_subprocess_in_worker:\n\t{}".format(e))
+
+from honeybee_revive_rhino.gh_compo_io import perf
 
 # -----------------------------------------------------------------------------
 # -- Python-3 ADORB Runner Functions
@@ -61,7 +63,7 @@ def run_ADORB_grapher(_csv_filepath, _output_file_path, *args, **kwargs):
         _csv_filepath,  # --------------- The CSV file to graph
         _output_file_path,  # ----------- The filename of the graph output
     ]
-    stdout, stderr = run_subprocess(commands)
+    stdout, stderr = run_subprocess_in_worker(commands)
 
     # -------------------------------------------------------------------------
     # -- return the dir and filename of the xml created
@@ -113,6 +115,7 @@ class GHCompo_GenerateADORBGraphs(object):
         filename_without_ext = os.path.splitext(os.path.basename(self.csv))[0]
         return os.path.join(self.save_dir, "{}.html".format(filename_without_ext))
 
+    @perf.instrument
     def run(self):
         if not self.ready:
             return None
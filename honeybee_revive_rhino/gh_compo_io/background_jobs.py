@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Run long Python-3 jobs on a background thread, so the Grasshopper canvas is not blocked while they run.
+
+Usage (inside a component's `run`):
+
+    job = background_jobs.submit(self.IGH, "ADORB", signature, target)
+    if not job.done:
+        return None  # -- The component is re-computed automatically when the job finishes.
+    result = job.result()
+
+`target` is called on the background thread with a single `_on_output(line)` argument, to pass
+on to `run_subprocess_in_worker` so that the latest line the Python-3 script printed is shown as
+the component's message while it runs (updated at most every `BackgroundJob.MESSAGE_INTERVAL`
+seconds, so a chatty script does not flood Rhino's UI thread). `signature` identifies the
+inputs: a finished job is only handed back to the component if its signature still matches (ie:
+the inputs did not change while it was running), otherwise a new job is started.
+
+A running job is cancelled (and its Python-3 processes killed, see `run_subprocess.py`) by
+`cancel(...)`, which the components call when they are solved with `_run` set to False (or without
+their inputs), or when the component is deleted from the Grasshopper document.
+
+Only the running / finished state lives here (one job per component); the component decides
+what to output while a job is running.
+"""
+
+import threading
+import time
+
+try:
+    from typing import Any, Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    import System  # type: ignore
+    import Rhino  # type: ignore
+    import Grasshopper  # type: ignore
+except ImportError:
+    # -- Outside of Rhino (ie: the headless benchmarks) the jobs still run, there is just no canvas to update.
+    System = Rhino = Grasshopper = None
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io import run_subprocess
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+
+# -- The longest progress line shown under the component
+MAX_MESSAGE_LENGTH = 40
+
+
+class BackgroundJob(object):
+    """A function (normally one Python-3 worker job) run on a background thread."""
+
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+    # -- The shortest time (in seconds) between two progress messages passed on to `_on_output`.
+    MESSAGE_INTERVAL = 0.25
+
+    def __init__(self, _signature, _target, _on_output=None, _on_finished=None):
+        # type: (Any, Callable[[Callable[[str], None]], Any], Callable[[str], None] | None, Callable[[BackgroundJob], None] | None) -> None
+        self.signature = _signature
+        self.status = self.RUNNING
+        self.progress = ""
+        self.error = None  # type: Exception | None
+        self._target = _target
+        self._on_output = _on_output
+        self._on_finished = _on_finished
+        self._result = None  # type: Any
+        self._cancel_event = threading.Event()
+        self._message_lock = threading.Lock()
+        self._message_timer = None  # type: threading.Timer | None
+        self._last_message_time = 0.0
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        # type: () -> BackgroundJob
+        self._thread.start()
+        return self
+
+    @property
+    def done(self):
+        # type: () -> bool
+        """Return True if the job has finished (successfully or not)."""
+        return self.status != self.RUNNING
+
+    def _output(self, _line):
+        # type: (str) -> None
+        """Keep the latest line, and pass it on to `_on_output` at most every `MESSAGE_INTERVAL` seconds."""
+        self.progress = _line
+        if not self._on_output:
+            return
+
+        with self._message_lock:
+            if self._message_timer is not None:
+                return  # -- The timer passes on whichever line is the latest when it fires.
+            wait = self._last_message_time + self.MESSAGE_INTERVAL - time.time()
+            if wait > 0:
+                self._message_timer = threading.Timer(wait, self._output_latest)
+                self._message_timer.daemon = True
+                self._message_timer.start()
+                return
+            self._last_message_time = time.time()
+        self._on_output(_line)
+
+    def _output_latest(self):
+        # type: () -> None
+        with self._message_lock:
+            self._message_timer = None
+            if self.done:
+                return  # -- The finished job's status is shown instead.
+            self._last_message_time = time.time()
+        self._on_output(self.progress)
+
+    def _stop_output(self):
+        # type: () -> None
+        with self._message_lock:
+            if self._message_timer is not None:
+                self._message_timer.cancel()
+                self._message_timer = None
+
+    def cancel(self):
+        # type: () -> None
+        """Cancel the job: its Python-3 job (if one is running) is stopped and its processes killed."""
+        self._cancel_event.set()
+
+    def _run(self):
+        # type: () -> None
+        try:
+            with run_subprocess.cancel_event_scope(self._cancel_event):
+                self._result = self._target(self._output)
+            self.status = self.DONE
+        except run_subprocess.JobCancelled as e:
+            self.error = e
+            self.status = self.CANCELLED
+        except Exception as e:
+            self.error = e
+            self.status = self.FAILED
+        finally:
+            self._stop_output()
+            if self._on_finished:
+                self._on_finished(self)
+
+    def result(self):
+        # type: () -> Any
+        """Return the value returned by the target, or raise the error it raised."""
+        if not self.done:
+            raise RuntimeError("The background job has not finished yet.")
+        if self.error:
+            raise self.error
+        return self._result
+
+
+# -- {component-key: job}, the most recent job for each component.
+_JOBS = {}  # type: dict[str, BackgroundJob]
+_JOBS_LOCK = threading.Lock()
+
+# -- The component-keys with a handler watching for the component being deleted.
+_WATCHED_KEYS = set()  # type: set[str]
+
+
+# -----------------------------------------------------------------------------
+# -- Grasshopper canvas updates (these must happen on Rhino's UI thread)
+
+
+def _component(_IGH):
+    # type: (gh_io.IGH) -> Any
+    ghenv = getattr(_IGH, "ghenv", None)
+    return getattr(ghenv, "Component", None)
+
+
+def _on_ui_thread(_func):
+    # type: (Callable[[], None]) -> None
+    if Rhino is None:
+        return
+    Rhino.RhinoApp.InvokeOnUiThread(System.Action(_func))
+
+
+def set_component_message(_IGH, _text):
+    # type: (gh_io.IGH, str) -> None
+    """Show the text under the Grasshopper component (safe to call from any thread)."""
+    component = _component(_IGH)
+    if component is None:
+        return
+
+    text = _text if len(_text) <= MAX_MESSAGE_LENGTH else _text[: MAX_MESSAGE_LENGTH - 3] + "..."
+
+    def _update():
+        component.Message = text
+        Grasshopper.Instances.RedrawCanvas()
+
+    _on_ui_thread(_update)
+
+
+def expire_component(_IGH):
+    # type: (gh_io.IGH) -> None
+    """Schedule a new solution of the Grasshopper component (safe to call from any thread)."""
+    component = _component(_IGH)
+    if component is None:
+        return
+
+    def _expire():
+        doc = component.OnPingDocument()
+        if doc:
+            doc.ScheduleSolution(1, lambda _doc: component.ExpireSolution(False))
+
+    _on_ui_thread(_expire)
+
+
+def component_key(_IGH, _name):
+    # type: (gh_io.IGH, str) -> str
+    """Return the key for the component's job: its Grasshopper instance-id, if there is one."""
+    component = _component(_IGH)
+    if component is None:
+        return _name
+    return "{}:{}".format(_name, component.InstanceGuid)
+
+
+def _cancel_when_deleted(_IGH, _key):
+    # type: (gh_io.IGH, str) -> None
+    """Cancel the component's job if the component is deleted from the Grasshopper document."""
+    component = _component(_IGH)
+    if component is None or _key in _WATCHED_KEYS:
+        return
+    doc = component.OnPingDocument()
+    if doc is None:
+        return
+
+    def _on_objects_deleted(_sender, _event):
+        if not any(obj.InstanceGuid == component.InstanceGuid for obj in _event.Objects):
+            return
+        doc.ObjectsDeleted -= _on_objects_deleted
+        _WATCHED_KEYS.discard(_key)
+        with _JOBS_LOCK:
+            job = _JOBS.pop(_key, None)
+        if job and not job.done:
+            job.cancel()
+
+    doc.ObjectsDeleted += _on_objects_deleted
+    _WATCHED_KEYS.add(_key)
+
+
+# -----------------------------------------------------------------------------
+
+
+def is_running(_IGH, _name):
+    # type: (gh_io.IGH, str) -> bool
+    """Return True if the component has a job which has not finished yet."""
+    with _JOBS_LOCK:
+        job = _JOBS.get(component_key(_IGH, _name))
+    return bool(job) and not job.done
+
+
+def cancel(_IGH, _name):
+    # type: (gh_io.IGH, str) -> bool
+    """Cancel the component's running job, if it has one. Returns True if a job was cancelled."""
+    with _JOBS_LOCK:
+        job = _JOBS.get(component_key(_IGH, _name))
+    if not job or job.done:
+        return False
+
+    job.cancel()
+    _IGH.remark("The running calculation was cancelled.")
+    set_component_message(_IGH, BackgroundJob.CANCELLED)
+    return True
+
+
+def submit(_IGH, _name, _signature, _target):
+    # type: (gh_io.IGH, str, Any, Callable[[Callable[[str], None]], Any]) -> BackgroundJob
+    """Return the component's finished job for these inputs, or the running job, or start a new one.
+
+    ### Arguments:
+        * _IGH: The Grasshopper Interface of the component running the job.
+        * _name: A name for the kind of job (ie: "ADORB"), used when there is no component id.
+        * _signature: Anything (comparable) which identifies the job's inputs.
+        * _target: The function to run. Called with an `_on_output(line)` callback.
+
+    ### Returns:
+        * BackgroundJob: Check `.done` before calling `.result()`.
+    """
+    key = component_key(_IGH, _name)
+
+    with _JOBS_LOCK:
+        job = _JOBS.get(key)
+
+        if job and not job.done:
+            if job.signature != _signature:
+                _IGH.remark("The inputs changed: the calculation will re-run when the current one finishes.")
+            return job
+
+        if job and job.signature == _signature and job.status != BackgroundJob.CANCELLED:
+            # -- Hand back the finished job only once: the next solve with the same inputs starts again.
+            del _JOBS[key]
+            set_component_message(_IGH, job.status)
+            return job
+
+        def _on_finished(_job):
+            # type: (BackgroundJob) -> None
+            set_component_message(_IGH, _job.status)
+            expire_component(_IGH)
+
+        job = BackgroundJob(
+            _signature,
+            _target,
+            _on_output=lambda line: set_component_message(_IGH, line),
+            _on_finished=_on_finished,
+        )
+        _JOBS[key] = job
+        _cancel_when_deleted(_IGH, key)
+        set_component_message(_IGH, BackgroundJob.RUNNING)
+        return job.start()
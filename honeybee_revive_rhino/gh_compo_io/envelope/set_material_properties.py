@@ -13,6 +13,7 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
 
 # ----------------------------------------------------------------------------------------------------------------------
 # -- Protocol Classes
@@ -71,6 +72,7 @@ class GHCompo_SetMaterialProperties(object):
         self.labor_fraction = _labor_fraction
         self.lifetime_years = _lifetime_years
 
+    @perf.instrument
     def run(self):
         # type: () -> __SupportsPropertiesProtocol__ | None
         if not self.hb_object:
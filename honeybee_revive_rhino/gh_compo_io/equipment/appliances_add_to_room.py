@@ -20,6 +20,8 @@ try:
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_AddReviveAppliancesToRooms(object):
 
@@ -29,6 +31,7 @@ class GHCompo_AddReviveAppliancesToRooms(object):
         self.appliances = [ap for ap in _appliances if ap is not None]
         self.hb_rooms = _hb_rooms
 
+    @perf.instrument
     def run(self):
         # type: () -> list[Room]
 
@@ -21,6 +21,8 @@ try:
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_CreateReviveAppliance(object):
 
@@ -79,6 +81,7 @@ class GHCompo_CreateReviveAppliance(object):
         else:
             self._schedule = _input
 
+    @perf.instrument
     def run(self):
         # type: () -> Process | None
         if not self.schedule:
@@ -8,6 +8,8 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 # ----------------------------------------------------------------------------------------------------------------------
 # -- Protocol Classes
 
@@ -61,6 +63,7 @@ class GHCompo_SetApplianceReviveProperties(object):
         self.lifetime_years = _lifetime_years
         self.hb_appliance = _hb_appliance
 
+    @perf.instrument
     def run(self):
         # type: () -> __SupportsPropertiesProtocol__ | None
         if not self.hb_appliance:
@@ -28,6 +28,8 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_AddHvacEquipmentPropertiesToRooms(object):
 
@@ -37,6 +39,7 @@ class GHCompo_AddHvacEquipmentPropertiesToRooms(object):
         self.revive_equipment = _revive_equipment
         self.hb_rooms = _hb_rooms
 
+    @perf.instrument
     def run(self):
         # type: () -> list[Room]
         """Add HVAC Equipment Properties to Rooms.
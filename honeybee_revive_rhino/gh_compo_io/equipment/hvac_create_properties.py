@@ -18,6 +18,8 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_CreateReviveHvacEquipmentProperties(object):
 
@@ -29,6 +31,7 @@ class GHCompo_CreateReviveHvacEquipmentProperties(object):
         self.labor_fraction = _labor_fraction or 0.0
         self.lifetime_years = _lifetime_years or 0
 
+    @perf.instrument
     def run(self):
         # type: () -> PhiusReviveHVACEquipment | None
         if not self.display_name:
@@ -18,6 +18,8 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_SetLightingProgramProperties(object):
     def __init__(self, _IGH, _cost, _labor_fraction, _lifetime_years, _hbe_lighting, *args, **kwargs):
@@ -28,6 +30,7 @@ class GHCompo_SetLightingProgramProperties(object):
         self.lifetime_years = _lifetime_years
         self.hbe_lighting = _hbe_lighting
 
+    @perf.instrument
     def run(self):
         # type:() -> Lighting | None
 
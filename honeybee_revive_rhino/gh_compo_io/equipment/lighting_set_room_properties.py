@@ -24,6 +24,8 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_SetRoomLightingProperties(object):
     def __init__(self, _IGH, _cost, _labor_fraction, _lifetime_years, _hb_rooms, *args, **kwargs):
@@ -34,6 +36,7 @@ class GHCompo_SetRoomLightingProperties(object):
         self.lifetime_years = _lifetime_years
         self.hb_rooms = _hb_rooms
 
+    @perf.instrument
     def run(self):
         # type:() -> list[Room]
 
@@ -28,6 +28,8 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_SetPvShadeProperties(object):
 
@@ -39,6 +41,7 @@ class GHCompo_SetPvShadeProperties(object):
         self.lifetime_years = _lifetime_years
         self.hb_shades = _hb_shades
 
+    @perf.instrument
     def run(self):
         # type: () -> list[Shade]
 
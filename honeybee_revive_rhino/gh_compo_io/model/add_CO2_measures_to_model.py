@@ -20,6 +20,8 @@ try:
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_AddCO2ReductionMeasuresToModel(object):
 
@@ -29,6 +31,7 @@ class GHCompo_AddCO2ReductionMeasuresToModel(object):
         self.measures = _measures
         self.hb_model = _hb_model
 
+    @perf.instrument
     def run(self):
         # type: () -> Model | None
 
@@ -13,6 +13,8 @@ try:
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_CreateCO2ReductionMeasure(object):
 
@@ -27,6 +29,7 @@ class GHCompo_CreateCO2ReductionMeasure(object):
         self.country_name = _country_name or "USA"
         self.labor_fraction = _labor_fraction or 0.4
 
+    @perf.instrument
     def run(self):
         # type: () -> CO2ReductionMeasure
         new_measure = CO2ReductionMeasure()
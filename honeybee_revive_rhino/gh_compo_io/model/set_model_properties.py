@@ -16,18 +16,21 @@ try:
     from honeybee_revive.national_emissions import NationalEmissionsFactors
     from honeybee_revive.properties.model import ModelReviveProperties
     from honeybee_revive_standards import cambium_factors, national_emission_factors
-    from honeybee_revive_standards.cambium_factors._load_grid_region import load_grid_region_from_json_file
-    from honeybee_revive_standards.national_emission_factors._load_national_emissions import (
-        load_national_emissions_from_json_file,
-    )
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_revive_standards:\n\t{}".format(e))
 
+try:
+    from honeybee_revive_rhino.gh_compo_io.standards import _cache, _cambium
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
 try:
     from ph_gh_component_io import gh_io
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_SetModelProperties(object):
 
@@ -61,10 +64,10 @@ class GHCompo_SetModelProperties(object):
 
         emissions_factor_location = os.path.dirname(national_emission_factors.__file__)
         emissions_factor_json_file = os.path.join(emissions_factor_location, "rv2024_national_emissions.json")
-        emissions_factor_dict = load_national_emissions_from_json_file(emissions_factor_json_file)
+        emissions_factor_dict = _cache.national_emissions(emissions_factor_json_file)
 
         try:
-            national_emissions_factors = emissions_factor_dict[self.country_name]
+            national_emissions_factors = emissions_factor_dict[self.country_name].duplicate()
         except KeyError:
             msg = "Failed to find National Emissions Factors for: {} in the standards library: {}".format(
                 self.country_name, emissions_factor_json_file
@@ -80,26 +83,22 @@ class GHCompo_SetModelProperties(object):
         if not self.cambium_grid_region:
             return None
 
-        # TODO: Add some sort of Caching so we don't need to load the entire 10 MB JSON file every time
-
         if self.cambium_grid_region.endswith(".json"):
             # The user passed in a file-path, so just use that one.
-            return load_grid_region_from_json_file(self.cambium_grid_region)
+            return _cache.grid_region(self.cambium_grid_region).duplicate()
         else:
-            # The user passed in a GridRegion name, so try and find the file in the 'Standards' and load it
+            # The user passed in a GridRegion name, so look up the file in the 'Standards' index and load it
             search_name = "{}.json".format(self.cambium_grid_region)
-
-            # Search through all the files in 'honeybee_revive_standards.cambium_factors' for the 'search_name'
-            for root, dirs, files in os.walk(os.path.dirname(cambium_factors.__file__)):
-                if search_name in files:
-                    return load_grid_region_from_json_file(os.path.join(root, search_name))
-            else:
+            file_path = _cambium.find_grid_region_file(os.path.dirname(cambium_factors.__file__), search_name)
+            if not file_path:
                 raise ValueError(
                     "Failed to find a Grid-Region JSON file named: {} in Honeybee-Revive Standards: {}".format(
                         self.cambium_grid_region, cambium_factors.__file__
                     )
                 )
+            return _cache.grid_region(file_path).duplicate()
 
+    @perf.instrument
     def run(self):
         # type: () -> Model | None
 
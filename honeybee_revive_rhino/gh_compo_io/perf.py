@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Per-phase timing (and memory) of the component runs, for finding out where a slow component spends its time.
+
+Each `GHCompo_*.run` decorated with `@perf.instrument` gets a `PerfRecorder`, kept on the
+component as `.perf`. A component needs only the (plain) import and the decorator:
+
+    from honeybee_revive_rhino.gh_compo_io import perf
+    ...
+    @perf.instrument
+    def run(self):
+
+There is no try/except around that import: this module is part of the same package, and reports
+its own missing dependency (honeybee) the same way as the components do. Inside the run (and anything it calls on the same thread, ie:
+`run_subprocess_in_worker`) the work is split up with:
+
+    with perf.phase("write_model_json"):
+        ...
+
+Phases can be nested: their names are joined with "/" (ie: "calculate/worker.job/py3.read_model").
+Outside of an instrumented run, `phase` does nothing.
+
+The Python-3 scripts time their own phases (see `py3_scripts/perf_phases.py`) and report them in
+a single structured stdout line (`PERF_LINE_PREFIX` + JSON). `run_subprocess` / the worker remove
+that line from the script's stdout and merge its phases into the recorder of the component.
+
+A component can show the record on a `perf_` output with `.perf.report_lines()`. Only the
+components which start a Python-3 job, or do seconds of work on the canvas (the ADORB costs /
+sweep / uncertainty / batch, ADORB graphs, summer / winter resiliency outputs, Create Resiliency
+EPW, Set Resiliency Program and the outage-period sweep), have one: the others only build or copy
+a few objects, so their record is kept on `.perf` and in the log file but not shown. Only the
+timings are recorded, unless the `HBRV_PERF_LOG` environment variable is set (to anything but
+"" or "0"): then the memory in use after each phase is recorded too, and each finished run is
+appended to a rolling JSON-lines log file (`<default_simulation_folder>/REVIVE/_perf/perf_log.jsonl`).
+The memory is the .NET managed heap in Rhino (IronPython), or the process' peak resident size in
+CPython; None where neither is available.
+"""
+
+import functools
+import json
+import os
+import threading
+import timeit
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    from typing import Any, Callable, Iterator
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+
+# -- The prefix of the structured stdout line the Python-3 scripts report their phases on.
+PERF_LINE_PREFIX = "@@HBRV-PERF@@ "
+
+# -- Record the memory, and write each run to the log file, only when this environment variable is set.
+LOG_ENV_VAR = "HBRV_PERF_LOG"
+LOG_ENABLED = os.environ.get(LOG_ENV_VAR, "") not in ("", "0")
+
+# -- The log file is rolled over (to a single '.1' backup) once it is larger than this.
+LOG_MAX_BYTES = 2 * 1024 * 1024
+
+_timer = timeit.default_timer
+_local = threading.local()
+
+
+# -----------------------------------------------------------------------------
+# -- Memory
+
+
+def _memory_mb_dotnet():
+    # type: () -> float | None
+    import System  # type: ignore
+
+    return System.GC.GetTotalMemory(False) / (1024.0 * 1024.0)
+
+
+def _memory_mb_rusage():
+    # type: () -> float | None
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def _find_memory_function():
+    # type: () -> Callable[[], float | None]
+    for func in (_memory_mb_dotnet, _memory_mb_rusage):
+        try:
+            func()
+            return func
+        except Exception:
+            continue
+    return lambda: None
+
+
+memory_mb = _find_memory_function()
+
+
+# -----------------------------------------------------------------------------
+# -- Recorder
+
+
+class PerfRecorder(object):
+    """The phase timings of one component run."""
+
+    def __init__(self, _name):
+        # type: (str) -> None
+        self.name = _name
+        self.started = datetime.now()
+        self.total_s = None  # type: float | None
+        self.phases = []  # type: list[dict[str, Any]]
+        self._stack = []  # type: list[str]
+        self._start = _timer()
+
+    def _full_name(self, _name):
+        # type: (str) -> str
+        return "/".join(self._stack + [_name])
+
+    @contextmanager
+    def phase(self, _name):
+        # type: (str) -> Iterator[None]
+        """Time the code inside the context as the phase `_name` (nested inside any phase already open)."""
+        entry = {"name": self._full_name(_name), "seconds": None, "memory_mb": None}
+        self.phases.append(entry)
+        self._stack.append(_name)
+        start = _timer()
+        try:
+            yield
+        finally:
+            entry["seconds"] = round(_timer() - start, 6)
+            if LOG_ENABLED:
+                entry["memory_mb"] = _round_or_none(memory_mb())
+            self._stack.pop()
+
+    def add_phases(self, _phases, _prefix="py3."):
+        # type: (list[dict[str, Any]], str) -> None
+        """Add phases timed elsewhere (ie: by a Python-3 script), nested inside the phase open now."""
+        for phase in _phases:
+            self.phases.append(
+                {
+                    "name": self._full_name(_prefix + str(phase.get("name"))),
+                    "seconds": phase.get("seconds"),
+                    "memory_mb": phase.get("memory_mb"),
+                }
+            )
+
+    def finish(self):
+        # type: () -> None
+        self.total_s = round(_timer() - self._start, 6)
+
+    def to_dict(self):
+        # type: () -> dict[str, Any]
+        return {
+            "component": self.name,
+            "started": self.started.isoformat(),
+            "total_s": self.total_s,
+            "memory_mb": _round_or_none(memory_mb()),
+            "phases": self.phases,
+        }
+
+    def report_lines(self):
+        # type: () -> list[str]
+        """Return the timings as text, one line per phase (indented by nesting), for a component output."""
+        lines = ["{}: {:.3f} s".format(self.name, self.total_s or 0.0)]
+        for phase in self.phases:
+            depth = phase["name"].count("/")
+            text = "{}{}: {:.3f} s".format("  " * (depth + 1), phase["name"].split("/")[-1], phase["seconds"] or 0.0)
+            if phase["memory_mb"] is not None:
+                text += " [{:,.1f} MB]".format(phase["memory_mb"])
+            lines.append(text)
+        return lines
+
+
+def _round_or_none(_value):
+    # type: (float | None) -> float | None
+    return round(_value, 1) if _value is not None else None
+
+
+# -----------------------------------------------------------------------------
+# -- The recorder of the run in progress (on this thread)
+
+
+def current():
+    # type: () -> PerfRecorder | None
+    """Return the recorder of the instrumented run in progress on this thread, if any."""
+    stack = getattr(_local, "recorders", None)
+    return stack[-1] if stack else None
+
+
+@contextmanager
+def phase(_name):
+    # type: (str) -> Iterator[None]
+    """Time the code inside the context as a phase of the current run. Does nothing outside of an instrumented run."""
+    recorder = current()
+    if recorder is None:
+        yield
+        return
+    with recorder.phase(_name):
+        yield
+
+
+def pop_perf_lines(_stdout):
+    # type: (Any) -> Any
+    """Remove the Python-3 script's perf line(s) from its stdout, adding their phases to the current run.
+
+    Returns the stdout without the perf line(s), as the same type (bytes or text) it was given as.
+    """
+    if not _stdout:
+        return _stdout
+
+    is_bytes = not isinstance(_stdout, str) and isinstance(_stdout, bytes)
+    text = _stdout.decode("utf-8", "replace") if is_bytes else _stdout
+    if PERF_LINE_PREFIX not in text:
+        return _stdout
+
+    kept = []
+    recorder = current()
+    for line in text.splitlines(True):
+        if not line.startswith(PERF_LINE_PREFIX):
+            kept.append(line)
+            continue
+        if recorder is not None:
+            try:
+                recorder.add_phases(json.loads(line[len(PERF_LINE_PREFIX) :])["phases"])
+            except (ValueError, KeyError, TypeError) as e:
+                print("WARNING: Could not read the Python-3 timings: {}".format(e))
+
+    text = "".join(kept)
+    return text.encode("utf-8") if is_bytes else text
+
+
+# -----------------------------------------------------------------------------
+# -- Log file
+
+
+def log_file_path():
+    # type: () -> str
+    return os.path.join(hb_folders.default_simulation_folder, "REVIVE", "_perf", "perf_log.jsonl")
+
+
+def write_to_log(_recorder, _file_path=None):
+    # type: (PerfRecorder, str | None) -> None
+    """Append the record to the JSON-lines log, rolling the log over when it gets too large. Never raises."""
+    file_path = _file_path or log_file_path()
+    try:
+        folder = os.path.dirname(file_path)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        if os.path.isfile(file_path) and os.path.getsize(file_path) > LOG_MAX_BYTES:
+            backup_path = os.path.splitext(file_path)[0] + ".1.jsonl"
+            if os.path.isfile(backup_path):
+                os.remove(backup_path)
+            os.rename(file_path, backup_path)
+        with open(file_path, "a") as log_file:
+            log_file.write(json.dumps(_recorder.to_dict()) + "\n")
+    except Exception as e:
+        # -- The timings are only ever a diagnostic: never fail the component over them.
+        print("WARNING: Could not write the perf log '{}': {}".format(file_path, e))
+
+
+# -----------------------------------------------------------------------------
+# -- Component decorator
+
+
+def instrument(_run):
+    # type: (Callable) -> Callable
+    """Decorate a `GHCompo_*.run` method: time it (and its phases) and keep the record as `.perf` (see `LOG_ENABLED`)."""
+
+    @functools.wraps(_run)
+    def run(self, *args, **kwargs):
+        recorder = PerfRecorder(self.__class__.__name__)
+        self.perf = recorder
+        if getattr(_local, "recorders", None) is None:
+            _local.recorders = []
+        _local.recorders.append(recorder)
+        try:
+            return _run(self, *args, **kwargs)
+        finally:
+            _local.recorders.pop()
+            recorder.finish()
+            if LOG_ENABLED:
+                write_to_log(recorder)
+
+    return run
@@ -4,3 +4,4 @@ from generate_summer_output import GHCompo_ResiliencySummerOutput
 from generate_winter_output import GHCompo_ResiliencyWinterOutput
 from set_resiliency_output_variables import GHCompo_SetResiliencySimulationOutputVariables
 from set_resiliency_program import GHCompo_SetResiliencyProgram
+from sweep_outage_periods import GHCompo_SweepResiliencyOutagePeriods
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Utility: Read the hourly resiliency data into flat per-zone value arrays."""
+
+import json
+import sys
+from array import array
+from collections import namedtuple
+from datetime import datetime
+
+try:
+    from typing import TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        ZoneName = str
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ladybug.analysisperiod import AnalysisPeriod
+    from ladybug.datacollection import HourlyContinuousCollection
+    from ladybug.header import Header
+except ImportError as e:
+    raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
+
+
+# -- One zone's hourly values (in time order) and the first / last timestamp of the period.
+ZoneHourlyValues = namedtuple("ZoneHourlyValues", ["start", "end", "values"])
+
+
+def read_hourly_values_file(_file_path):
+    # type: (str) -> dict[ZoneName, ZoneHourlyValues]
+    """Read the per-zone hourly values from a '.bin' file written by 'py3_scripts/hourly_binary.py'.
+
+    The file is a single JSON header line, followed by the packed float64 values for each zone.
+
+    ### Arguments:
+        * _file_path: The path to the '.bin' hourly data file.
+
+    ### Returns:
+        * dict[ZoneName, ZoneHourlyValues]: The values for each zone, in time order.
+    """
+    zones = {}  # type: dict[ZoneName, ZoneHourlyValues]
+    with open(_file_path, "rb") as f:
+        header = json.loads(f.readline().decode("utf-8"))
+        if header.get("format") != "HBRV-HOURLY":
+            raise ValueError("The file: '{}' is not a Honeybee-REVIVE hourly data file.".format(_file_path))
+
+        for zone in header["zones"]:
+            values = array("d")
+            values.fromfile(f, zone["count"])
+            if sys.byteorder != header["byteorder"]:
+                values.byteswap()
+            # -- The year does not matter, only the month / day / hour are used.
+            start = datetime(2016, *zone["start"])
+            end = datetime(2016, *zone["end"])
+            zones[zone["name"]] = ZoneHourlyValues(start, end, values)
+
+    return zones
+
+
+def zone_header(_zone_name, _zone_values, _data_type, _unit):
+    # type: (ZoneName, ZoneHourlyValues, object, str) -> Header
+    """Return the HourlyContinuousCollection Header covering the zone's analysis period."""
+    st, end = _zone_values.start, _zone_values.end
+    return Header(
+        data_type=_data_type,
+        unit=_unit,
+        analysis_period=AnalysisPeriod(st.month, st.day, st.hour, end.month, end.day, end.hour),
+        metadata={"zone": _zone_name},
+    )
+
+
+def hourly_collection(_header, _values):
+    # type: (Header, list[float] | array) -> HourlyContinuousCollection
+    """Create an HourlyContinuousCollection from a header and the (time-ordered) values."""
+    return HourlyContinuousCollection(_header, values=list(_values))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Utility: A session-wide LRU cache of the Window-Ventilation Schedules modified for the resiliency outage periods.
+
+A room's Window-Ventilation Schedule gets the 'off' Schedule's rules added over the winter outage
+period and the 'on' Schedule's rules over the summer one. Each modified Schedule is built once per
+(Schedule, off-Schedule, off-dates, on-Schedule, on-dates) and kept for later solves with the same
+analysis periods. The Schedules are keyed on their identifier and their hash, so a Schedule which
+has been edited (ie: a changed standards file) is not mistaken for the cached one.
+
+The cached Schedule is shared as-is: it is locked, so that it cannot be changed by anything
+downstream of the component.
+"""
+
+from collections import OrderedDict
+
+try:
+    from typing import Any, Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ladybug.dt import Date
+except ImportError as e:
+    raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
+
+try:
+    from honeybee_energy.schedule.ruleset import ScheduleRuleset
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy:\n\t{}".format(e))
+
+
+# -- The cache is trimmed to this many entries, the least-recently used first.
+MAX_ENTRIES = 128
+
+# -- {key: cached-object}, in least- to most-recently used order.
+_CACHE = OrderedDict()  # type: OrderedDict[tuple, Any]
+
+
+def clear():
+    # type: () -> None
+    """Remove everything from the cache."""
+    _CACHE.clear()
+
+
+def _schedule_key(_schedule):
+    # type: (ScheduleRuleset) -> tuple[str, int]
+    return (_schedule.identifier, hash(_schedule))
+
+
+def _get(_key, _build):
+    # type: (tuple, Callable[[], Any]) -> Any
+    """Return the cached object, building it if it is missing, and mark it as the most-recently used."""
+    try:
+        value = _CACHE.pop(_key)
+    except KeyError:
+        value = _build()
+    _CACHE[_key] = value
+    while len(_CACHE) > MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+    return value
+
+
+def window_vent_schedule(_schedule, _off_schedule, _off_dates, _on_schedule, _on_dates):
+    # type: (ScheduleRuleset, ScheduleRuleset, tuple[Date, Date], ScheduleRuleset, tuple[Date, Date]) -> ScheduleRuleset
+    """Return a (locked, shared) copy of the Window-Ventilation Schedule, switched off and on over the outage periods.
+
+    Arguments:
+    ----------
+        * _schedule: The Window-Ventilation-Control's own Schedule.
+        * _off_schedule: The Schedule to apply (windows closed) over the `_off_dates` (start, end).
+        * _on_schedule: The Schedule to apply (windows open) over the `_on_dates` (start, end).
+    """
+    key = (
+        ("window_vent",)
+        + _schedule_key(_schedule)
+        + _schedule_key(_off_schedule)
+        + tuple(_off_dates)
+        + _schedule_key(_on_schedule)
+        + tuple(_on_dates)
+    )
+
+    def _build():
+        new_schedule = _schedule.duplicate()  # type: ScheduleRuleset
+        for rule in _off_schedule.to_rules(*_off_dates):
+            new_schedule.add_rule(rule)
+        for rule in _on_schedule.to_rules(*_on_dates):
+            new_schedule.add_rule(rule)
+        new_schedule.lock()
+        return new_schedule
+
+    return _get(key, _build)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Utility: Call LBT Python3 to read the E+ SQL file once and write all of the resiliency graphs and hourly data."""
+
+import os
+
+try:
+    from typing import Any, Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io import background_jobs
+    from honeybee_revive_rhino.gh_compo_io.run_subprocess import (
+        DEFAULT_JOB_TIMEOUT,
+        PY3_SCRIPTS_DIR,
+        run_subprocess_in_worker,
+    )
+except ImportError as e:
+    raise ImportError("\nFailed to import run_subprocess_in_worker:\n\t{}".format(e))
+
+
+WINTER = "winter"
+SUMMER = "summer"
+
+# -- The hourly data files written by the Python-3 script for each season (a '.csv' is written alongside)
+DATA_FILENAMES = {
+    WINTER: "resilience_SET_temperature.bin",
+    SUMMER: "resilience_heat_index_data.bin",
+}
+
+
+def data_filepath(_results_folder_path, _season):
+    # type: (str, str) -> str
+    """Return the path of the hourly data ('.bin') file written for the season."""
+    return os.path.join(_results_folder_path, DATA_FILENAMES[_season])
+
+
+def run(_sql_path, _results_folder_path, _seasons, _on_output=None, _timeout=DEFAULT_JOB_TIMEOUT):
+    # type: (str, str, list[str], Callable[[str], None] | None, float | None) -> tuple[str, str, str]
+    """Using Ladybug's Python-3 interpreter: read in the SQL file and write the resiliency graphs and hourly data files.
+
+    The SQL file is read in a single pass, and all of the seasons are handled in the same job.
+
+    ### Arguments:
+        * _sql_path: The path to the EnergyPlus SQL file to use.
+        * _results_folder_path: The folder to save the generated HTML and data file(s) to.
+        * _seasons: The seasons to generate the outputs for ("winter" and/or "summer").
+        * _on_output: Optional, called with each line the script prints, while it runs.
+        * _timeout: Optional, the most seconds the script may run for (None for no limit).
+
+    ### Returns:
+        * tuple
+            - [0] (str): The stdout from the subprocess.
+            - [1] (str): The stderr from the subprocess.
+            - [2] (str): The path to the output folder with the HTML and data files.
+    """
+    py3_filepath = os.path.join(PY3_SCRIPTS_DIR, "resilience_outputs.py")
+
+    # -- check the file paths
+    assert os.path.isfile(py3_filepath), "No Python file to run found at: {}".format(py3_filepath)
+    assert os.path.isfile(_sql_path), "No SQL file found at: {}".format(_sql_path)
+
+    # -- Check the output location
+    if not os.path.exists(_results_folder_path) or not os.path.isdir(_results_folder_path):
+        os.makedirs(_results_folder_path)
+
+    # -------------------------------------------------------------------------
+    print("Using Python-3 interpreter: '{}'".format(hb_folders.python_exe_path))
+    print("Running Python-3 script: '{}'".format(py3_filepath))
+    print("With the SQL file: '{}'".format(_sql_path))
+    print("Outputting to : '{}'".format(_results_folder_path))
+    commands = [
+        hb_folders.python_exe_path,  # -- The python3-interpreter to use
+        py3_filepath,  # ---------------- The python3-script to run
+        _sql_path,  # ------------------- The SQL file to use
+        _results_folder_path,  # -------- The folder path to save the graphs and data files to
+        ",".join(_seasons),  # ---------- The season(s) to output
+    ]
+    stdout, stderr = run_subprocess_in_worker(commands, _on_output, _timeout=_timeout)
+
+    # -------------------------------------------------------------------------
+    return stdout, stderr, _results_folder_path
+
+
+def job_name(_seasons):
+    # type: (list[str]) -> str
+    """Return the name of the background job for the seasons."""
+    return "Resiliency-{}".format("-".join(_seasons))
+
+
+def cancel_in_background(_IGH, _seasons):
+    # type: (Any, list[str]) -> bool
+    """Cancel the component's background job for the seasons, if it is running. Returns True if it was."""
+    return background_jobs.cancel(_IGH, job_name(_seasons))
+
+
+def run_in_background(_IGH, _sql_path, _results_folder_path, _seasons, _timeout=DEFAULT_JOB_TIMEOUT):
+    # type: (Any, str, str, list[str], float | None) -> tuple[str, str, str] | None
+    """Run the outputs script on a background thread (see `background_jobs`), instead of blocking the canvas.
+
+    ### Arguments:
+        * _IGH: The Grasshopper Interface of the component running the job.
+        * _sql_path: The path to the EnergyPlus SQL file to use.
+        * _results_folder_path: The folder to save the generated HTML and data file(s) to.
+        * _seasons: The seasons to generate the outputs for ("winter" and/or "summer").
+        * _timeout: Optional, the most seconds the script may run for (None for no limit).
+
+    ### Returns:
+        * tuple | None: None while the script is still running, otherwise the same as `run`.
+    """
+    # -- A re-written SQL file (ie: a new simulation) counts as new inputs
+    sql_stat = os.stat(_sql_path)
+    signature = (os.path.abspath(_sql_path), sql_stat.st_mtime, sql_stat.st_size, _results_folder_path, tuple(_seasons))
+
+    def _target(_on_output):
+        return run(_sql_path, _results_folder_path, _seasons, _on_output, _timeout)
+
+    job = background_jobs.submit(_IGH, job_name(_seasons), signature, _target)
+    if not job.done:
+        _IGH.remark("The resiliency outputs are being generated in the background...")
+        return None
+    return job.result()
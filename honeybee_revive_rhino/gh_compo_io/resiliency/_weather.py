@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Utility: Re-use the parsed ladybug EPW / STAT data when generating resiliency EPW files.
+
+Parsing an EPW file (and its STAT file) is by far the slowest part of making a resiliency EPW.
+`load_epw` / `load_stat` keep the parsed objects for the Rhino session, keyed on the file path,
+and re-read a file only when its modified-time or size changes. So re-solving with new design
+temperatures (or another set of outage weeks) only re-does the morphing.
+
+The cached objects are shared: the EPW must only be morphed through an `epw_working_copy`.
+"""
+
+import os
+from collections import OrderedDict
+from copy import copy
+
+try:
+    from typing import Any, Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ladybug.analysisperiod import AnalysisPeriod
+    from ladybug.epw import EPW
+    from ladybug.stat import STAT
+except ImportError as e:
+    raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io.standards._cache import file_signature
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+
+# -- The most weather files kept in memory (a parsed EPW is some tens of MB), the least-recently used are dropped.
+MAX_ENTRIES = 4
+
+# -- {(kind, path): (signature, loaded-object)}, in least- to most-recently used order.
+_CACHE = OrderedDict()  # type: OrderedDict[tuple[str, str], tuple[Any, Any]]
+
+
+def clear():
+    # type: () -> None
+    """Remove everything from the cache."""
+    _CACHE.clear()
+
+
+def _get(_kind, _file_path, _loader):
+    # type: (str, str, Callable[[], Any]) -> Any
+    """Return the cached object, (re)loading it if it is missing or its file has changed."""
+    key = (_kind, os.path.abspath(_file_path))
+    signature = file_signature(_file_path)
+    entry = _CACHE.pop(key, None)
+    if entry is None or entry[0] != signature:
+        entry = (signature, _loader())
+    _CACHE[key] = entry
+    while len(_CACHE) > MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+    return entry[1]
+
+
+def load_epw(_file_path):
+    # type: (str) -> EPW
+    """Return the EPW, with all of its data loaded (shared: use an `epw_working_copy` to change it)."""
+
+    def _load():
+        epw = EPW(_file_path)
+        epw._import_data()
+        return epw
+
+    return _get("epw", _file_path, _load)
+
+
+def load_stat(_file_path):
+    # type: (str) -> STAT
+    """Return the STAT (shared: do not change it)."""
+    return _get("stat", _file_path, lambda: STAT(_file_path))
+
+
+def epw_working_copy(_epw):
+    # type: (EPW) -> EPW
+    """Return a copy of the EPW which can be given to `generate_ladybug_epw` without changing the original.
+
+    `generate_ladybug_epw` starts from a `copy()` of the EPW, which (since the EPW class does not
+    define its own copy) shares the list of data collections with the original: replacing the
+    dry-bulb and dew-point collections in the 'new' EPW would replace them in the original too.
+    Here the copy gets its own list. The collections themselves are shared, but the morphing
+    only ever replaces them with new ones.
+    """
+    if not _epw.is_data_loaded:
+        # -- Load the data before copying, so that each copy does not read the file again.
+        _epw._import_data()
+    new_epw = copy(_epw)
+    new_epw._data = list(_epw._data)
+    return new_epw
+
+
+class OutageWeeks(object):
+    """Stands in for the ladybug STAT given to `generate_ladybug_epw`, which only reads its extreme weeks from it.
+
+    This allows a resiliency EPW to be generated for any winter / summer outage week, rather than
+    only for the extreme weeks in the STAT file.
+    """
+
+    def __init__(self, _extreme_cold_week, _extreme_hot_week):
+        # type: (AnalysisPeriod, AnalysisPeriod) -> None
+        self.extreme_cold_week = _extreme_cold_week
+        self.extreme_hot_week = _extreme_hot_week
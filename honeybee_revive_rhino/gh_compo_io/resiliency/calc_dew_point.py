@@ -15,6 +15,8 @@ try:
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_CalculateDewPoint(object):
 
@@ -48,6 +50,7 @@ class GHCompo_CalculateDewPoint(object):
         # type: () -> bool
         return self.dry_bulb_temp is not None and self.wet_bulb_temp is not None
 
+    @perf.instrument
     def run(self):
         # type: () -> tuple[float, float, float, float] | tuple[None, None, None, None]
         if not self.ready:
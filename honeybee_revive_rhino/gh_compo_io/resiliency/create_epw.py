@@ -8,8 +8,6 @@ import os
 try:
     from ladybug.analysisperiod import AnalysisPeriod
     from ladybug.config import folders
-    from ladybug.epw import EPW
-    from ladybug.stat import STAT
 except ImportError as e:
     raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
 
@@ -23,6 +21,12 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ladybug_revive:\n\t{}".format(e))
 
+try:
+    from honeybee_revive_rhino.gh_compo_io.resiliency._weather import epw_working_copy, load_epw, load_stat
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+from honeybee_revive_rhino.gh_compo_io import perf
 
 # ----------------------------------------------------------------------------------------------------------------------
 # -- GH Interface
@@ -75,6 +79,7 @@ class GHCompo_CreateResiliencyEPWFile(object):
             ]
         )
 
+    @perf.instrument
     def run(self):
         # type: () -> tuple[str | None, AnalysisPeriod | None, AnalysisPeriod | None]
         if not self.ready:
@@ -84,19 +89,23 @@ class GHCompo_CreateResiliencyEPWFile(object):
         # -- Generate a new Ladybug EPW with the adjustment factors applied
         print("Loading the EPW file: {}".format(self.epw_file))
         print("Loading the STAT file: {}".format(self.stat_file))
-        new_ladybug_epw, winter_outage_period_expanded, summer_outage_period_expanded = generate_ladybug_epw(
-            EPW(self.epw_file),
-            STAT(self.stat_file),
-            self.winter_10yr_dry_bulb_C,
-            self.winter_10yr_dew_point_C,
-            self.summer_20yr_dry_bulb_C,
-            self.summer_20yr_dew_point_C,
-        )
+        with perf.phase("load_weather"):
+            epw, stat = load_epw(self.epw_file), load_stat(self.stat_file)
+        with perf.phase("generate_epw"):
+            new_ladybug_epw, winter_outage_period_expanded, summer_outage_period_expanded = generate_ladybug_epw(
+                epw_working_copy(epw),
+                stat,
+                self.winter_10yr_dry_bulb_C,
+                self.winter_10yr_dew_point_C,
+                self.summer_20yr_dry_bulb_C,
+                self.summer_20yr_dew_point_C,
+            )
 
         # --------------------------------------------------------------------------------------------------------------
         # -- Save the new Ladybug EPW data to file
         _file_name_ = "Phius_REVIVE_2024_{}".format(os.path.basename(str(new_ladybug_epw.file_path)))
         epw_filepath_ = os.path.join(self.folder, _file_name_)
-        new_ladybug_epw.save(epw_filepath_)
+        with perf.phase("save_epw"):
+            new_ladybug_epw.save(epw_filepath_)
 
         return epw_filepath_, winter_outage_period_expanded, summer_outage_period_expanded
@@ -3,10 +3,9 @@
 
 """GH-Component Interface: HB-REVIVE - Create Resiliency Output Files."""
 
-import json
 import os
-from collections import defaultdict, namedtuple
-from datetime import datetime
+from bisect import bisect_right
+from collections import namedtuple
 
 try:
     from typing import TYPE_CHECKING
@@ -23,11 +22,8 @@ except ImportError as e:
     raise ImportError("\nFailed to import Grasshopper:\n\t{}".format(e))
 
 try:
-    from ladybug.analysisperiod import AnalysisPeriod
     from ladybug.datacollection import HourlyContinuousCollection
     from ladybug.datatype.fraction import Fraction
-    from ladybug.dt import DateTime
-    from ladybug.header import Header
 except ImportError as e:
     raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
 
@@ -42,32 +38,54 @@ except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
 try:
-    from honeybee_revive_rhino.gh_compo_io.resiliency import _generate_graphs, _sql_data_to_json
+    from honeybee_revive_rhino.gh_compo_io.resiliency import _resilience_outputs
+    from honeybee_revive_rhino.gh_compo_io.run_subprocess import job_timeout
+    from honeybee_revive_rhino.gh_compo_io.resiliency._hourly_values import (
+        ZoneHourlyValues,
+        hourly_collection,
+        read_hourly_values_file,
+        zone_header,
+    )
 except ImportError as e:
     raise ImportError("\nFailed to import from honeybee_revive_rhino:\n\t{}".format(e))
 
-Record = namedtuple("Record", ["timestamp", "value"])
+from honeybee_revive_rhino.gh_compo_io import perf
+
 SummerHeatIndexHours = namedtuple("Output", ["caution", "warning", "danger", "extreme_danger"])
 
+# -- The lower bound of each Heat-Index band, in order: caution, warning, danger, extreme-danger
+HEAT_INDEX_THRESHOLDS = (
+    26.7,  # 80 deg-F
+    32.2,  # 90 deg-F
+    39.4,  # 103 deg-F
+    51.7,  # 125 deg-F
+)
 
-def hourly_collection(header, data):
-    # type: (Header, list[Record]) -> HourlyContinuousCollection
-    """Create an HourlyContinuousCollection from a header and some data."""
 
-    return HourlyContinuousCollection(
-        header,
-        values=[r.value for r in sorted(data, key=lambda x: x.timestamp)],
-    )
+def calculate_heat_index_hours(_zone_hourly_values):
+    # type: (dict[ZoneName, ZoneHourlyValues]) -> SummerHeatIndexHours
+    """Classify every hourly Heat-Index value: 1 if the hour falls in the band, 0 if not.
+
+    ### Arguments:
+        * _zone_hourly_values: The Heat-Index values for each zone.
 
+    ### Returns:
+        * SummerHeatIndexHours: dicts of {ZoneName: list[int]} for each of the Heat-Index bands.
+    """
+    caution, warning, danger, extreme_danger = {}, {}, {}, {}
+    for zone_name, zone_values in _zone_hourly_values.items():
+        # -- 0=below caution, 1=caution, 2=warning, 3=danger, 4=extreme-danger
+        bands = [bisect_right(HEAT_INDEX_THRESHOLDS, v) for v in zone_values.values]
+        caution[zone_name] = [int(b == 1) for b in bands]
+        warning[zone_name] = [int(b == 2) for b in bands]
+        danger[zone_name] = [int(b == 3) for b in bands]
+        extreme_danger[zone_name] = [int(b == 4) for b in bands]
 
-def build_summer_heat_index_HourlyCollection(
-    _summer_zone_names_,
-    _heat_index_caution,
-    _heat_index_warning,
-    _heat_index_danger,
-    _heat_index_extreme_danger,
-):
-    # type: (list[str], dict[ZoneName, list[Record]], dict[ZoneName, list[Record]], dict[ZoneName, list[Record]], dict[ZoneName, list[Record]]) -> SummerHeatIndexHours
+    return SummerHeatIndexHours(caution, warning, danger, extreme_danger)
+
+
+def build_summer_heat_index_HourlyCollection(_zone_hourly_values, _heat_index_hours):
+    # type: (dict[ZoneName, ZoneHourlyValues], SummerHeatIndexHours) -> SummerHeatIndexHours
     """Build the Heat-Index HourlyCollections for the summer months."""
 
     extreme_danger_hours_ = DataTree[HourlyContinuousCollection]()
@@ -75,76 +93,31 @@ def build_summer_heat_index_HourlyCollection(
     warning_hours_ = DataTree[HourlyContinuousCollection]()
     caution_hours_ = DataTree[HourlyContinuousCollection]()
 
-    for i, zone_name in enumerate(_summer_zone_names_):
-        times = [r.timestamp for r in sorted(_heat_index_extreme_danger[zone_name], key=lambda x: x.timestamp)]
-        st, end = min(times), max(times)
-        header = Header(
-            data_type=Fraction(),
-            unit="fraction",
-            analysis_period=AnalysisPeriod(st.month, st.day, st.hour, end.month, end.day, end.hour),
-            metadata={"zone": zone_name},
-        )
-
-        extreme_danger_hours_.Add(hourly_collection(header, _heat_index_extreme_danger[zone_name]), GH_Path(i))
-        danger_hours_.Add(hourly_collection(header, _heat_index_danger[zone_name]), GH_Path(i))
-        warning_hours_.Add(hourly_collection(header, _heat_index_warning[zone_name]), GH_Path(i))
-        caution_hours_.Add(hourly_collection(header, _heat_index_caution[zone_name]), GH_Path(i))
+    for i, zone_name in enumerate(sorted(_zone_hourly_values.keys())):
+        header = zone_header(zone_name, _zone_hourly_values[zone_name], Fraction(), "fraction")
+        extreme_danger_hours_.Add(hourly_collection(header, _heat_index_hours.extreme_danger[zone_name]), GH_Path(i))
+        danger_hours_.Add(hourly_collection(header, _heat_index_hours.danger[zone_name]), GH_Path(i))
+        warning_hours_.Add(hourly_collection(header, _heat_index_hours.warning[zone_name]), GH_Path(i))
+        caution_hours_.Add(hourly_collection(header, _heat_index_hours.caution[zone_name]), GH_Path(i))
 
     return SummerHeatIndexHours(caution_hours_, warning_hours_, danger_hours_, extreme_danger_hours_)
 
 
-def calculate_heat_index_hours(_heat_index_hourly_records):
-    # type: (list[dict]) -> tuple[dict[ZoneName, list[Record]], ...]
-    """Calculate the Heat-Index hours for the summer months."""
-    SUMMER_CAUTION_THRESHOLD = 26.7  # 80 deg-F
-    SUMMER_WARNING_THRESHOLD = 32.2  # 90 deg-F
-    SUMMER_DANGER_THRESHOLD = 39.4  # 103 deg-F
-    SUMMER_EXTREME_DANGER_THRESHOLD = 51.7  # 125 deg-F
-
-    heat_index_caution = defaultdict(list)
-    heat_index_warning = defaultdict(list)
-    heat_index_danger = defaultdict(list)
-    heat_index_extreme_danger = defaultdict(list)
-    for record in _heat_index_hourly_records:
-        timestamp = datetime.utcfromtimestamp(record["Date"] / 1000.0)  # milliseconds to seconds
-        lbt_timestamp = DateTime(timestamp.month, timestamp.day, timestamp.hour)
-
-        if record["Value"] >= SUMMER_EXTREME_DANGER_THRESHOLD:
-            heat_index_extreme_danger[record["Zone"]].append(Record(lbt_timestamp, 1))
-        else:
-            heat_index_extreme_danger[record["Zone"]].append(Record(lbt_timestamp, 0))
-
-        if SUMMER_EXTREME_DANGER_THRESHOLD > record["Value"] >= SUMMER_DANGER_THRESHOLD:
-            heat_index_danger[record["Zone"]].append(Record(lbt_timestamp, 1))
-        else:
-            heat_index_danger[record["Zone"]].append(Record(lbt_timestamp, 0))
-
-        if SUMMER_DANGER_THRESHOLD > record["Value"] >= SUMMER_WARNING_THRESHOLD:
-            heat_index_warning[record["Zone"]].append(Record(lbt_timestamp, 1))
-        else:
-            heat_index_warning[record["Zone"]].append(Record(lbt_timestamp, 0))
-
-        if SUMMER_WARNING_THRESHOLD > record["Value"] >= SUMMER_CAUTION_THRESHOLD:
-            heat_index_caution[record["Zone"]].append(Record(lbt_timestamp, 1))
-        else:
-            heat_index_caution[record["Zone"]].append(Record(lbt_timestamp, 0))
-
-    return heat_index_caution, heat_index_warning, heat_index_danger, heat_index_extreme_danger
-
-
 class GHCompo_ResiliencySummerOutput(object):
 
-    def __init__(self, _IGH, _sql_path, _folder, *args, **kwargs):
-        # type: (gh_io.IGH, str, str | None, list, dict) -> None
+    def __init__(self, _IGH, _sql_path, _folder, _run_async=False, _timeout=None, *args, **kwargs):
+        # type: (gh_io.IGH, str, str | None, bool, float | None, list, dict) -> None
         self.IGH = _IGH
         self.sql_path = _sql_path
         self.results_folder_path = _folder or hb_folders.default_simulation_folder
+        self.run_async = _run_async or False
+        self.timeout = job_timeout(_timeout)
 
     @property
-    def json_filepath(self):
+    def data_filepath(self):
         # type: () -> str
-        """Get the file path to save the generated JSON file to."""
-        return os.path.join(self.results_folder_path, "{}.json".format("resilience_heat_index_data"))
+        """Get the file path of the generated hourly data file."""
+        return _resilience_outputs.data_filepath(self.results_folder_path, _resilience_outputs.SUMMER)
 
     def give_user_warnings(self, _stdout, _stderr):
         # type: (bytes, bytes | None) -> None
@@ -156,12 +129,6 @@ class GHCompo_ResiliencySummerOutput(object):
         if _stderr:
             self.IGH.error(str(_stderr))
 
-    def read_json_file_data(self, _json_filepath):
-        # type: (str) -> list[dict]
-        """Get the data from a JSON file."""
-        with open(_json_filepath, "r") as json_file:
-            return json.load(json_file)
-
     @property
     def ready(self):
         # type: () -> bool
@@ -171,55 +138,34 @@ class GHCompo_ResiliencySummerOutput(object):
         else:
             return True
 
+    @perf.instrument
     def run(self):
         if not self.ready:
+            # -- Without an SQL file, stop any outputs still being generated in the background
+            _resilience_outputs.cancel_in_background(self.IGH, [_resilience_outputs.SUMMER])
             return None, None, None, None, None
 
         # --------------------------------------------------------------------------------------------------------------
-        # -- Call Python3 to Generate Graphs
-        # -- This must be done using Python3 since we want to use Pandas and the Plotly library
-        summer_graphs_py3_script_filepath = os.path.join(
-            hb_folders.python_package_path, "honeybee_revive", "output", "resilience_summer_graphs.py"
-        )
-        stdout, stderr, results_folder_path = _generate_graphs.run(
-            _py3_filepath=summer_graphs_py3_script_filepath,
-            _sql_path=self.sql_path,
-            _results_folder_path=self.results_folder_path,
-        )
-        self.give_user_warnings(stdout, stderr)
-
-        # --------------------------------------------------------------------------------------------------------------
-        # -- Call Python3 to get the SQL data and write it out to a JSON file
-        # -- This must be done using Python3 since Rhino's IronPython does not support the sqlite3 module on MacOS
-        py3_script = os.path.join(
-            hb_folders.python_package_path, "honeybee_revive", "output", "resilience_hourly_data.py"
-        )
-        stdout, stderr = _sql_data_to_json.run(
-            _py3_filepath=py3_script,
-            _sql_path=self.sql_path,
-            _output_variable_name="Zone Heat Index",
-            _json_filepath=self.json_filepath,
-        )
+        # -- Call Python3 to Generate the Graphs and write the Heat-Index data out to a JSON file
+        # -- This must be done using Python3 since we want to use Pandas and the Plotly library, and
+        # -- Rhino's IronPython does not support the sqlite3 module on MacOS
+        seasons = [_resilience_outputs.SUMMER]
+        if self.run_async:
+            outputs = _resilience_outputs.run_in_background(
+                self.IGH, self.sql_path, self.results_folder_path, seasons, self.timeout
+            )
+            if outputs is None:
+                return None, None, None, None, None
+        else:
+            outputs = _resilience_outputs.run(self.sql_path, self.results_folder_path, seasons, _timeout=self.timeout)
+        stdout, stderr, results_folder_path = outputs
         self.give_user_warnings(stdout, stderr)
 
         # --------------------------------------------------------------------------------------------------------------
         # -- Calculate and organize the outputs for Summer Heat-Index Hours
-        heat_index_hourly_records = self.read_json_file_data(self.json_filepath)
-        heat_index_caution, heat_index_warning, heat_index_danger, heat_index_extreme_danger = (
-            calculate_heat_index_hours(heat_index_hourly_records)
-        )
-        summer_zone_names_ = sorted(
-            set(heat_index_caution.keys())
-            | set(heat_index_warning.keys())
-            | set(heat_index_danger.keys())
-            | set(heat_index_extreme_danger.keys())
-        )
+        heat_index_hourly_values = read_hourly_values_file(self.data_filepath)
         summer_heat_index_hourly_collections = build_summer_heat_index_HourlyCollection(
-            summer_zone_names_,
-            heat_index_caution,
-            heat_index_warning,
-            heat_index_danger,
-            heat_index_extreme_danger,
+            heat_index_hourly_values, calculate_heat_index_hours(heat_index_hourly_values)
         )
 
         # --------------------------------------------------------------------------------------------------------------
@@ -13,6 +13,8 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 class GHCompo_SetResiliencySimulationOutputVariables(object):
     resiliency_simulation_outputs = [
         "Site Outdoor Air Drybulb Temperature",
@@ -60,6 +62,7 @@ class GHCompo_SetResiliencySimulationOutputVariables(object):
         self.IGH = _IGH
         self.sim_output = _sim_output
 
+    @perf.instrument
     def run(self):
         # type: () -> SimulationOutput
         sim_output = self.sim_output.duplicate() if self.sim_output is not None else SimulationOutput()
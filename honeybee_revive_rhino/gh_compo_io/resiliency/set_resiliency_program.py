@@ -4,6 +4,7 @@
 """GH-Component Interface: HB-REVIVE - Set Resiliency Program."""
 
 import os
+from collections import namedtuple
 
 try:
     from ladybug.analysisperiod import AnalysisPeriod
@@ -13,6 +14,7 @@ except ImportError as e:
 
 try:
     from honeybee.model import Model
+    from honeybee.properties import RoomProperties
     from honeybee.room import Room
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee: {0}".format(e))
@@ -29,6 +31,7 @@ except ImportError:
 try:
     import honeybee_revive_standards
 
+    from honeybee_revive_rhino.gh_compo_io.resiliency._outage_schedules import window_vent_schedule
     from honeybee_revive_rhino.gh_compo_io.standards._load import (
         load_program_and_schedules,
         load_schedules_from_standards,
@@ -46,15 +49,93 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import ph_units: {0}".format(e))
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
+# -- The loads of one (input) Room, in SI units, collected in a single pass over the Rooms.
+RoomLoads = namedtuple(
+    "RoomLoads",
+    [
+        "floor_area_m2",
+        "occupancy",
+        "exposed_area_m2",
+        "infiltration_m3_s",
+        "sensible_heat_recovery",
+        "latent_heat_recovery",
+    ],
+)
+
+
+def _slot_names(_cls):
+    # type: (type) -> list[str]
+    return [name for klass in _cls.__mro__ for name in getattr(klass, "__slots__", ()) if name != "__weakref__"]
+
+
+def shallow_duplicate_room(_room):
+    # type: (Room) -> Room
+    """Return a copy of the Room which shares the original's geometry, but has its own (duplicated) properties.
+
+    The Faces, Apertures, Doors and Shades are not copied: they are the same objects as the original
+    Room's (and still name it as their parent). So only the Room-level properties of the copy may be
+    changed (ie: its program, loads and HVAC), not its geometry or the properties of its Faces.
+    """
+    new_room = Room.__new__(Room)
+    for name in _slot_names(Room):
+        setattr(new_room, name, getattr(_room, name))
+    new_room._user_data = None if _room.user_data is None else _room.user_data.copy()
+    new_room._outdoor_shades = list(_room._outdoor_shades)
+    new_room._indoor_shades = list(_room._indoor_shades)
+    new_room._properties = RoomProperties(new_room)
+    new_room._properties._duplicate_extension_attr(_room._properties)
+    return new_room
+
+
+def duplicate_model_with_rooms(_model, _rooms, _shallow=False):
+    # type: (Model, list[Room], bool) -> Model
+    """Return a copy of the Model with the Rooms given, instead of copies of its own Rooms.
+
+    With `_shallow`, the orphaned Faces, Apertures, Doors, Shades and Shade-Meshes are shared with
+    the original Model rather than duplicated.
+    """
+
+    def _copy(_objects):
+        return list(_objects) if _shallow else [obj.duplicate() for obj in _objects]
+
+    new_model = Model(
+        _model.identifier,
+        _rooms,
+        _copy(_model.orphaned_faces),
+        _copy(_model.orphaned_shades),
+        _copy(_model.orphaned_apertures),
+        _copy(_model.orphaned_doors),
+        _copy(_model.shade_meshes),
+        _model.units,
+        _model.tolerance,
+        _model.angle_tolerance,
+    )
+    new_model._display_name = _model._display_name
+    new_model._user_data = None if _model.user_data is None else _model.user_data.copy()
+    new_model._properties._duplicate_extension_attr(_model._properties)
+    return new_model
+
 
 class GHCompo_SetResiliencyProgram(object):
     num_dwellings = validators.IntegerNonZero("num_dwellings")
     DEFAULT_PROGRAM_NAME = "rv2024_Residence_Resilience"
 
     def __init__(
-        self, _IGH, _hb_obj, _num_dwellings, _elec_equip, _program, _winter_period, _summer_period, *args, **kwargs
+        self,
+        _IGH,
+        _hb_obj,
+        _num_dwellings,
+        _elec_equip,
+        _program,
+        _winter_period,
+        _summer_period,
+        _shallow_copy=False,
+        *args,
+        **kwargs
     ):
-        # type: (gh_io.IGH, list[Room | Model], int, list[Process], ProgramType | None, AnalysisPeriod, AnalysisPeriod, list, dict) -> None
+        # type: (gh_io.IGH, list[Room | Model], int, list[Process], ProgramType | None, AnalysisPeriod, AnalysisPeriod, bool, list, dict) -> None
         self.IGH = _IGH
         self.model = None  # type: Model | None
         self.rooms = _hb_obj
@@ -63,6 +144,7 @@ class GHCompo_SetResiliencyProgram(object):
         self.program = _program
         self.winter_period = _winter_period
         self.summer_period = _summer_period
+        self.shallow_copy = _shallow_copy or False
 
     @property
     def rooms(self):
@@ -96,46 +178,37 @@ class GHCompo_SetResiliencyProgram(object):
             return False
         return True
 
-    @staticmethod
-    def room_ventilation_sensible_recovery_efficiency(_room):
-        # type: (Room) -> float
-        """Get the sensible sensible heat recovery efficiency of the Room's H/ERV."""
-        room_energy_prop = getattr(_room.properties, "energy")
-        if not room_energy_prop.hvac:
-            return 0.0
-        return getattr(room_energy_prop.hvac, "sensible_heat_recovery", 0)
-
-    @staticmethod
-    def room_ventilation_latent_recovery_efficiency(_room):
-        # type: (Room) -> float
-        """Get the sensible latent heat recovery efficiency of the Room's H/ERV."""
-        room_energy_prop = getattr(_room.properties, "energy")
-        if not room_energy_prop.hvac:
-            return 0.0
-        return getattr(room_energy_prop.hvac, "latent_heat_recovery", 0)
-
-    @staticmethod
-    def room_ventilation_has_heat_recovery(_room):
-        # type: (Room) -> bool
-        """Check if the Room has an H/ERV with sensible heat recovery."""
-
-        room_energy_prop = getattr(_room.properties, "energy")  # type: RoomEnergyProperties
-        if not room_energy_prop.hvac:
-            return False
-
-        hr = getattr(room_energy_prop.hvac, "sensible_heat_recovery", 0)
-        if hr > 0:
-            return True
+    def room_loads(self, _area_to_m2):
+        # type: (float) -> list[RoomLoads]
+        """Return the floor-area, occupancy, infiltration and H/ERV heat-recovery of each Room, in the order of the Rooms.
 
-        return False
-
-    @property
-    def any_room_ventilation_has_heat_recovery(self):
-        # type: () -> bool
-        """Check if ANY of the rooms have an H/ERV with sensible heat recovery."""
-        room_has_erv = [self.room_ventilation_has_heat_recovery(room) for room in self.rooms]
-        return any(room_has_erv)
+        Arguments:
+        ----------
+            * _area_to_m2: (float) The factor to convert the Rhino-document's area unit to M2.
+        """
+        room_loads_ = []
+        for rm in self.rooms:
+            rm_energy_prop = getattr(rm.properties, "energy")  # type: RoomEnergyProperties
+            floor_area_m2 = rm.floor_area * _area_to_m2
+            exposed_area_m2 = rm.exposed_area * _area_to_m2
+            if rm_energy_prop.hvac:
+                sensible_hr = getattr(rm_energy_prop.hvac, "sensible_heat_recovery", 0)
+                latent_hr = getattr(rm_energy_prop.hvac, "latent_heat_recovery", 0)
+            else:
+                sensible_hr, latent_hr = 0.0, 0.0
+            room_loads_.append(
+                RoomLoads(
+                    floor_area_m2,
+                    rm_energy_prop.people.people_per_area * floor_area_m2,
+                    exposed_area_m2,
+                    rm_energy_prop.infiltration.flow_per_exterior_area * exposed_area_m2,
+                    sensible_hr,
+                    latent_hr,
+                )
+            )
+        return room_loads_
 
+    @perf.instrument
     def run(self):
         # type: () -> tuple[list[Room] | Model, ProgramType | None]
         if not self.ready:
@@ -145,7 +218,8 @@ class GHCompo_SetResiliencyProgram(object):
         # -- Get the Residential Resiliency Program to use
         if not self.program:
             print("Loading the '{}' program from standards.".format(self.DEFAULT_PROGRAM_NAME))
-            rv2024_resilience_program = load_program_and_schedules(self.standards_dir, self.DEFAULT_PROGRAM_NAME)
+            with perf.phase("load_program"):
+                rv2024_resilience_program = load_program_and_schedules(self.standards_dir, self.DEFAULT_PROGRAM_NAME)
         else:
             rv2024_resilience_program = self.program.duplicate()
 
@@ -157,35 +231,29 @@ class GHCompo_SetResiliencyProgram(object):
 
         # --------------------------------------------------------------------------------------------------------------
         # -- Figure out the total occupancy, MEL, Ventilation for the rooms
-        total_floor_area_rh_units = sum(rm.floor_area for rm in self.rooms)
-        total_floor_area_m2 = convert(total_floor_area_rh_units, self.IGH.get_rhino_areas_unit_name(), "M2") or 0.0
+        # -- The area unit is the same for every Room, so convert it only once.
+        area_unit = self.IGH.get_rhino_areas_unit_name()
+        area_to_m2 = convert(1.0, area_unit, "M2")
+        if area_to_m2 is None:
+            self.IGH.error("Failed to convert the Rhino area unit '{}' to M2?".format(area_unit))
+            return ([], None)
+
+        with perf.phase("collect_room_loads"):
+            room_loads = self.room_loads(area_to_m2)
+
+        total_floor_area_m2 = sum(loads.floor_area_m2 for loads in room_loads)
         print("Total floor area: {:,.1f} m2".format(total_floor_area_m2))
 
-        if total_floor_area_rh_units == 0:
+        if total_floor_area_m2 == 0:
             self.IGH.error("Total floor area is zero. Please make sure the rooms have valid floor surfaces?")
             return ([], None)
 
         # -- Occupancy to match the Room's existing occupancy load
-        total_occupancy = 0.0
-        for rm in self.rooms:
-            rm_area_m2 = convert(rm.floor_area, self.IGH.get_rhino_areas_unit_name(), "M2") or 0.0
-            if rm_area_m2 is None:
-                self.IGH.warning("Failed to convert room's floor area to M2: {}".format(rm.floor_area))
-                continue
-            rm_energy_prop = getattr(rm.properties, "energy")  # type: RoomEnergyProperties
-            total_occupancy += rm_energy_prop.people.people_per_area * rm_area_m2
+        total_occupancy = sum(loads.occupancy for loads in room_loads)
 
         # -- Infiltration rate to math the Room's existing infiltration load
-        total_infiltration_m3_s = 0.0
-        total_exposed_area_m2 = 0.0
-        for rm in self.rooms:
-            rm_exposed_area_m2 = convert(rm.exposed_area, self.IGH.get_rhino_areas_unit_name(), "M2") or 0.0
-            if rm_exposed_area_m2 is None:
-                self.IGH.warning("Failed to convert room's exposed-area to M2: {}".format(rm.floor_area))
-                continue
-            rm_energy_prop = getattr(rm.properties, "energy")
-            total_infiltration_m3_s += rm_energy_prop.infiltration.flow_per_exterior_area * rm_exposed_area_m2
-            total_exposed_area_m2 += rm_exposed_area_m2
+        total_infiltration_m3_s = sum(loads.infiltration_m3_s for loads in room_loads)
+        total_exposed_area_m2 = sum(loads.exposed_area_m2 for loads in room_loads)
         infiltration_per_exposed_area = total_infiltration_m3_s / total_exposed_area_m2
 
         # -- Set 33-W per dwelling as per Phius REVIVE Rules (=1 fridge)
@@ -195,7 +263,7 @@ class GHCompo_SetResiliencyProgram(object):
 
         # -- Set 5-CFM per person as per Phius REVIVE Rules if
         # -- there is an ERV, otherwise set the ventilation to 0 cfm
-        if self.any_room_ventilation_has_heat_recovery:
+        if any(loads.sensible_heat_recovery > 0 for loads in room_loads):
             total_vent_cfm = total_occupancy * 5
         else:
             total_vent_cfm = 0.0
@@ -225,7 +293,8 @@ class GHCompo_SetResiliencyProgram(object):
         # --------------------------------------------------------------------------------------------------------------
         # -- Create the Setpoint Schedules based on the Winter and Summer Periods
         print("Setting the Setpoint Schedules based on the Winter and Summer Periods.")
-        schedules_dict = load_schedules_from_standards(self.standards_dir)
+        with perf.phase("load_schedules"):
+            schedules_dict = load_schedules_from_standards(self.standards_dir)
         heating_off_schedule = schedules_dict["rv2024_HeatingOff"]
         cooling_off_schedule = schedules_dict["rv2024_CoolingOff"]
         humid_off_schedule = schedules_dict["rv2024_HumidificationOff"]
@@ -270,56 +339,56 @@ class GHCompo_SetResiliencyProgram(object):
             vent_control_objects[id(room_prop_energy.window_vent_control)] = control_obj
 
         # -- Modify the Window Ventilation Control operation schedules for the resiliency periods
+        # -- Controls with the same schedule share the one (cached) modified schedule.
         modified_vent_control_objects = {}
         for control_id, control_data in vent_control_objects.items():
             if not control_data:
                 continue
             new_control_obj = control_data.duplicate()  # type: VentilationControl
-            new_control_schedule = control_data.schedule.duplicate()
-
-            for window_off_rule in window_opening_off_schedule.to_rules(htg_start, htg_end):
-                new_control_schedule.add_rule(window_off_rule)
-            for window_on_rule in window_opening_on_schedule.to_rules(clg_start, clg_end):
-                new_control_schedule.add_rule(window_on_rule)
-
-            new_control_obj.schedule = new_control_schedule
+            new_control_obj.schedule = window_vent_schedule(
+                control_data.schedule,
+                window_opening_off_schedule,
+                (htg_start, htg_end),
+                window_opening_on_schedule,
+                (clg_start, clg_end),
+            )
             modified_vent_control_objects[control_id] = new_control_obj
 
         # --------------------------------------------------------------------------------------------------------------
         # -- Set all the Room's Programs
-        new_rooms_ = []
-        for room in self.rooms:
-            new_room = room.duplicate()
-            new_rm_energy_prop = getattr(new_room.properties, "energy")  # type: RoomEnergyProperties
-            new_rm_energy_prop.program_type = rv2024_resilience_program
-            new_rm_energy_prop.reset_loads_to_program()
-            new_rm_energy_prop.window_vent_control = modified_vent_control_objects.get(
-                id(new_rm_energy_prop.window_vent_control), None
-            )
-
-            # -- Re-set the HVAC to be an ideal air system so that we can avoid
-            # -- any problems with fans and HVAC equipment overriding the program loads
-            # -- Make sure to preserve any ERV performance values as well though.
-            hvac_id = "{} Ideal Loads Air System".format(new_rm_energy_prop.host.identifier)
-            ideal_air_system = IdealAirSystem(hvac_id)
-            if self.room_ventilation_has_heat_recovery(new_room):
-                ideal_air_system.sensible_heat_recovery = self.room_ventilation_sensible_recovery_efficiency(room)
-                ideal_air_system.latent_heat_recovery = self.room_ventilation_latent_recovery_efficiency(room)
-            new_rm_energy_prop.hvac = ideal_air_system
-
-            # -- Remove any Process Loads on the room to ensure that there is no
-            # -- extra load and waste-heating of the space.-
-            new_rm_energy_prop._process_loads = []
-
-            new_rooms_.append(new_room)
+        with perf.phase("set_rooms"):
+            new_rooms_ = []
+            for room, loads in zip(self.rooms, room_loads):
+                new_room = shallow_duplicate_room(room) if self.shallow_copy else room.duplicate()
+                new_rm_energy_prop = getattr(new_room.properties, "energy")  # type: RoomEnergyProperties
+                new_rm_energy_prop.program_type = rv2024_resilience_program
+                new_rm_energy_prop.reset_loads_to_program()
+                new_rm_energy_prop.window_vent_control = modified_vent_control_objects.get(
+                    id(new_rm_energy_prop.window_vent_control), None
+                )
+
+                # -- Re-set the HVAC to be an ideal air system so that we can avoid
+                # -- any problems with fans and HVAC equipment overriding the program loads
+                # -- Make sure to preserve any ERV performance values as well though.
+                hvac_id = "{} Ideal Loads Air System".format(new_rm_energy_prop.host.identifier)
+                ideal_air_system = IdealAirSystem(hvac_id)
+                if loads.sensible_heat_recovery > 0:
+                    ideal_air_system.sensible_heat_recovery = loads.sensible_heat_recovery
+                    ideal_air_system.latent_heat_recovery = loads.latent_heat_recovery
+                new_rm_energy_prop.hvac = ideal_air_system
+
+                # -- Remove any Process Loads on the room to ensure that there is no
+                # -- extra load and waste-heating of the space.-
+                new_rm_energy_prop._process_loads = []
+
+                new_rooms_.append(new_room)
 
         # --------------------------------------------------------------------------------------------------------------
         # -- If the input was a Model, output a Model, otherwise output a list of Rooms
         if not self.model:
             hb_obj_ = new_rooms_
         else:
-            new_model = self.model.duplicate()
-            new_model._rooms = new_rooms_
-            hb_obj_ = new_model
+            with perf.phase("duplicate_model"):
+                hb_obj_ = duplicate_model_with_rooms(self.model, new_rooms_, self.shallow_copy)
 
         return hb_obj_, rv2024_resilience_program
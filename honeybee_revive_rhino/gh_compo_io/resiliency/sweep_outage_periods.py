@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GH-Component Interface: HB-REVIVE - Sweep Resiliency Outage Periods."""
+
+import json
+import os
+
+try:
+    from ladybug.analysisperiod import AnalysisPeriod
+    from ladybug.stat import STAT
+except ImportError as e:
+    raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
+
+try:
+    from honeybee.config import folders as hb_folders
+    from honeybee.model import Model
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from honeybee_energy.load.process import Process
+    from honeybee_energy.programtype import ProgramType
+    from honeybee_energy.simulation.parameter import SimulationParameter
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy:\n\t{}".format(e))
+
+try:
+    from ph_gh_component_io import gh_io, validators
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
+
+try:
+    from ladybug_revive.resiliency_epw import generate_ladybug_epw
+except ImportError as e:
+    raise ImportError("\nFailed to import ladybug_revive:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io._csv_files import csv_line
+    from honeybee_revive_rhino.gh_compo_io.resiliency._weather import OutageWeeks, epw_working_copy, load_epw, load_stat
+    from honeybee_revive_rhino.gh_compo_io.resiliency.set_resiliency_output_variables import (
+        GHCompo_SetResiliencySimulationOutputVariables,
+    )
+    from honeybee_revive_rhino.gh_compo_io.resiliency.set_resiliency_program import GHCompo_SetResiliencyProgram
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+from honeybee_revive_rhino.gh_compo_io import perf
+
+# -- The columns of the sweep's manifest CSV file: one row per variant.
+MANIFEST_COLUMNS = ["name", "hbjson", "epw", "sim_par", "winter_run_period", "summer_run_period"]
+
+# -- The length (in hours) of a Phius REVIVE outage week.
+OUTAGE_WEEK_HOURS = 168
+
+
+def check_outage_week(_season, _week):
+    # type: (str, AnalysisPeriod) -> None
+    """Raise a ValueError if the week cannot be used as an outage period.
+
+    The week must be a full 168-hour week. Its run period adds a day before and after it, so
+    it can not start on January 1st, end on December 31st, or run over the end of the year.
+    """
+    problem = None
+    if _week.is_reversed:
+        problem = "it runs over the end of the year"
+    elif (_week.st_hour, _week.end_hour) != (0, 23):
+        problem = "it must run over whole days, from hour 0 to hour 23"
+    elif len(_week) != OUTAGE_WEEK_HOURS:
+        problem = "it is {} hours long, not a full {}-hour week (7 days, hourly)".format(len(_week), OUTAGE_WEEK_HOURS)
+    elif (_week.st_month, _week.st_day) == (1, 1):
+        problem = "it starts on January 1st, and its run period starts a day before the outage"
+    elif (_week.end_month, _week.end_day) == (12, 31):
+        problem = "it ends on December 31st, and its run period ends a day after the outage"
+
+    if problem:
+        raise ValueError("The {} outage week '{}' can not be used: {}.".format(_season, _week, problem))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# -- GH Interface
+
+
+class GHCompo_SweepResiliencyOutagePeriods(object):
+    """GHCompo Interface: HB-REVIVE - Sweep Resiliency Outage Periods."""
+
+    winter_10yr_dry_bulb_C = validators.UnitDegreeC("winter_10yr_dry_bulb_C")
+    winter_10yr_dew_point_C = validators.UnitDegreeC("winter_10yr_dew_point_C")
+    summer_20yr_dry_bulb_C = validators.UnitDegreeC("summer_20yr_dry_bulb_C")
+    summer_20yr_dew_point_C = validators.UnitDegreeC("summer_20yr_dew_point_C")
+    num_dwellings = validators.IntegerNonZero("num_dwellings")
+
+    def __init__(
+        self,
+        _IGH,
+        _sweep_name,
+        _save_dir,
+        _epw_file,
+        _stat_file,
+        winter_10yr_dry_bulb_C,
+        winter_10yr_dew_point_C,
+        summer_20yr_dry_bulb_C,
+        summer_20yr_dew_point_C,
+        _winter_outage_weeks,
+        _summer_outage_weeks,
+        _hb_model,
+        _num_dwellings,
+        _elec_equip,
+        _program,
+        _run,
+        *args,
+        **kwargs
+    ):
+        # type: (gh_io.IGH, str, str, str, str, float, float, float, float, list[AnalysisPeriod], list[AnalysisPeriod], Model, int, list[Process], ProgramType | None, bool, list, dict) -> None
+        self.IGH = _IGH
+        self.sweep_name = _sweep_name or "resiliency_sweep"
+        self.save_dir = _save_dir or os.path.join(hb_folders.default_simulation_folder, "REVIVE")
+        self.epw_file = _epw_file
+        self.stat_file = _stat_file
+        self.winter_10yr_dry_bulb_C = winter_10yr_dry_bulb_C
+        self.winter_10yr_dew_point_C = winter_10yr_dew_point_C
+        self.summer_20yr_dry_bulb_C = summer_20yr_dry_bulb_C
+        self.summer_20yr_dew_point_C = summer_20yr_dew_point_C
+        self.winter_outage_weeks = [p for p in (_winter_outage_weeks or []) if p]
+        self.summer_outage_weeks = [p for p in (_summer_outage_weeks or []) if p]
+        self.hb_model = _hb_model
+        self.num_dwellings = _num_dwellings
+        self.elec_equip = _elec_equip or []
+        self.program = _program
+        self._run = _run
+
+    @property
+    def sweep_folder_path(self):
+        # type: () -> str
+        return os.path.join(self.save_dir, self.sweep_name)
+
+    @property
+    def manifest_file_path(self):
+        # type: () -> str
+        return os.path.join(self.sweep_folder_path, "manifest.csv")
+
+    @property
+    def sim_par_file_path(self):
+        # type: () -> str
+        return os.path.join(self.sweep_folder_path, "simulation_parameter.json")
+
+    @property
+    def needs_stat_file(self):
+        # type: () -> bool
+        """The STAT file's extreme weeks are only used for a season without any outage weeks of its own."""
+        return not self.winter_outage_weeks or not self.summer_outage_weeks
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        if not self._run or not self.epw_file or not isinstance(self.hb_model, Model):
+            return False
+        if self.needs_stat_file and not self.stat_file:
+            return False
+        if self.num_dwellings is None:
+            return False
+        temperatures = (
+            self.winter_10yr_dry_bulb_C,
+            self.winter_10yr_dew_point_C,
+            self.summer_20yr_dry_bulb_C,
+            self.summer_20yr_dew_point_C,
+        )
+        return all(t is not None for t in temperatures)
+
+    def outage_week_pairs(self, _stat):
+        # type: (STAT | None) -> list[tuple[AnalysisPeriod, AnalysisPeriod]]
+        """Return the (winter, summer) outage week of each variant.
+
+        A season without any weeks uses the STAT file's extreme week, and a season with a single
+        week uses it with every week of the other season. Otherwise the weeks are paired in order.
+        Every week is checked first (see `check_outage_week`).
+        """
+        winter_weeks = self.winter_outage_weeks or [_stat.extreme_cold_week]
+        summer_weeks = self.summer_outage_weeks or [_stat.extreme_hot_week]
+        for week in winter_weeks:
+            check_outage_week("winter", week)
+        for week in summer_weeks:
+            check_outage_week("summer", week)
+        if len(winter_weeks) == 1:
+            winter_weeks = winter_weeks * len(summer_weeks)
+        if len(summer_weeks) == 1:
+            summer_weeks = summer_weeks * len(winter_weeks)
+        if len(winter_weeks) != len(summer_weeks):
+            raise ValueError(
+                "Got {} winter and {} summer outage weeks. Please provide the same number of each "
+                "(or a single week for one of the seasons).".format(len(winter_weeks), len(summer_weeks))
+            )
+        return list(zip(winter_weeks, summer_weeks))
+
+    def write_sim_par(self):
+        # type: () -> str
+        """Write the SimulationParameter (with the resiliency output variables) shared by every variant."""
+        sim_output = GHCompo_SetResiliencySimulationOutputVariables(self.IGH, None).run()
+        with open(self.sim_par_file_path, "w") as fp:
+            json.dump(SimulationParameter(output=sim_output).to_dict(), fp)
+        return self.sim_par_file_path
+
+    def write_manifest(self, _rows):
+        # type: (list[tuple[str, ...]]) -> str
+        """Write the manifest CSV file, one row per variant, for a (parallel) simulation runner."""
+        lines = [csv_line(MANIFEST_COLUMNS)] + [csv_line(row) for row in _rows]
+        with open(self.manifest_file_path, "w") as fp:
+            fp.write("\n".join(lines) + "\n")
+        return self.manifest_file_path
+
+    @perf.instrument
+    def run(self):
+        # type: () -> tuple[str | None, list[str], list[AnalysisPeriod], list[AnalysisPeriod], list[Model]]
+        if not self.ready:
+            msg = "Please provide all the required inputs and set '_run' to 'True'."
+            self.IGH.warning(msg)
+            print(msg)
+            return (None, [], [], [], [])
+
+        # --------------------------------------------------------------------------------------------------------------
+        # -- Load the weather data once, for all of the variants
+        print("Loading the EPW file: {}".format(self.epw_file))
+        with perf.phase("load_weather"):
+            base_epw = load_epw(self.epw_file)
+            stat = load_stat(self.stat_file) if self.needs_stat_file else None
+            try:
+                outage_week_pairs = self.outage_week_pairs(stat)
+            except ValueError as e:
+                self.IGH.error(str(e))
+                return (None, [], [], [], [])
+            base_epw_name = os.path.basename(str(base_epw.file_path))
+
+        if not os.path.isdir(self.sweep_folder_path):
+            print("Creating folder: {}".format(self.sweep_folder_path))
+            os.makedirs(self.sweep_folder_path)
+        sim_par_file_path = self.write_sim_par()
+
+        # --------------------------------------------------------------------------------------------------------------
+        # -- Build each variant: its resiliency EPW and the model with the resiliency program for its periods
+        manifest_rows = []  # type: list[tuple[str, ...]]
+        epw_files_, winter_run_periods_, summer_run_periods_, hb_models_ = [], [], [], []
+        for i, (winter_week, summer_week) in enumerate(outage_week_pairs, start=1):
+            name = "outage_{:02d}".format(i)
+            print("Variant '{}': winter outage {} | summer outage {}".format(name, winter_week, summer_week))
+            try:
+                with perf.phase("generate_epw"):
+                    new_epw, winter_run_period, summer_run_period = generate_ladybug_epw(
+                        epw_working_copy(base_epw),
+                        OutageWeeks(winter_week, summer_week),
+                        self.winter_10yr_dry_bulb_C,
+                        self.winter_10yr_dew_point_C,
+                        self.summer_20yr_dry_bulb_C,
+                        self.summer_20yr_dew_point_C,
+                    )
+            except ValueError as e:
+                self.IGH.error("Variant '{}' was skipped: {}".format(name, e))
+                continue
+
+            variant_folder = os.path.join(self.sweep_folder_path, name)
+            if not os.path.isdir(variant_folder):
+                os.makedirs(variant_folder)
+            epw_file_path = os.path.join(variant_folder, "Phius_REVIVE_2024_{}".format(base_epw_name))
+            with perf.phase("save_epw"):
+                new_epw.save(epw_file_path)
+
+            # -- The variants only change the Rooms' program, so they can share the input model's geometry.
+            with perf.phase("set_program"):
+                hb_model, _ = GHCompo_SetResiliencyProgram(
+                    self.IGH,
+                    [self.hb_model],
+                    self.num_dwellings,
+                    self.elec_equip,
+                    self.program,
+                    winter_run_period,
+                    summer_run_period,
+                    True,
+                ).run()
+            if not hb_model:
+                self.IGH.error("Variant '{}' was skipped: the resiliency program could not be set.".format(name))
+                continue
+
+            with perf.phase("write_hbjson"):
+                hbjson_file_path = hb_model.to_hbjson(name, variant_folder)
+
+            manifest_rows.append(
+                (
+                    name,
+                    hbjson_file_path,
+                    epw_file_path,
+                    sim_par_file_path,
+                    str(winter_run_period),
+                    str(summer_run_period),
+                )
+            )
+            epw_files_.append(epw_file_path)
+            winter_run_periods_.append(winter_run_period)
+            summer_run_periods_.append(summer_run_period)
+            hb_models_.append(hb_model)
+
+        with perf.phase("write_manifest"):
+            manifest_file_path_ = self.write_manifest(manifest_rows)
+        print("Resiliency sweep manifest output to: {}".format(manifest_file_path_))
+
+        return manifest_file_path_, epw_files_, winter_run_periods_, summer_run_periods_, hb_models_
@@ -3,39 +3,84 @@
 
 """Run a Python Subprocess."""
 
-
+import atexit
+import base64
+import collections
+import io
+import itertools
+import json
 import os
 import subprocess
+import threading
+import time
+from contextlib import contextmanager
 
+try:
+    from typing import Any, Callable, Iterator
+except ImportError:
+    pass  # IronPython 2.7
 
-def run_subprocess(commands):
-    # type: (list[str]) -> tuple[bytes, bytes]
-    """Run a python subprocess.Popen, using the supplied commands.
+try:
+    from honeybee.config import folders as hb_folders
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
 
-    Args:
-        commands: A list of the commands to pass to Popen
+try:
+    from honeybee_revive_rhino.gh_compo_io import perf
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
 
-    Returns:
-        tuple:
-            * [0] (bytes): stdout
-            * [1] (bytes): stderr
+
+# -- The Python-3 scripts which live inside this package (run by the Python-3 interpreter, not IronPython)
+PY3_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "py3_scripts")
+WORKER_SCRIPT_PATH = os.path.join(PY3_SCRIPTS_DIR, "worker.py")
+
+# -- Only the last lines of each output stream of a job are kept in memory: the full output is in its log file.
+MAX_OUTPUT_LINES = 1000
+# -- The WARNING / ERROR lines are kept even once they are no longer in the last lines, up to this many.
+MAX_MESSAGE_LINES = 1000
+
+# -- Each job writes its full output to its own log file: only the most recent log files are kept.
+MAX_LOG_FILES = 50
+
+# -- The longest a job may run (in seconds) before its processes are killed, unless it is given its own timeout.
+DEFAULT_JOB_TIMEOUT = 2 * 60 * 60
+
+
+def job_timeout(_minutes):
+    # type: (float | None) -> float | None
+    """Return the job timeout (in seconds) for a component's `_timeout_` input (in minutes).
+
+    None (not connected) gives the `DEFAULT_JOB_TIMEOUT`, and 0 (or less) gives no time limit.
     """
-    # -- Create a new PYTHONHOME to avoid the Rhino-8 issues
+    if _minutes is None:
+        return DEFAULT_JOB_TIMEOUT
+    if float(_minutes) <= 0:
+        return None
+    return float(_minutes) * 60
+
+
+_local = threading.local()
+_log_counter = itertools.count(1)
+_log_counter_lock = threading.Lock()
+
+
+def _subprocess_env():
+    # type: () -> dict[str, str]
+    """Return a copy of the environment with a blank PYTHONHOME to avoid the Rhino-8 issues."""
     CUSTOM_ENV = os.environ.copy()
     CUSTOM_ENV["PYTHONHOME"] = ""
+    return CUSTOM_ENV
 
-    use_shell = True if os.name == "nt" else False
 
-    process = subprocess.Popen(
-        commands,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=use_shell,
-        env=CUSTOM_ENV,
-    )
+def _use_shell():
+    # type: () -> bool
+    return True if os.name == "nt" else False
 
-    stdout, stderr = process.communicate()
 
+def _check_stderr(stderr):
+    # type: (Any) -> None
+    """Raise an Exception if there is anything (other than the known Windows warning) in the stderr."""
     if stderr:
         if "Defaulting to Windows directory." in str(stderr):
             print("WARNING: {}".format(stderr))
@@ -43,7 +88,612 @@ def run_subprocess(commands):
             print(stderr)
             raise Exception(stderr)
 
-    for _ in str(stdout).split("\\n"):
+
+def job_logs_folder():
+    # type: () -> str
+    return os.path.join(hb_folders.default_simulation_folder, "REVIVE", "_logs")
+
+
+def prune_job_logs(_folder, _keep=MAX_LOG_FILES):
+    # type: (str, int) -> None
+    """Remove all but the `_keep` most recent log files from the folder."""
+    try:
+        log_paths = [os.path.join(_folder, name) for name in os.listdir(_folder) if name.endswith(".log")]
+        log_paths.sort(key=os.path.getmtime, reverse=True)
+    except (IOError, OSError):
+        return  # -- ie: a log removed by another process while listing: try again with the next job.
+    for log_path in log_paths[_keep:]:
+        try:
+            os.remove(log_path)
+        except (IOError, OSError):
+            pass  # -- Still open, or already removed by another process.
+
+
+def job_log_file_path(_script_path):
+    # type: (str) -> str
+    """Return a new log file path for the full output of one of the script's jobs.
+
+    The name has the time, the process-id and a job number, so that jobs which run at the same
+    time (ie: a Winter and a Summer output job, or the pipeline's parallel processes) each write
+    their own log. The oldest logs are removed, leaving the `MAX_LOG_FILES` most recent.
+    """
+    with _log_counter_lock:
+        job_number = next(_log_counter)
+    log_name = "{}_{}_{}_{}.log".format(
+        os.path.splitext(os.path.basename(_script_path))[0],
+        time.strftime("%Y%m%d-%H%M%S"),
+        os.getpid(),
+        job_number,
+    )
+    folder = job_logs_folder()
+    if os.path.isdir(folder):
+        prune_job_logs(folder, MAX_LOG_FILES - 1)
+    return os.path.join(folder, log_name)
+
+
+def _message_level(_line):
+    # type: (str) -> str | None
+    if "ERROR:" in _line:
+        return "error"
+    if "WARNING:" in _line:
+        return "warning"
+    return None
+
+
+class _OutputTail(object):
+    """The last lines of one output stream, plus the WARNING / ERROR lines which have already dropped out of it."""
+
+    def __init__(self, _max_lines):
+        # type: (int) -> None
+        self.lines = collections.deque(maxlen=_max_lines)  # type: collections.deque[tuple[int, str]]
+        self.messages = []  # type: list[tuple[int, str]]
+        self.count = 0
+
+    def add(self, _line, _is_message):
+        # type: (str, bool) -> None
+        if _is_message and len(self.messages) < MAX_MESSAGE_LINES:
+            self.messages.append((self.count, _line))
+        self.lines.append((self.count, _line))
+        self.count += 1
+
+    def text(self, _log_file_path):
+        # type: (str | None) -> str
+        if not self.lines:
+            return ""
+        first_kept = self.lines[0][0]
+        text_lines = [line for i, line in self.messages if i < first_kept]
+        if first_kept:
+            text_lines.append(
+                "... ({:,} more lines, the full output is in: '{}')".format(
+                    first_kept - len(text_lines), _log_file_path
+                )
+            )
+        text_lines.extend(line for _, line in self.lines)
+        return "\n".join(text_lines) + "\n"
+
+
+class JobOutput(object):
+    """The stdout / stderr of a Python-3 job, collected line by line while the job runs.
+
+    Every line is written to the job's log file, but only the last `MAX_OUTPUT_LINES` lines of each
+    stream (and its WARNING / ERROR lines) are kept in memory, so a very chatty job does not build
+    up megabytes of text. The WARNING / ERROR lines are also collected in `.warnings` / `.errors`.
+    """
+
+    def __init__(self, _log_file_path=None, _on_output=None, _max_lines=MAX_OUTPUT_LINES):
+        # type: (str | None, Callable[[str], None] | None, int) -> None
+        self.log_file_path = _log_file_path
+        self.warnings = []  # type: list[str]
+        self.errors = []  # type: list[str]
+        self._on_output = _on_output
+        self._stdout = _OutputTail(_max_lines)
+        self._stderr = _OutputTail(_max_lines)
+        self._lock = threading.Lock()  # -- stdout and stderr may be read on different threads
+        self._log_file = self._open_log_file()
+
+    def _open_log_file(self):
+        # type: () -> Any
+        if not self.log_file_path:
+            return None
+        try:
+            folder = os.path.dirname(self.log_file_path)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+            return io.open(self.log_file_path, "w", encoding="utf-8")
+        except (IOError, OSError) as e:
+            print("WARNING: Could not open the log file '{}': {}".format(self.log_file_path, e))
+            return None
+
+    def _add(self, _tail, _line, _log_prefix):
+        # type: (_OutputTail, str, str) -> None
+        level = _message_level(_line)
+        with self._lock:
+            _tail.add(_line, level is not None)
+            if level == "error" and len(self.errors) < MAX_MESSAGE_LINES:
+                self.errors.append(_line)
+            elif level == "warning" and len(self.warnings) < MAX_MESSAGE_LINES:
+                self.warnings.append(_line)
+            if self._log_file:
+                self._write_log_line("{}{}\n".format(_log_prefix, _line))
+
+    def _write_log_line(self, _text):
+        # type: (str) -> None
+        try:
+            self._log_file.write(_text)
+        except (IOError, OSError) as e:
+            # -- The log is only ever a copy of the output: carry on without it.
+            print("WARNING: Could not write to the log file '{}': {}".format(self.log_file_path, e))
+            self.close()
+
+    def add_stdout(self, _line):
+        # type: (str) -> None
+        line = _line.rstrip("\r\n")
+        if line.startswith(perf.PERF_LINE_PREFIX):
+            perf.pop_perf_lines(line)
+            return
+        self._add(self._stdout, line, "")
+        if self._on_output:
+            self._on_output(line)
+
+    def add_stderr(self, _line):
+        # type: (str) -> None
+        self._add(self._stderr, _line.rstrip("\r\n"), "[stderr] ")
+
+    def stdout(self):
+        # type: () -> str
+        return self._stdout.text(self.log_file_path)
+
+    def stderr(self):
+        # type: () -> str
+        return self._stderr.text(self.log_file_path)
+
+    def close(self):
+        # type: () -> None
+        if self._log_file:
+            self._log_file.close()
+            self._log_file = None
+
+
+def _read_lines(_pipe, _add_line):
+    # type: (Any, Callable[[str], None]) -> None
+    for line in iter(_pipe.readline, b""):
+        _add_line(line.decode("utf-8", "replace"))
+    _pipe.close()
+
+
+def _write_and_close(_pipe, _data):
+    # type: (Any, bytes) -> None
+    try:
+        _pipe.write(_data)
+    except (IOError, OSError):
+        pass  # -- The process exited without reading all of it: its output says why.
+    finally:
+        _pipe.close()
+
+
+def _start_thread(_target, *args):
+    # type: (Callable, Any) -> threading.Thread
+    thread = threading.Thread(target=_target, args=args)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+# -----------------------------------------------------------------------------
+# -- Timeouts, cancelling and process clean-up
+
+
+class JobStopped(Exception):
+    """Raised when a Python-3 job is stopped (and its processes killed) before it finished."""
+
+    def __init__(self, _message):
+        # type: (str) -> None
+        self.message = _message
+        super(JobStopped, self).__init__(self.message)
+
+
+class JobCancelled(JobStopped):
+    """Raised when a Python-3 job is cancelled while it runs (see `cancel_event_scope`)."""
+
+
+class JobTimedOut(JobStopped):
+    """Raised when a Python-3 job runs for longer than its timeout."""
+
+
+@contextmanager
+def cancel_event_scope(_cancel_event):
+    # type: (threading.Event) -> Iterator[None]
+    """Cancel the jobs run on this thread inside the context (and kill their processes) once the event is set."""
+    previous = getattr(_local, "cancel_event", None)
+    _local.cancel_event = _cancel_event
+    try:
+        yield
+    finally:
+        _local.cancel_event = previous
+
+
+def current_cancel_event():
+    # type: () -> threading.Event | None
+    return getattr(_local, "cancel_event", None)
+
+
+def _descendant_pids(_pid):
+    # type: (int) -> list[int]
+    """Return the ids of all the processes started by the process, and by those processes (POSIX only)."""
+    try:
+        output = subprocess.check_output(["pgrep", "-P", str(_pid)])
+    except (subprocess.CalledProcessError, OSError):
+        return []  # -- pgrep exits with 1 when the process has no children
+    pids = []
+    for child_pid in output.split():
+        pids.append(int(child_pid))
+        pids.extend(_descendant_pids(int(child_pid)))
+    return pids
+
+
+def kill_process_tree(_process):
+    # type: (subprocess.Popen) -> None
+    """Kill the process and every process it started (ie: a batch job's process pool), so none are left running."""
+    if _process.poll() is not None:
+        return
+
+    try:
+        if os.name == "nt":
+            with open(os.devnull, "w") as devnull:
+                subprocess.call(["taskkill", "/F", "/T", "/PID", str(_process.pid)], stdout=devnull, stderr=devnull)
+        else:
+            # -- All at once, so the process cannot start new children while they are being killed.
+            pids = [_process.pid] + _descendant_pids(_process.pid)
+            subprocess.call(["kill", "-KILL"] + [str(pid) for pid in pids])
+    except OSError as e:
+        print("WARNING: Could not kill the processes started by process {}: {}".format(_process.pid, e))
+    finally:
+        if _process.poll() is None:
+            _process.kill()
+        _process.wait()
+
+
+class _JobWatchdog(object):
+    """Kills the process (tree) running a job if the job is cancelled, or runs past its timeout."""
+
+    POLL_SECONDS = 0.25
+
+    def __init__(self, _process, _timeout=None, _cancel_event=None):
+        # type: (subprocess.Popen, float | None, threading.Event | None) -> None
+        self.process = _process
+        self.timeout = _timeout
+        self.cancel_event = _cancel_event
+        self.stopped_by = None  # type: type[JobStopped] | None
+        self._start = time.time()
+        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        if _timeout or _cancel_event:
+            _start_thread(self._watch)
+
+    def _reason_to_stop(self):
+        # type: () -> type[JobStopped] | None
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            return JobCancelled
+        if self.timeout and time.time() - self._start > self.timeout:
+            return JobTimedOut
+        return None
+
+    def _watch(self):
+        # type: () -> None
+        while not self._finished.wait(self.POLL_SECONDS):
+            with self._lock:
+                if self._finished.is_set():
+                    return
+                self.stopped_by = self._reason_to_stop()
+                if self.stopped_by:
+                    kill_process_tree(self.process)
+                    return
+
+    def finish(self):
+        # type: () -> None
+        """Stop watching. Once this returns, the process will not be killed by the watchdog."""
+        with self._lock:
+            self._finished.set()
+
+    def raise_if_stopped(self, _script_path):
+        # type: (str) -> None
+        script_name = os.path.basename(_script_path)
+        if self.stopped_by is JobCancelled:
+            raise JobCancelled("The Python-3 job '{}' was cancelled.".format(script_name))
+        if self.stopped_by is JobTimedOut:
+            raise JobTimedOut(
+                "The Python-3 job '{}' did not finish within {:,.0f} seconds and was stopped.".format(
+                    script_name, self.timeout
+                )
+            )
+
+
+def run_subprocess(commands, _stdin=None, _on_output=None, _timeout=DEFAULT_JOB_TIMEOUT):
+    # type: (list[str], bytes | None, Callable[[str], None] | None, float | None) -> tuple[str, str]
+    """Run a python subprocess.Popen, using the supplied commands.
+
+    The output is read line by line as it is written (see `JobOutput`): the full output goes to the
+    script's log file (see `job_log_file_path`) and only its last lines are returned. The process
+    (and any process it started) is killed if it runs past the `_timeout`, or if the job is cancelled
+    (see `cancel_event_scope`).
+
+    Args:
+        commands: A list of the commands to pass to Popen
+        _stdin: Optional, data to send to the process's stdin.
+        _on_output: Optional, called with each line of the process's stdout while it runs.
+        _timeout: Optional, the most seconds the process may run for (None for no limit).
+
+    Returns:
+        tuple:
+            * [0] (str): stdout
+            * [1] (str): stderr
+    """
+    output = JobOutput(job_log_file_path(commands[1] if len(commands) > 1 else commands[0]), _on_output)
+    try:
+        with perf.phase("subprocess"):
+            process = subprocess.Popen(
+                commands,
+                stdin=subprocess.PIPE if _stdin is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                shell=_use_shell(),
+                env=_subprocess_env(),
+            )
+            watchdog = _JobWatchdog(process, _timeout, current_cancel_event())
+            try:
+                # -- stderr (and stdin) on their own threads, so neither pipe can fill up and block the process.
+                threads = [_start_thread(_read_lines, process.stderr, output.add_stderr)]
+                if _stdin is not None:
+                    threads.append(_start_thread(_write_and_close, process.stdin, _stdin))
+                _read_lines(process.stdout, output.add_stdout)
+                for thread in threads:
+                    thread.join()
+                process.wait()
+            finally:
+                watchdog.finish()
+    finally:
+        output.close()
+    watchdog.raise_if_stopped(commands[1] if len(commands) > 1 else commands[0])
+
+    stdout, stderr = output.stdout(), output.stderr()
+    _check_stderr(stderr)
+
+    for _ in stdout.splitlines():
+        print(_)
+
+    return stdout, stderr
+
+
+# -----------------------------------------------------------------------------
+# -- Persistent Python-3 Worker
+
+
+class PythonWorkerCrashed(Exception):
+    """Raised when the worker process exits (or stops responding) in the middle of a job."""
+
+    def __init__(self, _output):
+        # type: (str) -> None
+        self.message = "The Python-3 worker process exited unexpectedly:\n{}".format(_output)
+        super(PythonWorkerCrashed, self).__init__(self.message)
+
+
+class PythonWorker(object):
+    """A long-lived Python-3 interpreter which runs the REVIVE Python-3 scripts sent to it.
+
+    Starting a new Python-3 interpreter for every job means re-importing pandas, plotly,
+    honeybee and ph_adorb every time, which often costs more than the job itself. The worker
+    is started once, and then each job (a script path plus its command-line arguments) is sent
+    over stdin as a single JSON line. See `py3_scripts/worker.py` for the protocol.
+
+    The worker runs one job at a time: a job sent from another thread (ie: a background job,
+    see `background_jobs.py`) waits until the current one is finished. A job cannot be stopped
+    part way through inside the worker, so a job which is cancelled or runs past its timeout
+    kills the worker (and any process it started). The next job starts a new one.
+    """
+
+    RESPONSE_PREFIX = "@@HBRV-WORKER@@ "
+    OUTPUT_PREFIX = "@@HBRV-WORKER-OUTPUT@@ "
+    STDERR_PREFIX = "@@HBRV-WORKER-STDERR@@ "
+
+    # -- How long (in seconds) the worker is given to exit when it is asked to shut down, before it is killed.
+    SHUTDOWN_SECONDS = 2.0
+
+    def __init__(self, _python_exe_path, _worker_script_path=WORKER_SCRIPT_PATH):
+        # type: (str, str) -> None
+        self.python_exe_path = _python_exe_path
+        self.worker_script_path = _worker_script_path
+        self._process = None  # type: subprocess.Popen | None
+        self._job_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self):
+        # type: () -> bool
+        """Return True if the worker process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        # type: () -> None
+        """Start up a new worker process."""
+        assert os.path.isfile(self.worker_script_path), "No Python file to run found at: {}".format(
+            self.worker_script_path
+        )
+        print("Starting Python-3 worker: '{}' '{}'".format(self.python_exe_path, self.worker_script_path))
+        with perf.phase("worker.start"):
+            self._process = subprocess.Popen(
+                [self.python_exe_path, "-u", self.worker_script_path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                shell=_use_shell(),
+                env=_subprocess_env(),
+            )
+
+    def stop(self):
+        # type: () -> None
+        """Shut down the worker process, if it is running.
+
+        The worker is asked to shut down, and is killed (with anything it started) if it has not
+        exited within `SHUTDOWN_SECONDS`, so that closing Rhino is never held up by a busy worker.
+        """
+        if self._process is None:
+            return
+
+        if self.is_running:
+            try:
+                self._process.stdin.write(json.dumps({"command": "shutdown"}) + "\n")
+                self._process.stdin.flush()
+                self._process.stdin.close()
+            except Exception:
+                pass  # -- It will be killed below.
+            deadline = time.time() + self.SHUTDOWN_SECONDS
+            while self._process.poll() is None and time.time() < deadline:
+                time.sleep(0.05)
+            kill_process_tree(self._process)
+        self._process = None
+
+    def _send(self, _job, _output):
+        # type: (dict, JobOutput) -> dict
+        """Send a single (streamed) job to the worker process and wait for its response.
+
+        Each line the script prints is added to the `_output` as it is printed.
+        """
+        if not self._process:
+            raise PythonWorkerCrashed("The worker process is not running.")
+
+        try:
+            self._process.stdin.write(json.dumps(_job) + "\n")
+            self._process.stdin.flush()
+        except (IOError, OSError, ValueError) as e:
+            raise PythonWorkerCrashed(str(e))
+
+        while True:
+            line = self._process.stdout.readline()
+            if not line:
+                raise PythonWorkerCrashed(_output.stdout())
+            if line.startswith(self.RESPONSE_PREFIX):
+                return json.loads(line[len(self.RESPONSE_PREFIX) :])
+            if line.startswith(self.OUTPUT_PREFIX):
+                _output.add_stdout(json.loads(line[len(self.OUTPUT_PREFIX) :]))
+            elif line.startswith(self.STDERR_PREFIX):
+                _output.add_stderr(json.loads(line[len(self.STDERR_PREFIX) :]))
+            else:
+                # -- Written outside the protocol (ie: directly to the file-handle by a C-extension).
+                _output.add_stdout(line)
+
+    def run(self, _script_path, _args, _on_output=None, _stdin=None, _log_file_path=None, _timeout=None):
+        # type: (str, list[str], Callable[[str], None] | None, bytes | None, str | None, float | None) -> dict
+        """Run a Python-3 script in the worker. Re-starts the worker (once) if it has crashed.
+
+        The script's output is streamed back line by line (see `JobOutput`): the full output goes to
+        the `_log_file_path` and only its last lines (and its WARNING / ERROR lines) are returned.
+
+        Args:
+            _script_path: The path to the Python-3 script to run.
+            _args: The command-line arguments to pass to the script.
+            _on_output: Optional, called with each line of the script's stdout while it runs.
+            _stdin: Optional, data for the script to read from its stdin.
+            _log_file_path: Optional, the file to write the script's full output to.
+            _timeout: Optional, the most seconds the job may run for (None for no limit).
+
+        Returns:
+            dict: The job response with the "stdout", "stderr" and "exit_code" of the script, and
+                the "warnings" / "errors" lines found in its output.
+
+        Raises:
+            JobCancelled: If the job was cancelled (see `cancel_event_scope`).
+            JobTimedOut: If the job ran for longer than the `_timeout`.
+        """
+        cancel_event = current_cancel_event()
+        with self._lock:
+            if cancel_event is not None and cancel_event.is_set():
+                raise JobCancelled("The Python-3 job '{}' was cancelled.".format(os.path.basename(_script_path)))
+            self._job_id += 1
+            job = {"id": self._job_id, "script": _script_path, "args": [str(a) for a in _args], "stream": True}
+            if _stdin is not None:
+                job["stdin"] = base64.b64encode(_stdin).decode("ascii")
+
+            for attempt in range(2):
+                if not self.is_running:
+                    self.start()
+                output = JobOutput(_log_file_path, _on_output)
+                watchdog = _JobWatchdog(self._process, _timeout, cancel_event)
+                try:
+                    response = self._send(job, output)
+                except PythonWorkerCrashed as e:
+                    watchdog.finish()
+                    self.stop()
+                    watchdog.raise_if_stopped(_script_path)  # -- Killed on purpose: do not re-try it.
+                    if attempt > 0:
+                        raise
+                    print("WARNING: {} Re-starting the worker...".format(e.message))
+                    continue
+                finally:
+                    watchdog.finish()
+                    output.close()
+
+                response["stdout"] = output.stdout() + response["stdout"]
+                response["stderr"] = output.stderr() + response["stderr"]
+                response["warnings"], response["errors"] = output.warnings, output.errors
+                return response
+
+            raise PythonWorkerCrashed("Failed to run the job: {}".format(job))
+
+
+# -- One worker per Python-3 interpreter, kept alive for the whole Rhino session.
+_WORKERS = {}  # type: dict[str, PythonWorker]
+_WORKERS_LOCK = threading.Lock()
+
+
+def get_worker(_python_exe_path):
+    # type: (str) -> PythonWorker
+    """Return the session's PythonWorker for the interpreter, creating it if needed."""
+    with _WORKERS_LOCK:
+        if _python_exe_path not in _WORKERS:
+            _WORKERS[_python_exe_path] = PythonWorker(_python_exe_path)
+        return _WORKERS[_python_exe_path]
+
+
+@atexit.register
+def stop_workers():
+    # type: () -> None
+    """Shut down every worker process (and anything they started), ie: when Rhino is closed."""
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+    for worker in workers:
+        worker.stop()
+
+
+def run_subprocess_in_worker(commands, _on_output=None, _stdin=None, _timeout=DEFAULT_JOB_TIMEOUT):
+    # type: (list[str], Callable[[str], None] | None, bytes | None, float | None) -> tuple[str, str]
+    """Run a Python-3 script in the session's persistent worker process.
+
+    Takes the same commands as `run_subprocess` and behaves the same way, except that the
+    Python-3 interpreter is only started once and then re-used for each following job.
+
+    Args:
+        commands: A list of the commands: [python-interpreter, python-script, *script-arguments]
+        _on_output: Optional, called with each line of the script's stdout while it runs.
+        _stdin: Optional, data for the script to read from its stdin.
+        _timeout: Optional, the most seconds the job may run for (None for no limit).
+
+    Returns:
+        tuple:
+            * [0] (str): stdout
+            * [1] (str): stderr
+    """
+    python_exe_path, script_path, args = commands[0], commands[1], commands[2:]
+    with perf.phase("worker.job"):
+        response = get_worker(python_exe_path).run(
+            script_path, args, _on_output, _stdin, job_log_file_path(script_path), _timeout
+        )
+        stdout, stderr = perf.pop_perf_lines(response["stdout"]), response["stderr"]
+    if response["exit_code"] and not stderr:
+        stderr = "The script '{}' exited with code: {}".format(script_path, response["exit_code"])
+    _check_stderr(stderr)
+
+    for _ in stdout.splitlines():
         print(_)
 
     return stdout, stderr
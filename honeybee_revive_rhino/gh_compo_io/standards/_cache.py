@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""UTILITY: A session-wide, in-memory cache of the objects loaded from the Honeybee-REVIVE standards library.
+
+Each entry is keyed on the file (or folder) path and is re-loaded only when the source file's
+modified-time or size changes, so repeat solves in a Rhino session do no JSON parsing at all.
+
+The cached objects are shared: never hand them out directly. Use the `duplicate_*` functions
+(or the object's own `.duplicate()`) before returning anything to the Grasshopper canvas.
+"""
+
+import os
+
+try:
+    from typing import Any, Callable
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_energy.load.process import Process
+    from honeybee_energy.programtype import ProgramType
+    from honeybee_energy.schedule.ruleset import ScheduleRuleset
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy:\n\t{}".format(e))
+
+try:
+    from honeybee_revive.CO2_measures import CO2ReductionMeasure
+    from honeybee_revive.grid_region import GridRegion
+    from honeybee_revive.national_emissions import NationalEmissionsFactors
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_standards.appliances._load_appliances import load_abridged_appliances_from_json_file
+    from honeybee_revive_standards.CO2_measures._load_CO2_measures import load_CO2_measures_from_json_file
+    from honeybee_revive_standards.national_emission_factors._load_national_emissions import (
+        load_national_emissions_from_json_file,
+    )
+    from honeybee_revive_standards.programtypes._load_programs import load_programs_from_json_file
+    from honeybee_revive_standards.schedules._load_schedules import load_schedules_from_json_file
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_standards:\n\t{}".format(e))
+
+try:
+    from honeybee_revive_rhino.gh_compo_io.standards._cambium import load_grid_region_header
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
+
+# -- {(kind, path): (signature, loaded-object)}
+_CACHE = {}  # type: dict[tuple[str, str], tuple[Any, Any]]
+
+
+def clear():
+    # type: () -> None
+    """Remove everything from the cache."""
+    _CACHE.clear()
+
+
+# -----------------------------------------------------------------------------
+# -- Signatures
+
+
+def file_signature(_file_path):
+    # type: (str) -> tuple[float, int]
+    """Return the (modified-time, size) of a file."""
+    stat = os.stat(_file_path)
+    return (stat.st_mtime, stat.st_size)
+
+
+def json_files(_dir):
+    # type: (str) -> list[str]
+    """Return the full paths of all the JSON files in a directory, in name order."""
+    return [os.path.join(_dir, f) for f in sorted(os.listdir(_dir)) if f.endswith(".json")]
+
+
+def dir_signature(_dir):
+    # type: (str) -> tuple
+    """Return the signature of every JSON file in a directory, so that any added, removed or edited file is noticed."""
+    return tuple((path, file_signature(path)) for path in json_files(_dir))
+
+
+def _get(_kind, _path, _signature, _loader):
+    # type: (str, str, Any, Callable[[], Any]) -> Any
+    """Return the cached object, (re)loading it if it is missing or its source has changed."""
+    key = (_kind, os.path.abspath(_path))
+    entry = _CACHE.get(key)
+    if entry is None or entry[0] != _signature:
+        entry = (_signature, _loader())
+        _CACHE[key] = entry
+    return entry[1]
+
+
+# -----------------------------------------------------------------------------
+# -- Cached loaders (return the shared objects: do not modify or output them)
+
+
+def schedules(_schedules_dir):
+    # type: (str) -> dict[str, ScheduleRuleset]
+    """Return all of the ScheduleRulesets from the JSON files in the directory."""
+
+    def _load():
+        schedules_dict = {}
+        for path in json_files(_schedules_dir):
+            schedules_dict.update(load_schedules_from_json_file(path))
+        return schedules_dict
+
+    return _get("schedules", _schedules_dir, dir_signature(_schedules_dir), _load)
+
+
+def programs(_programs_dir, _schedules_dir):
+    # type: (str, str) -> dict[str, ProgramType]
+    """Return all of the ProgramTypes from the JSON files in the directory, built with the standard schedules."""
+
+    def _load():
+        schedules_dict = schedules(_schedules_dir)
+        programs_dict = {}
+        for path in json_files(_programs_dir):
+            programs_dict.update(load_programs_from_json_file(path, _schedules_dict=schedules_dict))
+        return programs_dict
+
+    # -- The Programs hold the Schedules, so must be re-built if either changes
+    signature = (dir_signature(_programs_dir), dir_signature(_schedules_dir))
+    return _get("programs", _programs_dir, signature, _load)
+
+
+def appliances(_appliances_dir, _schedules_dir):
+    # type: (str, str) -> list[dict[str, Process]]
+    """Return the Appliances (Process loads) from each JSON file in the directory (one dict per file, by display-name).
+
+    The files are kept separate (in name order) so that an Appliance with the same name in two files is not lost.
+    """
+
+    def _load():
+        schedules_dict = schedules(_schedules_dir)
+        return [
+            load_abridged_appliances_from_json_file(path, _schedules_dict=schedules_dict)
+            for path in json_files(_appliances_dir)
+        ]
+
+    signature = (dir_signature(_appliances_dir), dir_signature(_schedules_dir))
+    return _get("appliances", _appliances_dir, signature, _load)
+
+
+def CO2_measures(_measures_dir):
+    # type: (str) -> list[dict[str, CO2ReductionMeasure]]
+    """Return the CO2-Reduction-Measures from each JSON file in the directory (one dict per file, by name).
+
+    The files are kept separate (in name order) so that a Measure with the same name in two files is not lost.
+    """
+
+    def _load():
+        return [load_CO2_measures_from_json_file(path) for path in json_files(_measures_dir)]
+
+    return _get("CO2_measures", _measures_dir, dir_signature(_measures_dir), _load)
+
+
+def national_emissions(_file_path):
+    # type: (str) -> dict[str, NationalEmissionsFactors]
+    """Return the National-Emissions-Factors from the JSON file, by country-name."""
+    return _get(
+        "national_emissions",
+        _file_path,
+        file_signature(_file_path),
+        lambda: load_national_emissions_from_json_file(_file_path),
+    )
+
+
+def grid_region(_file_path):
+    # type: (str) -> GridRegion
+    """Return the GridRegion from the Cambium JSON file (only the header of the file is read)."""
+    return _get(
+        "grid_region",
+        _file_path,
+        file_signature(_file_path),
+        lambda: load_grid_region_header(_file_path),
+    )
+
+
+# -----------------------------------------------------------------------------
+# -- Independent copies, safe to modify and output
+
+
+def duplicate_program(_program):
+    # type: (ProgramType) -> ProgramType
+    """Return a copy of the Program which does not share any Schedules with the cached one.
+
+    `ProgramType.duplicate()` is not enough: the new loads still point at the same Schedule
+    objects, and adding rules to those (ie: the Resiliency setpoints) would change the cache.
+    """
+    schedules_dict = {s.identifier: s.duplicate() for s in _program.schedules_unique}
+    return ProgramType.from_dict_abridged(_program.to_dict(abridged=True), schedules_dict)
+
+
+def duplicate_process(_process):
+    # type: (Process) -> Process
+    """Return a copy of the Process load with its own copy of the Schedule."""
+    new_process = _process.duplicate()
+    new_process.schedule = _process.schedule.duplicate()
+    return new_process
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""UTILITY: Find and load the Cambium Grid-Region files without parsing their (~10 MB) hourly CO2-factor tables.
+
+The Grasshopper side only needs the GridRegion header (name, code, description) and the
+file-path: the hourly factors are read later, on the Python-3 side, by ph_adorb. Each Cambium
+file starts with the header fields, so only the first few KB of the file are read here.
+
+The region-name -> file index is saved to disk and re-built only when a file in the
+Cambium folder is added, removed or changed.
+"""
+
+import json
+import os
+
+try:
+    from typing import Any
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from honeybee_revive.grid_region import GridRegion
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive:\n\t{}".format(e))
+
+
+INDEX_VERSION = 1
+HEADER_FIELDS = ("region_name", "region_code", "description")
+HEADER_READ_SIZE = 4096  # bytes
+
+# -- {cambium-dir: index-dict}, for this session
+_INDEXES = {}  # type: dict[str, dict[str, Any]]
+
+
+def _index_file_path(_cambium_dir):
+    # type: (str) -> str
+    """Return the path of the saved index file for a Cambium folder."""
+    folder_name = os.path.basename(os.path.normpath(_cambium_dir))
+    return os.path.join(hb_folders.default_simulation_folder, "REVIVE", "_cache", "{}_index.json".format(folder_name))
+
+
+# -----------------------------------------------------------------------------
+# -- Header
+
+
+def read_grid_region_header(_filepath):
+    # type: (str) -> dict[str, str]
+    """Read the GridRegion header fields from the start of a Cambium JSON file.
+
+    ### Arguments:
+        * _filepath: The path to the Cambium JSON file.
+
+    ### Returns:
+        * dict[str, str]: The "region_name", "region_code" and "description" values.
+    """
+    with open(_filepath, "r") as f:
+        prefix = f.read(HEADER_READ_SIZE)
+
+    # -- Close the JSON object just before the factors and parse only the header
+    i = prefix.find('"hourly_CO2_factors"')
+    if i > 0:
+        try:
+            header = json.loads(prefix[:i].rstrip().rstrip(",") + "}")
+            if all(k in header for k in HEADER_FIELDS):
+                return {k: header[k] for k in HEADER_FIELDS}
+        except ValueError:
+            pass
+
+    # -- The file is not laid out as expected (ie: the factors come first), so read the whole thing.
+    with open(_filepath, "r") as f:
+        data = json.load(f)
+    return {k: data[k] for k in HEADER_FIELDS}
+
+
+def load_grid_region_header(_filepath):
+    # type: (str) -> GridRegion
+    """Load a GridRegion object from a Cambium JSON file, reading only the header of the file."""
+    if not os.path.isfile(_filepath):
+        raise ValueError("File does not exist: {}".format(_filepath))
+
+    header = read_grid_region_header(_filepath)
+    return GridRegion(header["region_name"], header["region_code"], header["description"], _filepath)
+
+
+# -----------------------------------------------------------------------------
+# -- Index
+
+
+def _dir_signature(_cambium_dir):
+    # type: (str) -> list[list]
+    """Return the [relative-path, mtime, size] of every JSON file in the folder (and sub-folders)."""
+    signature = []
+    for root, dirs, files in os.walk(_cambium_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(root, filename)
+            stat = os.stat(path)
+            signature.append([os.path.relpath(path, _cambium_dir), stat.st_mtime, stat.st_size])
+    return signature
+
+
+def build_index(_cambium_dir):
+    # type: (str) -> dict[str, Any]
+    """Build the index of every Grid-Region file in the folder.
+
+    ### Arguments:
+        * _cambium_dir: The folder with the Cambium JSON files.
+
+    ### Returns:
+        * dict: {"version": int, "signature": list, "regions": {file-name: {"path": str, <header-fields>}}}
+    """
+    signature = _dir_signature(_cambium_dir)
+    regions = {}
+    for rel_path, _, _ in signature:
+        path = os.path.join(_cambium_dir, rel_path)
+        region = read_grid_region_header(path)
+        region["path"] = path
+        regions[os.path.basename(rel_path)] = region
+    return {"version": INDEX_VERSION, "signature": signature, "regions": regions}
+
+
+def _read_saved_index(_cambium_dir):
+    # type: (str) -> dict[str, Any] | None
+    index_path = _index_file_path(_cambium_dir)
+    if not os.path.isfile(index_path):
+        return None
+    try:
+        with open(index_path, "r") as f:
+            return json.load(f)
+    except ValueError:
+        return None
+
+
+def _save_index(_cambium_dir, _index):
+    # type: (str, dict[str, Any]) -> None
+    index_path = _index_file_path(_cambium_dir)
+    try:
+        if not os.path.isdir(os.path.dirname(index_path)):
+            os.makedirs(os.path.dirname(index_path))
+        with open(index_path, "w") as f:
+            json.dump(_index, f)
+    except (IOError, OSError) as e:
+        # -- Not being able to save the index only costs time on the next Rhino session.
+        print("Failed to save the Grid-Region index to: {}\n\t{}".format(index_path, e))
+
+
+def get_index(_cambium_dir):
+    # type: (str) -> dict[str, Any]
+    """Return the (up to date) Grid-Region index for the folder, loading or re-building it as needed."""
+    signature = _dir_signature(_cambium_dir)
+
+    index = _INDEXES.get(_cambium_dir) or _read_saved_index(_cambium_dir)
+    if not index or index.get("version") != INDEX_VERSION or index.get("signature") != signature:
+        print("Building the Grid-Region index for: {}".format(_cambium_dir))
+        index = build_index(_cambium_dir)
+        _save_index(_cambium_dir, index)
+
+    _INDEXES[_cambium_dir] = index
+    return index
+
+
+def find_grid_region_file(_cambium_dir, _region_file_name):
+    # type: (str, str) -> str | None
+    """Return the path to the Grid-Region JSON file with the given file-name (ie: 'AZNMc.json'), or None."""
+    region = get_index(_cambium_dir)["regions"].get(_region_file_name)
+    if not region:
+        return None
+    return region["path"]
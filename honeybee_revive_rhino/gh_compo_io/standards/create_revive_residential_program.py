@@ -25,6 +25,8 @@ try:
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 def calc_mel_kWh_yr(_number_dwellings, _floor_area_ft2, _number_bedrooms, _phius_resnet_fraction=0.8):
     # type: (int, float, int, float) -> float
@@ -181,6 +183,7 @@ class GHCompo_CreateReviveResidentialProgram(object):
             return False
         return True
 
+    @perf.instrument
     def run(self):
         # type: () -> None | ProgramType
 
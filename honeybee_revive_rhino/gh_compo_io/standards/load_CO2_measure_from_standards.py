@@ -12,15 +12,21 @@ except ImportError:
 
 try:
     from honeybee_revive_standards import CO2_measures
-    from honeybee_revive_standards.CO2_measures._load_CO2_measures import load_CO2_measures_from_json_file
 except ImportError:
     raise ImportError("\nFailed to import honeybee_revive_standards")
 
+try:
+    from honeybee_revive_rhino.gh_compo_io.standards import _cache
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
 try:
     from ph_gh_component_io import gh_io
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_LoadCO2ReductionMeasure(object):
 
@@ -29,22 +35,17 @@ class GHCompo_LoadCO2ReductionMeasure(object):
         self.IGH = _IGH
         self.measure_names = _measure_names
 
+    @perf.instrument
     def run(self):
         # type: () -> list[CO2ReductionMeasure]
         measures_ = []  # type: list[CO2ReductionMeasure]
         # 1) -- Search through the honeybee_revive standards
-        revive_measures_directory = os.path.dirname(CO2_measures.__file__)
-        for f in sorted(os.listdir(revive_measures_directory)):
-            if not f.endswith(".json"):
-                continue
-
-            loaded_measures = load_CO2_measures_from_json_file(os.path.join(revive_measures_directory, f))
-
-            for appliance_name in self.measure_names:
-                measure = loaded_measures.get(appliance_name, None)
+        for loaded_measures in _cache.CO2_measures(os.path.dirname(CO2_measures.__file__)):
+            for measure_name in self.measure_names:
+                measure = loaded_measures.get(measure_name, None)
 
                 if measure:
-                    measures_.append(measure)
+                    measures_.append(measure.duplicate())
 
         # 2) -- Search through the LBT standards
         # TODO: Implement this part...
@@ -12,16 +12,21 @@ except ImportError:
 
 try:
     from honeybee_revive_standards import appliances, schedules
-    from honeybee_revive_standards.appliances._load_appliances import load_abridged_appliances_from_json_file
-    from honeybee_revive_standards.schedules._load_schedules import load_schedules_from_json_file
 except ImportError:
     raise ImportError("\nFailed to import honeybee_revive_standards")
 
+try:
+    from honeybee_revive_rhino.gh_compo_io.standards import _cache
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_revive_rhino:\n\t{}".format(e))
+
 try:
     from ph_gh_component_io import gh_io
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 class GHCompo_LoadReviveApplianceFromStandardsLibrary(object):
 
@@ -30,36 +35,21 @@ class GHCompo_LoadReviveApplianceFromStandardsLibrary(object):
         self.IGH = _IGH
         self.appliance_names = _appliance_names
 
+    @perf.instrument
     def run(self):
         # type: () -> list[Process]
 
-        # 1)-- Build all the Schedules from the standards
-        schedules_dict = {}
-        revive_schedules_directory = os.path.dirname(schedules.__file__)
-        for schedule_filename in sorted(os.listdir(revive_schedules_directory)):
-            if not schedule_filename.endswith(".json"):
-                continue
-            schedules_dict.update(
-                load_schedules_from_json_file(os.path.join(revive_schedules_directory, schedule_filename))
-            )
-
-        # 2) -- Search through the Appliances (Process) from the standards
+        # 1) -- Search through the Appliances (Process) from the standards (loaded with their Schedules)
         appliances_ = []  # type: list[Process]
-        revive_appliances_directory = os.path.dirname(appliances.__file__)
-        for appliance_filename in sorted(os.listdir(revive_appliances_directory)):
-            if not appliance_filename.endswith(".json"):
-                continue
-
-            loaded_appliances = load_abridged_appliances_from_json_file(
-                os.path.join(revive_appliances_directory, appliance_filename),
-                _schedules_dict=schedules_dict,
-            )
-
+        for loaded_appliances in _cache.appliances(
+            os.path.dirname(appliances.__file__),
+            os.path.dirname(schedules.__file__),
+        ):
             for appliance_name in self.appliance_names:
                 json_appliance = loaded_appliances.get(appliance_name, None)
 
                 if json_appliance:
-                    appliances_.append(json_appliance)
+                    appliances_.append(_cache.duplicate_process(json_appliance))
 
         # 2) -- Search through the LBT standards
         # TODO: Implement this part...
@@ -27,6 +27,8 @@ try:
 except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
+from honeybee_revive_rhino.gh_compo_io import perf
+
 
 def names_match(_name_1, _name_2):
     # type: (str, str) -> bool
@@ -44,6 +46,7 @@ class GHCompo_LoadProgramFromStandards(object):
         self.standards_dir = _standards_dir or os.path.dirname(honeybee_revive_standards.__file__)
         self.program_name = _program_name or self.DEFAULT_PROGRAM_NAME
 
+    @perf.instrument
     def run(self):
         # type: () -> ProgramType | None
         if not os.path.exists(self.standards_dir):
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Calculate the ADORB costs for many models at once, in parallel, and write one consolidated results table.
+
+This script is called from the command line with the following arguments:
+    * [0] (str): The path to the Python script (this file).
+    * [1] (str): The path to the manifest CSV file, with a header row and the columns:
+        `hbjson` (the HBJSON or revive-extract file), `sql` (the EnergyPlus SQL file) and,
+        optionally, `name` (defaults to the HBJSON file name).
+    * [2] (str): The folder to write the results to.
+    * [3] (int): Optional, the most models to calculate at the same time. Default: the number of CPUs.
+
+For each model, '<name>_yearly.csv' and '<name>_cumulative.csv' are written to the output folder,
+and everything the calculation printed to 'logs/<name>.log'. The models are calculated by a pool
+of Python processes; a model which fails is recorded as 'failed' in the results table (with its
+error) and the rest of the batch carries on. The results table ('adorb_batch_results.csv') has one
+row per model, in the manifest order, with the total present-value cost of each ADORB column.
+"""
+
+import csv
+import io
+import multiprocessing
+import os
+import sys
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from time import perf_counter
+
+from ph_adorb.from_HBJSON import create_variant, read_HBJSON_file
+from ph_adorb.variant import calc_variant_cumulative_ADORB_costs, calc_variant_yearly_ADORB_costs
+
+import cambium_factors
+import revive_extract
+
+RESULTS_FILE_NAME = "adorb_batch_results.csv"
+COLUMNS = ["pv_direct_energy", "pv_operational_CO2", "pv_direct_MR", "pv_embodied_CO2", "pv_e_trans"]
+RESULTS_FIELDS = ["name", "status", "seconds"] + COLUMNS + ["total", "yearly_csv", "cumulative_csv", "log", "error"]
+
+
+def read_manifest(_manifest_path: Path) -> list[dict[str, str]]:
+    """Return the jobs in the manifest CSV file: a dict with the 'name', 'hbjson' and 'sql' of each model."""
+    with open(_manifest_path, newline="", encoding="utf-8") as manifest_file:
+        rows = list(csv.DictReader(manifest_file))
+
+    jobs = []
+    for row in rows:
+        row = {k.strip().lower(): (v or "").strip() for k, v in row.items() if k}
+        if not row.get("hbjson") or not row.get("sql"):
+            raise ValueError(f"Each manifest row needs an 'hbjson' and a 'sql' file path. Got: {row}")
+        jobs.append({"name": row.get("name") or Path(row["hbjson"]).stem, "hbjson": row["hbjson"], "sql": row["sql"]})
+
+    names = [job["name"] for job in jobs]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Each model in the manifest needs a unique name. Found more than once: {duplicates}")
+    return jobs
+
+
+def calc_model(_hbjson_path: Path, _sql_path: Path, _yearly_csv: Path, _cumulative_csv: Path) -> dict[str, float]:
+    """Calculate and write out one model's ADORB costs. Returns the total (all years) of each column."""
+    for path in (_hbjson_path, _sql_path):
+        if not path.exists():
+            raise FileNotFoundError(f"Cannot find the input file: '{path}'")
+
+    print(f"\t>> Loading the Honeybee-Model from the file: {_hbjson_path}")
+    hb_json_dict = read_HBJSON_file.read_hb_json_from_file(_hbjson_path)
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
+
+    revive_variant = create_variant.get_PhAdorbVariant_from_hb_model(hb_model, _sql_path)
+    yearly_df = calc_variant_yearly_ADORB_costs(revive_variant)
+    cumulative_df = calc_variant_cumulative_ADORB_costs(yearly_df)
+    yearly_df.to_csv(_yearly_csv)
+    cumulative_df.to_csv(_cumulative_csv)
+    print(f"\t>> Saved: '{_yearly_csv}' and '{_cumulative_csv}'")
+
+    totals = {c: float(yearly_df[c].sum()) for c in COLUMNS}
+    totals["total"] = sum(totals.values())
+    return totals
+
+
+def run_job(_job: dict[str, str], _output_folder: str) -> dict:
+    """Run one model of the batch, in a pool process. Never raises: a failure is returned as the row's 'error'."""
+    output_folder = Path(_output_folder)
+    name = _job["name"]
+    result = {
+        "name": name,
+        "status": "ok",
+        "yearly_csv": str(output_folder / f"{name}_yearly.csv"),
+        "cumulative_csv": str(output_folder / f"{name}_cumulative.csv"),
+        "log": str(output_folder / "logs" / f"{name}.log"),
+        "error": "",
+    }
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    start = perf_counter()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            result.update(
+                calc_model(
+                    Path(_job["hbjson"]), Path(_job["sql"]), Path(result["yearly_csv"]), Path(result["cumulative_csv"])
+                )
+            )
+        except Exception as e:
+            traceback.print_exc()
+            result.update(status="failed", yearly_csv="", cumulative_csv="", error=f"{type(e).__name__}: {e}")
+    result["seconds"] = round(perf_counter() - start, 2)
+
+    with open(result["log"], "w", encoding="utf-8") as log_file:
+        log_file.write(f"HBJSON: {_job['hbjson']}\nSQL: {_job['sql']}\n\n-- stdout\n{stdout.getvalue()}")
+        log_file.write(f"\n-- stderr\n{stderr.getvalue()}")
+    return result
+
+
+def _init_pool_process() -> None:
+    cambium_factors.install()
+    revive_extract.install()
+
+
+def run_batch(_jobs: list[dict[str, str]], _output_folder: Path, _max_jobs: int | None = None) -> list[dict]:
+    """Calculate every job in a pool of (at most `_max_jobs`) processes. Returns the result rows in the jobs' order."""
+    (_output_folder / "logs").mkdir(parents=True, exist_ok=True)
+    n_processes = max(1, min(_max_jobs or os.cpu_count() or 1, len(_jobs)))
+    print(f"\t>> Calculating the ADORB costs for {len(_jobs)} models, with {n_processes} processes...")
+
+    # -- 'spawn' on every platform: the pool may be started from a (threaded) worker process.
+    context = multiprocessing.get_context("spawn")
+    results: dict[int, dict] = {}
+    with ProcessPoolExecutor(n_processes, mp_context=context, initializer=_init_pool_process) as pool:
+        futures: dict[Future, int] = {pool.submit(run_job, job, str(_output_folder)): i for i, job in enumerate(_jobs)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # -- The pool process itself died (ie: out of memory).
+                results[i] = {"name": _jobs[i]["name"], "status": "failed", "error": f"{type(e).__name__}: {e}"}
+            row = results[i]
+            print(f"\t>> [{done}/{len(_jobs)}] {row['name']}: {row['status']} ({row.get('seconds', '-')} s)")
+
+    return [results[i] for i in range(len(_jobs))]
+
+
+def write_results_table(_results: list[dict], _file_path: Path) -> None:
+    with open(_file_path, "w", newline="", encoding="utf-8") as results_file:
+        writer = csv.DictWriter(results_file, fieldnames=RESULTS_FIELDS)
+        writer.writeheader()
+        for row in _results:
+            writer.writerow({k: row.get(k, "") for k in RESULTS_FIELDS})
+
+
+if __name__ == "__main__":
+    assert len(sys.argv) in (3, 4), "Error: Incorrect number of arguments."
+    manifest_path, output_folder = Path(sys.argv[1]), Path(sys.argv[2])
+    max_jobs = int(sys.argv[3]) if len(sys.argv) == 4 and sys.argv[3] else None
+
+    jobs = read_manifest(manifest_path)
+    results = run_batch(jobs, output_folder, max_jobs)
+    results_path = output_folder / RESULTS_FILE_NAME
+    write_results_table(results, results_path)
+
+    failed = [r["name"] for r in results if r["status"] != "ok"]
+    if failed:
+        print(f"WARNING: {len(failed)} of {len(results)} models failed: {failed}. See the logs in: '{output_folder}'")
+    print(f"\t>> Saved the results table: '{results_path}'")
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Calculate the ADORB costs of a 'revive extract' model, with the Grid-Region CO2 factors served from the cache.
+
+This script is called from the command line with the following arguments:
+    * [0] (str): The path to the Python script (this file).
+    * [1] (str): The path to the 'revive extract' model file, or "-" to read the model data from stdin.
+    * [2] (str): The path to the EnergyPlus SQL file to use for the calculation.
+    * [3] (str): The path to the output Yearly CSV file.
+    * [4] (str): The path to the output Cumulative CSV file.
+    * [5] (str): The path to the output folder for the preview tables.
+
+The steps are the same as ph_adorb's own 'calc_HBJSON_ADORB_costs.py' script, but the model is
+loaded with `revive_extract.load_extract_model` (as in `adorb_sweep.py` / `adorb_monte_carlo.py`),
+and `load_CO2_factors_from_json_file` is replaced (see `cambium_factors.py`) so the Grid-Region
+JSON file is not parsed on every run.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from ph_adorb.from_HBJSON import create_variant
+from ph_adorb.variant import calc_variant_cumulative_ADORB_costs, calc_variant_yearly_ADORB_costs
+
+import cambium_factors
+import perf_phases
+import revive_extract
+
+
+def prepare_output_paths(_yearly_csv: Path, _cumulative_csv: Path, _tables_folder: Path) -> None:
+    """Make the CSV files' folders, remove any existing CSV files, and start a new (empty) tables folder."""
+    for csv_path in (_yearly_csv, _cumulative_csv):
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        if csv_path.exists():
+            print(f"\t>> Removing the existing CSV file: {csv_path}")
+            csv_path.unlink()
+
+    if _tables_folder.exists():
+        print(f"\t>> Removing: {_tables_folder}")
+        shutil.rmtree(_tables_folder)
+    os.mkdir(_tables_folder)
+
+
+if __name__ == "__main__":
+    assert len(sys.argv) == 6, "Error: Incorrect number of arguments."
+    cambium_factors.install()
+    revive_extract.install()
+
+    model_arg = sys.argv[1]
+    sql_path, yearly_csv, cumulative_csv, tables_folder = (Path(a) for a in sys.argv[2:])
+    if not sql_path.exists():
+        raise FileNotFoundError(f"Cannot find the SQL file: '{sql_path}'")
+    prepare_output_paths(yearly_csv, cumulative_csv, tables_folder)
+
+    if model_arg == revive_extract.MODEL_FROM_STDIN:
+        print("\t>> Reading the model data from stdin")
+    else:
+        print(f"\t>> Reading the model file: '{model_arg}'")
+    with perf_phases.phase("read_model"):
+        hb_model = revive_extract.load_extract_model(model_arg)
+
+    print(f"\t>> Calculating the ADORB costs for: '{hb_model.display_name}'")
+    with perf_phases.phase("build_variant"):
+        revive_variant = create_variant.get_PhAdorbVariant_from_hb_model(hb_model, sql_path)
+    with perf_phases.phase("calc_yearly_costs"):
+        yearly_df = calc_variant_yearly_ADORB_costs(revive_variant, tables_folder)
+    with perf_phases.phase("calc_cumulative_costs"):
+        cumulative_df = calc_variant_cumulative_ADORB_costs(yearly_df)
+
+    yearly_df.to_csv(yearly_csv)
+    cumulative_df.to_csv(cumulative_csv)
+    print(f"\t>> Saved: '{yearly_csv}' and '{cumulative_csv}'")
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Monte Carlo uncertainty analysis of a model's ADORB present-value costs.
+
+This script is called from the command line with the following arguments:
+    * [0] (str): The path to the Python script (this file).
+    * [1] (str): The path to the 'revive extract' model file, or "-" to read the model data from stdin.
+    * [2] (str): The path to the EnergyPlus SQL file to use for the calculation.
+    * [3] (str): The path to the settings JSON file:
+        `{"samples": 1000, "seed": null, "percentiles": [5, 50, 95], "distributions": {<parameter>: {...}}}`
+    * [4] (str): The path to the output yearly percentiles CSV file.
+    * [5] (str): The path to the output cumulative percentiles CSV file.
+
+The base variant is built once, by ph_adorb's own `get_PhAdorbVariant_from_hb_model`. Every ADORB
+cost column is linear in the uncertain inputs, so the base variant is split (using ph_adorb's own
+cost functions) into per-year arrays, and all the samples are then evaluated together as
+(samples x years) NumPy arrays. With every parameter at its default the result is the same as
+`calc_variant_yearly_ADORB_costs`.
+
+The uncertain parameters are factors on the model's own values (except the escalation rate):
+    * electricity_price: multiplies the electricity purchase / sale prices and annual base price.
+    * gas_price: multiplies the natural-gas purchase price and annual base price.
+    * fuel_price_escalation: annual rate at which both fuel costs rise (year 1 is not escalated).
+    * grid_emissions: multiplies the Grid-Region's hourly CO2 factors.
+    * national_emissions: multiplies the National Emissions kg-CO2 per USD (all embodied CO2).
+    * construction_cost: multiplies every Construction's cost_per_m2 (install and embodied CO2).
+
+Each distribution is one of:
+    `{"type": "fixed", "value": v}`, `{"type": "normal", "mean": m, "sd": s}`,
+    `{"type": "uniform", "low": a, "high": b}` or `{"type": "triangular", "low": a, "mode": c, "high": b}`.
+
+The output CSVs have one row per year and a `<column>_p<percentile>` column for each of the
+ph_adorb cost columns and their 'total'. The cumulative percentiles are taken from each sample's
+own cumulative series (not summed from the yearly percentiles).
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from ph_adorb import adorb_cost
+from ph_adorb.from_HBJSON import create_variant
+from ph_adorb.variant import (
+    PhAdorbVariant,
+    calc_annual_hourly_electric_CO2,
+    calc_annual_total_electric_cost,
+    calc_annual_total_gas_CO2,
+    calc_annual_total_gas_cost,
+    calc_CO2_reduction_measures_yearly_embodied_CO2_cost,
+    calc_CO2_reduction_measures_yearly_embodied_kgCO2,
+    calc_CO2_reduction_measures_yearly_install_costs,
+    calc_constructions_yearly_embodied_CO2_cost,
+    calc_constructions_yearly_embodied_kgCO2,
+    calc_constructions_yearly_install_costs,
+    calc_equipment_yearly_embodied_CO2_cost,
+    calc_equipment_yearly_embodied_kgCO2_,
+    calc_equipment_yearly_install_costs,
+)
+from ph_adorb.yearly_values import YearlyCost
+
+import cambium_factors
+import perf_phases
+import revive_extract
+
+# -- {parameter name: its value in the model (used when no distribution is given)}
+PARAMETER_DEFAULTS = {
+    "electricity_price": 1.0,
+    "gas_price": 1.0,
+    "fuel_price_escalation": 0.0,
+    "grid_emissions": 1.0,
+    "national_emissions": 1.0,
+    "construction_cost": 1.0,
+}
+
+COLUMNS = ["pv_direct_energy", "pv_operational_CO2", "pv_direct_MR", "pv_embodied_CO2", "pv_e_trans"]
+
+# -- The same as ph_adorb's `measure_CO2_cost_PV`
+EMBODIED_CO2_FACTOR = 0.75
+
+
+def draw_samples(_rng: np.random.Generator, _distribution: dict, _n: int) -> np.ndarray:
+    """Return `_n` values drawn from the distribution."""
+    kind = _distribution.get("type", "").lower()
+    if kind == "fixed":
+        return np.full(_n, float(_distribution["value"]))
+    if kind == "normal":
+        return _rng.normal(_distribution["mean"], _distribution["sd"], _n)
+    if kind == "uniform":
+        return _rng.uniform(_distribution["low"], _distribution["high"], _n)
+    if kind == "triangular":
+        return _rng.triangular(_distribution["low"], _distribution["mode"], _distribution["high"], _n)
+    raise ValueError(f"Unknown distribution type: '{kind}' in {_distribution}")
+
+
+def draw_parameters(_settings: dict) -> dict[str, np.ndarray]:
+    """Return the samples of every parameter (a 1-D array of `samples` values each)."""
+    n = int(_settings["samples"])
+    rng = np.random.default_rng(_settings.get("seed"))
+    distributions = _settings.get("distributions", {})
+
+    unknown = set(distributions) - set(PARAMETER_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown Monte Carlo parameter(s): {sorted(unknown)}")
+
+    parameters = {}
+    for name, default in PARAMETER_DEFAULTS.items():
+        distribution = distributions.get(name) or {"type": "fixed", "value": default}
+        parameters[name] = draw_samples(rng, distribution, n)
+    return parameters
+
+
+def _by_year(_yearly_costs: list[YearlyCost], _duration: int) -> np.ndarray:
+    """Return the total cost in each year of the analysis (costs outside of the analysis are dropped)."""
+    totals = np.zeros(_duration)
+    for yearly_cost in _yearly_costs:
+        if 0 <= yearly_cost.year < _duration:
+            totals[yearly_cost.year] += yearly_cost.cost
+    return totals
+
+
+@dataclass
+class ADORBComponents:
+    """The base variant's ADORB costs, split into the parts which each uncertain parameter scales."""
+
+    annual_cost_electric: float
+    annual_cost_gas: float
+    annual_CO2_electric: np.ndarray  # -- (years,)
+    annual_CO2_gas: float
+    price_of_carbon: float
+    construction_install: np.ndarray  # -- (years,) not yet discounted
+    other_install: np.ndarray
+    construction_embodied_CO2_cost: np.ndarray
+    other_embodied_CO2_cost: np.ndarray
+    pv_factor_2pct: np.ndarray  # -- (years,)
+    pv_factor_7_5pct: np.ndarray
+    pv_e_trans: np.ndarray
+
+    @classmethod
+    def from_variant(cls, _variant: PhAdorbVariant) -> "ADORBComponents":
+        duration = _variant.analysis_duration
+        kg_CO2_per_USD = _variant.national_emissions.kg_CO2_per_USD
+        price_of_carbon = _variant.price_of_carbon
+
+        annual_CO2_electric = calc_annual_hourly_electric_CO2(
+            _variant.hourly_purchased_electricity_kwh, _variant.grid_region
+        )
+        if len(annual_CO2_electric) < duration:
+            raise ValueError(
+                f"The Grid-Region only has CO2 factors for {len(annual_CO2_electric)} years, "
+                f"but the analysis duration is {duration} years."
+            )
+
+        measures = _variant.all_carbon_measures
+        constructions = _variant.construction_collection
+        equipment = _variant.equipment_collection
+        other_embodied = calc_CO2_reduction_measures_yearly_embodied_CO2_cost(
+            calc_CO2_reduction_measures_yearly_embodied_kgCO2(measures, kg_CO2_per_USD), price_of_carbon
+        ) + calc_equipment_yearly_embodied_CO2_cost(
+            calc_equipment_yearly_embodied_kgCO2_(equipment, duration, kg_CO2_per_USD), price_of_carbon
+        )
+
+        pv_2pct = [adorb_cost.present_value_factor(n, 0.02) for n in range(duration)]
+        return cls(
+            annual_cost_electric=calc_annual_total_electric_cost(
+                _variant.total_purchased_electricity_kwh,
+                _variant.total_sold_electricity_kwh,
+                _variant.electricity.purchase_price_per_kwh,
+                _variant.electricity.sale_price_per_kwh,
+                _variant.electricity.annual_base_price,
+            ),
+            annual_cost_gas=calc_annual_total_gas_cost(
+                _variant.total_purchased_gas_kwh,
+                _variant.gas.used,
+                _variant.gas.purchase_price_per_kwh,
+                _variant.gas.annual_base_price,
+            ),
+            annual_CO2_electric=np.asarray(annual_CO2_electric[:duration], dtype=float),
+            annual_CO2_gas=calc_annual_total_gas_CO2(_variant.total_purchased_gas_kwh, _variant.gas.used),
+            price_of_carbon=price_of_carbon,
+            construction_install=_by_year(calc_constructions_yearly_install_costs(constructions, duration), duration),
+            other_install=_by_year(
+                calc_CO2_reduction_measures_yearly_install_costs(measures)
+                + calc_equipment_yearly_install_costs(equipment, duration),
+                duration,
+            ),
+            construction_embodied_CO2_cost=_by_year(
+                calc_constructions_yearly_embodied_CO2_cost(
+                    calc_constructions_yearly_embodied_kgCO2(constructions, duration, kg_CO2_per_USD),
+                    price_of_carbon,
+                ),
+                duration,
+            ),
+            other_embodied_CO2_cost=_by_year(other_embodied, duration),
+            pv_factor_2pct=np.array([f.factor for f in pv_2pct]),
+            pv_factor_7_5pct=np.array([adorb_cost.present_value_factor(n, 0.075).factor for n in range(duration)]),
+            pv_e_trans=np.array(
+                [adorb_cost.grid_transition_cost_PV(f, _variant.peak_electric_usage_W) for f in pv_2pct]
+            ),
+        )
+
+    def evaluate(self, _parameters: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Return each ADORB cost column for every sample, as a (samples x years) array."""
+        p = {name: values[:, np.newaxis] for name, values in _parameters.items()}
+        years = np.arange(len(self.pv_factor_2pct))
+
+        energy_cost = self.annual_cost_electric * p["electricity_price"] + self.annual_cost_gas * p["gas_price"]
+        energy_cost = energy_cost * (1.0 + p["fuel_price_escalation"]) ** years
+        operational_CO2 = self.annual_CO2_electric * p["grid_emissions"] + self.annual_CO2_gas
+        install = self.construction_install * p["construction_cost"] + self.other_install
+        embodied = self.construction_embodied_CO2_cost * p["construction_cost"] + self.other_embodied_CO2_cost
+        embodied = embodied * p["national_emissions"]
+
+        n_samples = len(next(iter(_parameters.values())))
+        return {
+            "pv_direct_energy": energy_cost / self.pv_factor_2pct,
+            "pv_operational_CO2": operational_CO2 * self.price_of_carbon / self.pv_factor_7_5pct,
+            "pv_direct_MR": install / self.pv_factor_2pct,
+            "pv_embodied_CO2": EMBODIED_CO2_FACTOR * embodied,
+            "pv_e_trans": np.broadcast_to(self.pv_e_trans, (n_samples, len(years))),
+        }
+
+
+def percentiles_df(_columns: dict[str, np.ndarray], _percentiles: list[float]) -> pd.DataFrame:
+    """Return a DataFrame (one row per year) with the percentiles of each column, across the samples."""
+    data = {}
+    for name, values in _columns.items():
+        bands = np.percentile(values, _percentiles, axis=0)
+        for pct, band in zip(_percentiles, bands):
+            data[f"{name}_p{pct:g}"] = band
+    return pd.DataFrame(data)
+
+
+def run_monte_carlo(_variant: PhAdorbVariant, _settings: dict) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return the yearly and the cumulative percentile bands of the variant's ADORB costs."""
+    parameters = draw_parameters(_settings)
+    yearly = ADORBComponents.from_variant(_variant).evaluate(parameters)
+    yearly["total"] = sum(yearly[c] for c in COLUMNS)
+    cumulative = {name: np.cumsum(values, axis=1) for name, values in yearly.items()}
+
+    percentiles = [float(p) for p in _settings.get("percentiles") or (5, 50, 95)]
+    return percentiles_df(yearly, percentiles), percentiles_df(cumulative, percentiles)
+
+
+if __name__ == "__main__":
+    assert len(sys.argv) == 6, "Error: Incorrect number of arguments."
+    cambium_factors.install()
+    revive_extract.install()
+
+    model_arg, sql_path, settings_path, yearly_csv, cumulative_csv = sys.argv[1:]
+    sql_path = Path(sql_path)
+    if not sql_path.exists():
+        raise FileNotFoundError(f"Cannot find the SQL file: '{sql_path}'")
+    with open(settings_path) as settings_file:
+        settings = json.load(settings_file)
+
+    print(f"\t>> Loading the model and the SQL file: '{sql_path}'")
+    with perf_phases.phase("read_model"):
+        hb_model = revive_extract.load_extract_model(model_arg)
+    with perf_phases.phase("build_variant"):
+        variant = create_variant.get_PhAdorbVariant_from_hb_model(hb_model, sql_path)
+
+    print(f"\t>> Evaluating {settings['samples']:,} ADORB samples...")
+    with perf_phases.phase("monte_carlo"):
+        yearly_df, cumulative_df = run_monte_carlo(variant, settings)
+
+    with perf_phases.phase("write_csv"):
+        for csv_path in (yearly_csv, cumulative_csv):
+            Path(csv_path).parent.mkdir(parents=True, exist_ok=True)
+        yearly_df.to_csv(yearly_csv)
+        cumulative_df.to_csv(cumulative_csv)
+    print(f"\t>> Saved: '{yearly_csv}' and '{cumulative_csv}'")
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Calculate the ADORB costs for several variants of one model, reading the model and the SQL file only once.
+
+This script is called from the command line with the following arguments:
+    * [0] (str): The path to the Python script (this file).
+    * [1] (str): The path to the 'revive extract' model file, or "-" to read the model data from stdin.
+    * [2] (str): The path to the EnergyPlus SQL file to use for the calculation.
+    * [3] (str): The path to the variants JSON file: a list of
+        `{"name": "...", "properties": {"revive": {...}}}` items (the ModelReviveProperties of each variant).
+    * [4] (str): The folder to write the '<name>_yearly.csv' and '<name>_cumulative.csv' of each variant to.
+
+Each variant is the base model with its REVIVE model properties (analysis duration, envelope labor
+fraction, fuels, CO2 reduction measures, grid region, national emissions) replaced. The
+Constructions, Equipment and the energy use from the SQL file are the same for every variant, so
+the model is re-built and the SQL file read just once, and the variants are then run through
+ph_adorb's own `get_PhAdorbVariant_from_hb_model` and cost functions one after the other.
+
+No preview tables are written (use the 'Calculate ADORB Costs' component for those).
+"""
+
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from ph_adorb.ep_sql_file import DataFileSQL
+from ph_adorb.from_HBJSON import create_variant
+from ph_adorb.variant import calc_variant_cumulative_ADORB_costs, calc_variant_yearly_ADORB_costs
+
+import cambium_factors
+import perf_phases
+import revive_extract
+
+
+class SQLResultsReadOnce:
+    """Stands in for ph_adorb's `DataFileSQL`: each value is read from the SQL file the first time it is asked for."""
+
+    def __init__(self, _source_file_path: Path) -> None:
+        self._sql = DataFileSQL(source_file_path=_source_file_path)
+        self._values: dict[str, Any] = {}
+
+    def _get(self, _name: str) -> Any:
+        if _name not in self._values:
+            self._values[_name] = getattr(self._sql, _name)()
+        value = self._values[_name]
+        return list(value) if isinstance(value, list) else value
+
+    def get_total_purchased_gas_kwh(self) -> float:
+        return self._get("get_total_purchased_gas_kwh")
+
+    def get_hourly_purchased_electricity_kwh(self) -> list[float]:
+        return self._get("get_hourly_purchased_electricity_kwh")
+
+    def get_total_sold_electricity_kwh(self) -> float:
+        return self._get("get_total_sold_electricity_kwh")
+
+    def get_peak_electric_watts(self) -> float:
+        return self._get("get_peak_electric_watts")
+
+
+@contextmanager
+def sql_read_once(_sql_path: Path) -> Iterator[None]:
+    """Have ph_adorb's `create_variant` share a single read of the SQL file, while inside the context."""
+    results = SQLResultsReadOnce(_sql_path)
+    original = create_variant.DataFileSQL
+    create_variant.DataFileSQL = lambda source_file_path: results
+    try:
+        yield
+    finally:
+        create_variant.DataFileSQL = original
+
+
+def calc_variants(
+    _hb_model: revive_extract.ReviveExtractModel, _sql_path: Path, _variants: list[dict], _output_folder: Path
+) -> list[tuple[Path, Path]]:
+    """Calculate and write out the yearly and cumulative ADORB costs of each variant.
+
+    Returns:
+    --------
+        * list[tuple[Path, Path]]: The (yearly, cumulative) CSV file paths of each variant, in order.
+    """
+    output_paths = []
+    with sql_read_once(_sql_path):
+        for i, variant in enumerate(_variants, start=1):
+            print(f"\t>> [{i}/{len(_variants)}] Calculating the ADORB costs for: '{variant['name']}'")
+            _hb_model.display_name = variant["name"]
+            _hb_model.properties.revive = revive_extract.model_revive_properties(variant)
+
+            with perf_phases.phase("build_variant"):
+                revive_variant = create_variant.get_PhAdorbVariant_from_hb_model(_hb_model, _sql_path)
+            with perf_phases.phase("calc_costs"):
+                yearly_df = calc_variant_yearly_ADORB_costs(revive_variant)
+                cumulative_df = calc_variant_cumulative_ADORB_costs(yearly_df)
+
+            yearly_csv = _output_folder / f"{variant['name']}_yearly.csv"
+            cumulative_csv = _output_folder / f"{variant['name']}_cumulative.csv"
+            yearly_df.to_csv(yearly_csv)
+            cumulative_df.to_csv(cumulative_csv)
+            output_paths.append((yearly_csv, cumulative_csv))
+    return output_paths
+
+
+if __name__ == "__main__":
+    assert len(sys.argv) == 5, "Error: Incorrect number of arguments."
+    cambium_factors.install()
+    revive_extract.install()
+
+    model_arg, sql_path, variants_path, output_folder = sys.argv[1:]
+    sql_path, variants_path, output_folder = Path(sql_path), Path(variants_path), Path(output_folder)
+    if not sql_path.exists():
+        raise FileNotFoundError(f"Cannot find the SQL file: '{sql_path}'")
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    with open(variants_path) as variants_file:
+        variants = json.load(variants_file)
+
+    print(f"\t>> Loading the model and the SQL file: '{sql_path}'")
+    with perf_phases.phase("read_model"):
+        hb_model = revive_extract.load_extract_model(model_arg)
+    for yearly_csv, cumulative_csv in calc_variants(hb_model, sql_path, variants, output_folder):
+        print(f"\t>> Saved: '{yearly_csv}' and '{cumulative_csv}'")
+    print(f"\t>> Done calculating the ADORB costs for {len(variants)} variants.")
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Load the Cambium Grid-Region CO2 factors from a pre-parsed cache instead of the (~10 MB) JSON file.
+
+ph_adorb reads the Grid-Region's JSON file, and validates its ~780,000 hourly factors, on
+every ADORB calculation. `install()` replaces `load_CO2_factors_from_json_file` (everywhere
+it has been imported) with a version which:
+    * keeps the loaded factors in memory, so inside the persistent worker a second job
+      using the same (unchanged) file does not read anything at all;
+    * otherwise reads a pickled copy of the parsed factors from the cache folder, only
+      falling back to the JSON file (and writing the pickle) the first time a file is used,
+      or after it has changed.
+Entries are keyed on the JSON file's path, size and modified-time.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+from honeybee.config import folders as hb_folders
+from ph_adorb.grid_region import PhAdorbGridRegion
+
+CACHE_VERSION = 1
+
+# -- The modules which bind `load_CO2_factors_from_json_file` by name, and so need to be patched.
+PATCH_MODULES = (
+    "ph_adorb.grid_region",
+    "ph_adorb.from_HBJSON.create_variant",
+)
+
+# -- {resolved-path: (signature, PhAdorbGridRegion)}
+_LOADED: dict[str, tuple[tuple[int, float], PhAdorbGridRegion]] = {}
+
+
+def cache_dir() -> Path:
+    """Return the folder the pre-parsed factor files are written to."""
+    return Path(hb_folders.default_simulation_folder) / "REVIVE" / "_cache" / "cambium"
+
+
+def file_signature(_file_path: Path) -> tuple[int, float]:
+    stat = os.stat(_file_path)
+    return stat.st_size, stat.st_mtime
+
+
+def cache_file_path(_file_path: Path, _signature: tuple[int, float]) -> Path:
+    """Return the path of the pickled factors for this version of the JSON file."""
+    key = hashlib.sha256(f"{CACHE_VERSION}|{_file_path}|{_signature}".encode("utf-8")).hexdigest()[:16]
+    return cache_dir() / f"{_file_path.stem}_{key}.pkl"
+
+
+def _read_json(_file_path: Path) -> dict:
+    """Read and validate the JSON file, returning the plain (int-year keyed) data."""
+    with open(_file_path, "r") as json_file:
+        return PhAdorbGridRegion(**json.load(json_file)).model_dump()
+
+
+def _write_cache_file(_cache_path: Path, _data: dict) -> None:
+    try:
+        _cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # -- Remove the files for any older versions of the same Grid-Region
+        for old_path in _cache_path.parent.glob(f"{_cache_path.stem.rsplit('_', 1)[0]}_*.pkl"):
+            old_path.unlink(missing_ok=True)
+        # -- A per-process temp file, as several batch processes may write the same entry at once.
+        tmp_path = _cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _cache_path)
+    except OSError as e:
+        # -- Not being able to save the cache only costs time on the next run.
+        print(f"Failed to write the Grid-Region cache file: '{_cache_path}'\n\t{e}")
+
+
+def _read_cache_file(_cache_path: Path) -> dict | None:
+    if not _cache_path.exists():
+        return None
+    try:
+        with open(_cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def load_CO2_factors(_file_path: Path) -> PhAdorbGridRegion:
+    """Return the Grid-Region CO2 factors for the JSON file, from memory or the cache if possible.
+
+    The returned object may be shared with later calls: do not modify it.
+    """
+    file_path = Path(_file_path).resolve()
+    signature = file_signature(file_path)
+
+    entry = _LOADED.get(str(file_path))
+    if entry and entry[0] == signature:
+        return entry[1]
+
+    cache_path = cache_file_path(file_path, signature)
+    data = _read_cache_file(cache_path)
+    if data is None:
+        data = _read_json(file_path)
+        _write_cache_file(cache_path, data)
+
+    # -- The cached data was validated when it was first read from the JSON file.
+    grid_region = PhAdorbGridRegion.model_construct(**data)
+
+    # -- Only keep the most recent Grid-Region in memory
+    _LOADED.clear()
+    _LOADED[str(file_path)] = (signature, grid_region)
+    return grid_region
+
+
+def install() -> None:
+    """Replace `load_CO2_factors_from_json_file` in the ph_adorb modules with the cached version."""
+    for module_name in PATCH_MODULES:
+        try:
+            module = importlib.import_module(module_name)
+        except ModuleNotFoundError:
+            continue  # -- Not in this version of ph_adorb
+        if hasattr(module, "load_CO2_factors_from_json_file"):
+            module.load_CO2_factors_from_json_file = load_CO2_factors
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Write hourly time-series Records to the compact columnar '.bin' format read by the Grasshopper components.
+
+File layout:
+    * Line 1: a UTF-8 JSON header, terminated by a single newline:
+        {
+            "format": "HBRV-HOURLY", "version": 1, "byteorder": "little", "variable": "Zone Heat Index",
+            "zones": [{"name": "ZONE_1", "start": [6, 28, 0], "end": [7, 4, 23], "count": 192}, ...]
+        }
+    * Then, for each zone in the header's order: 'count' raw little-endian float64 values, in time order.
+
+The start/end entries are [month, day, hour] with hour in 0-23. Each zone is an hourly-continuous
+series, so nothing else is needed to rebuild the timestamps. See
+`honeybee_revive_rhino/gh_compo_io/resiliency/_hourly_values.py` for the reader.
+"""
+
+import json
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+FORMAT_NAME = "HBRV-HOURLY"
+FORMAT_VERSION = 1
+
+
+def write_hourly_binary(_records: Iterable, _variable_name: str, _file_path: Path) -> Path:
+    """Write the (Date, Value, Zone) Records out to a '.bin' file.
+
+    Arguments:
+    ----------
+        * _records (Iterable[Record]): The Records, as returned by `get_time_series_data`.
+        * _variable_name (str): The name of the output variable (stored in the header).
+        * _file_path (Path): The path of the file to write.
+
+    Returns:
+    --------
+        * Path: The path of the file written.
+    """
+    by_zone: dict[str, list] = {}
+    for record in _records:
+        by_zone.setdefault(record.Zone, []).append(record)
+
+    zones = []
+    columns = []
+    for zone_name, zone_records in by_zone.items():
+        zone_records.sort(key=lambda r: r.Date)
+        st, end = zone_records[0].Date, zone_records[-1].Date
+        zones.append(
+            {
+                "name": zone_name,
+                "start": [st.month, st.day, st.hour],
+                "end": [end.month, end.day, end.hour],
+                "count": len(zone_records),
+            }
+        )
+        columns.append(array("d", (r.Value for r in zone_records)))
+
+    header = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "byteorder": "little",
+        "variable": _variable_name,
+        "zones": zones,
+    }
+
+    file_path = Path(_file_path)
+    with open(file_path, "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        for column in columns:
+            if sys.byteorder != "little":
+                column.byteswap()
+            column.tofile(f)
+
+    return file_path
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Time the phases of a Python-3 script, and report them on one structured stdout line for the component.
+
+A script times its work with:
+
+    with perf_phases.phase("read_model"):
+        ...
+
+or times calls to a function it does not own (ie: inside ph_adorb's own script) with
+`timed_functions(...)`. The phases are reported as a single line on stdout:
+
+    @@HBRV-PERF@@ {"phases": [{"name": "read_model", "seconds": 0.12, "memory_mb": 310.5}, ...]}
+
+which `gh_compo_io/perf.py` removes from the output and merges into the component's timings.
+The worker (`worker.py`) writes this line at the end of each job; a script run on its own has it
+written when the interpreter exits.
+"""
+
+import atexit
+import functools
+import json
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Iterator
+
+PERF_LINE_PREFIX = "@@HBRV-PERF@@ "
+
+_PHASES: list[dict[str, Any]] = []
+
+
+def memory_mb() -> float | None:
+    """Return the process' peak resident memory in MB (None if it cannot be found on this platform)."""
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+    except ImportError:
+        pass
+
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (n, ctypes.c_size_t)
+                for n in (
+                    "PeakWorkingSetSize",
+                    "WorkingSetSize",
+                    "QuotaPeakPagedPoolUsage",
+                    "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage",
+                    "QuotaNonPagedPoolUsage",
+                    "PagefileUsage",
+                    "PeakPagefileUsage",
+                )
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None
+        return round(counters.PeakWorkingSetSize / (1024 * 1024), 1)
+    except (ImportError, AttributeError, OSError):
+        return None
+
+
+@contextmanager
+def phase(_name: str) -> Iterator[None]:
+    """Time the code inside the context as the phase `_name`."""
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        _PHASES.append({"name": _name, "seconds": round(perf_counter() - start, 6), "memory_mb": memory_mb()})
+
+
+@contextmanager
+def timed_functions(_functions: dict[str, tuple[Any, str]]) -> Iterator[None]:
+    """Time each call to the functions while inside the context, as the phase of the same name.
+
+    Arguments:
+    ----------
+        * _functions: {phase-name: (module-or-object, function-attribute-name)}. The function is
+            replaced on the module, so it must be looked up from there when it is called (ie:
+            `from module import function` run after the context is entered).
+    """
+    originals = []
+    for phase_name, (owner, attr_name) in _functions.items():
+        original = getattr(owner, attr_name)
+        originals.append((owner, attr_name, original))
+        setattr(owner, attr_name, _timed(phase_name, original))
+    try:
+        yield
+    finally:
+        for owner, attr_name, original in originals:
+            setattr(owner, attr_name, original)
+
+
+def _timed(_phase_name: str, _func: Callable) -> Callable:
+    @functools.wraps(_func)
+    def timed(*args, **kwargs):
+        with phase(_phase_name):
+            return _func(*args, **kwargs)
+
+    return timed
+
+
+def take_phases() -> list[dict[str, Any]]:
+    """Return the phases timed so far, and clear them."""
+    phases = list(_PHASES)
+    _PHASES.clear()
+    return phases
+
+
+def perf_line(_phases: list[dict[str, Any]]) -> str:
+    """Return the structured stdout line for the phases."""
+    return PERF_LINE_PREFIX + json.dumps({"phases": _phases})
+
+
+@atexit.register
+def _report_at_exit() -> None:
+    # -- A script run on its own. In the worker the phases are already taken at the end of each job.
+    phases = take_phases()
+    if phases:
+        print(perf_line(phases), flush=True)
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Generate all of the Winter and/or Summer resilience outputs from an EnergyPlus SQL file in a single job.
+
+This script is called from the command line with the following arguments:
+    * [0] (str): The path to the Python script (this file).
+    * [1] (str): The path to the EnergyPlus SQL file to read in.
+    * [2] (str): The path to the output folder to write the graphs and hourly data files to.
+    * [3] (str): The season(s) to output, comma separated: "winter", "summer" or "winter,summer".
+
+For each season this runs the honeybee_revive graph script, and writes the hourly data as both a
+CSV (one column per zone) and the compact '.bin' file read by the Grasshopper component
+(see `hourly_binary.py`):
+    * winter: '<folder>/resilience_SET_temperature.csv' and '.bin'
+    * summer: '<folder>/resilience_heat_index_data.csv' and '.bin'
+
+The honeybee_revive scripts are run unchanged, but with `get_time_series_data` replaced (see
+`sql_time_series.py`) so the SQL file is only read once for all of them: the variables the
+seasons' scripts use are read in a single query, and dropped again at the end of the job.
+"""
+
+import runpy
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+import pandas as pd
+from honeybee_revive.output import _shared
+from honeybee_revive.output.resilience_hourly_data import pivot_df_by_zone_name
+
+import perf_phases
+import sql_time_series
+from hourly_binary import write_hourly_binary
+
+Season = namedtuple("Season", ["graphs_module", "data_filename", "variable_name", "graph_variables"])
+
+# -- The output variables both of the honeybee_revive graph scripts read.
+SHARED_GRAPH_VARIABLES = (
+    "Enclosure Exterior Windows Total Transmitted Beam Solar Radiation Energy",
+    "Enclosure Exterior Windows Total Transmitted Diffuse Solar Radiation Energy",
+    "Site Outdoor Air Barometric Pressure",
+    "Site Outdoor Air Drybulb Temperature",
+    "Site Outdoor Air Relative Humidity",
+    "Site Wind Speed",
+    "Zone Air Relative Humidity",
+    "Zone Electric Equipment Total Heating Energy",
+    "Zone Infiltration Standard Density Air Change Rate",
+    "Zone Infiltration Total Heat Gain Energy",
+    "Zone Infiltration Total Heat Loss Energy",
+    "Zone Lights Total Heating Energy",
+    "Zone Mean Air Temperature",
+    "Zone Mechanical Ventilation Air Changes per Hour",
+    "Zone People Total Heating Energy",
+    "Zone Ventilation Standard Density Air Change Rate",
+    "Zone Ventilation Total Heat Gain Energy",
+    "Zone Ventilation Total Heat Loss Energy",
+    "Zone Windows Total Heat Gain Energy",
+    "Zone Windows Total Heat Loss Energy",
+)
+
+SEASONS = {
+    "winter": Season(
+        "honeybee_revive.output.resilience_winter_graphs",
+        "resilience_SET_temperature",
+        "Zone Thermal Comfort Pierce Model Standard Effective Temperature",
+        SHARED_GRAPH_VARIABLES
+        + (
+            "Surface Average Face Conduction Heat Transfer Energy",
+            "Surface Heat Storage Energy",
+            "Surface Inside Face Temperature",
+            "Surface Shading Device Is On Time Fraction",
+            "Surface Window Heat Gain Energy",
+            "Surface Window Heat Loss Energy",
+            "Surface Window Net Heat Transfer Energy",
+            "Zone Mean Radiant Temperature",
+        ),
+    ),
+    "summer": Season(
+        "honeybee_revive.output.resilience_summer_graphs",
+        "resilience_heat_index_data",
+        "Zone Heat Index",
+        SHARED_GRAPH_VARIABLES,
+    ),
+}
+
+
+def run_module_as_script(_module_name: str, _args: list[str]) -> None:
+    """Run a honeybee_revive module exactly as if it were called from the command line."""
+    original_argv = sys.argv
+    sys.argv = [_module_name] + [str(a) for a in _args]
+    try:
+        runpy.run_module(_module_name, run_name="__main__", alter_sys=False)
+    finally:
+        sys.argv = original_argv
+
+
+def write_hourly_data(_sql_path: Path, _output_folder: Path, _season: Season) -> None:
+    """Write the season's hourly variable out to the CSV and '.bin' data files."""
+    # -- Same year / timezone as 'resilience_hourly_data.py', so the CSV is unchanged.
+    records = _shared.get_time_series_data(_sql_path, _season.variable_name, year=2016, utc=True)
+
+    csv_path = _output_folder / f"{_season.data_filename}.csv"
+    pivot_df_by_zone_name(pd.DataFrame(records)).to_csv(csv_path, index=False)
+    print(f"\t>> Hourly Data CSV File: '{csv_path}'")
+
+    bin_path = write_hourly_binary(records, _season.variable_name, _output_folder / f"{_season.data_filename}.bin")
+    print(f"\t>> Hourly Data File: '{bin_path}'")
+
+
+def resolve_seasons(_arg: str) -> list[Season]:
+    """Return the Season definitions from the comma-separated command-line argument."""
+    names = [n.strip().lower() for n in _arg.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SEASONS]
+    if unknown:
+        raise ValueError(f"Unknown season(s): {unknown}. Expected one or more of: {list(SEASONS)}")
+    return [SEASONS[n] for n in names]
+
+
+if __name__ == "__main__":
+    assert len(sys.argv) == 4, "Error: Incorrect number of arguments."
+    sql_path = Path(sys.argv[1])
+    output_folder = Path(sys.argv[2])
+    seasons = resolve_seasons(sys.argv[3])
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    # -- Read the variables from the SQL file once, then serve every honeybee_revive request from memory.
+    sql_time_series.install()
+    try:
+        with perf_phases.phase("read_sql"):
+            sql_time_series.load(sql_path, {n for s in seasons for n in s.graph_variables + (s.variable_name,)})
+
+        for season in seasons:
+            with perf_phases.phase(season.graphs_module.rsplit(".", 1)[-1]):
+                run_module_as_script(season.graphs_module, [sql_path, output_folder])
+            with perf_phases.phase(season.data_filename):
+                write_hourly_data(sql_path, output_folder, season)
+    finally:
+        sql_time_series.clear()
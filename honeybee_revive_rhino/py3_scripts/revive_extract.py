@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Read the 'revive extract' file written by the ADORB component, in place of a full HBJSON model.
+
+The extract (see `gh_compo_io/adorb/_revive_extract.py`) holds only what ph_adorb's
+`create_variant` uses from the HB-Model: the REVIVE properties, the Constructions with their
+total areas, and the Lighting / Process / HVAC / PV objects. Nothing has any geometry, so it is
+much smaller to write, read and re-build than the HBJSON.
+
+The ADORB-costs, sweep and Monte Carlo jobs load the extract with `load_extract_model`, from a file
+or (optionally gzip-compressed) piped in over stdin (see `read_piped_model`), and pass the
+`ReviveExtractModel` straight to ph_adorb's `create_variant`.
+
+`install()` replaces, in the ph_adorb modules:
+    * `get_hb_model_construction_quantities`: returns the extract's areas for a `ReviveExtractModel`;
+    * `read_hb_json_from_file`: also accepts an extract file;
+    * `convert_hbjson_dict_to_hb_model`: builds a `ReviveExtractModel` from an extract.
+The last two are only used by the batch job (`adorb_batch.py`), which reads its model files with
+ph_adorb's own functions. A normal HBJSON file still goes through the original functions.
+"""
+
+import gzip
+import importlib
+import importlib.metadata
+import inspect
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+from typing import BinaryIO, Callable
+
+# -- Import the extensions, so that the .revive properties are loaded from the dicts.
+import honeybee_energy_revive  # noqa: F401
+import honeybee_revive  # noqa: F401
+from honeybee_energy.construction.dictutil import dict_to_construction
+from honeybee_energy.generator.pv import PVProperties
+from honeybee_energy.hvac import HVAC_TYPES_DICT
+from honeybee_energy.load.lighting import Lighting
+from honeybee_energy.load.process import Process
+from honeybee_revive.properties.model import ModelReviveProperties
+
+EXTRACT_TYPE = "ReviveADORBExtract"
+SUPPORTED_VERSIONS = (1,)
+
+# -- The distribution name of ph_adorb (only used in the error message, if its functions have changed).
+PH_ADORB_DISTRIBUTION = "PH-ADORB"
+
+
+def _with_energy_properties(**_energy_attrs) -> SimpleNamespace:
+    """Return an object with `.properties.energy.<attr>`, like a Honeybee Room or Shade."""
+    return SimpleNamespace(properties=SimpleNamespace(energy=SimpleNamespace(**_energy_attrs)))
+
+
+def model_revive_properties(_data: dict) -> ModelReviveProperties:
+    """Return the ModelReviveProperties from a dict with a `"properties": {"revive": {...}}` item (ie: a model dict)."""
+    prop = ModelReviveProperties(None)
+    (
+        prop.grid_region,
+        prop.national_emissions_factors,
+        prop.analysis_duration,
+        prop.envelope_labor_cost_fraction,
+        prop.co2_measures,
+        prop.fuels,
+    ) = ModelReviveProperties.load_properties_from_dict(_data)
+    return prop
+
+
+def _hvac_from_dict(_data: dict):
+    return HVAC_TYPES_DICT[_data["type"]].from_dict(_data)
+
+
+class ReviveExtractModel:
+    """Stands in for the HB-Model in ph_adorb's `create_variant`, with only the attributes it reads.
+
+    All areas are already in square meters.
+    """
+
+    def __init__(self, _data: dict) -> None:
+        if _data.get("version") not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported revive-extract version: {_data.get('version')}")
+
+        self.identifier: str = _data["identifier"]
+        self.display_name: str = _data["display_name"]
+        self.units = "Meters"
+        self.construction_areas: dict[str, float] = defaultdict(float, _data["construction_areas_m2"])
+
+        self.properties = SimpleNamespace(
+            revive=model_revive_properties(_data),
+            energy=SimpleNamespace(constructions=[dict_to_construction(d) for d in _data["constructions"]]),
+        )
+
+        lighting = [Lighting.from_dict(d) for d in _data["lighting"]]
+        process_loads = [Process.from_dict(d) for d in _data["process_loads"]]
+        hvac_systems = [_hvac_from_dict(d) for d in _data["hvac_systems"]]
+
+        def _get(_items: list, _index: int | None):
+            return None if _index is None else _items[_index]
+
+        self.rooms = [
+            _with_energy_properties(
+                lighting=_get(lighting, r["lighting"]),
+                process_loads=[process_loads[i] for i in r["process_loads"]],
+                hvac=_get(hvac_systems, r["hvac"]),
+            )
+            for r in _data["rooms"]
+        ]
+        self.shades = [_with_energy_properties(pv_properties=PVProperties.from_dict(d)) for d in _data["pv_properties"]]
+
+
+def is_extract(_data: dict) -> bool:
+    return _data.get("type") == EXTRACT_TYPE
+
+
+# -----------------------------------------------------------------------------
+# -- Model data piped in over stdin
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def read_piped_model(_stream: BinaryIO | None = None) -> dict:
+    """Read the model data (JSON, optionally gzip-compressed) from stdin, or the given binary stream."""
+    data = (_stream or sys.stdin.buffer).read()
+    if data[:2] == GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return json.loads(data.decode("utf-8"))
+
+
+# -- The model file path which means: "read the model data from stdin"
+MODEL_FROM_STDIN = "-"
+
+
+def load_extract_model(_model_path: str) -> ReviveExtractModel:
+    """Read and re-build the revive-extract model from the file, or from stdin if the path is "-"."""
+    if _model_path == MODEL_FROM_STDIN:
+        data = read_piped_model()
+    else:
+        with open(_model_path) as json_file:
+            data = json.load(json_file)
+
+    if not is_extract(data):
+        raise ValueError("A 'revive extract' model file is needed here, not a full HBJSON.")
+    return ReviveExtractModel(data)
+
+
+# -----------------------------------------------------------------------------
+# -- ph_adorb patches
+
+# -- {function-name: the original ph_adorb function}
+_ORIGINALS: dict[str, Callable] = {}
+
+
+def read_hb_json_from_file(_file_address: Path) -> dict:
+    """Read in the HBJSON (or revive extract) file."""
+    with open(_file_address) as json_file:
+        data = json.load(json_file)
+    if is_extract(data) or data.get("type") == "Model":
+        return data
+    return _ORIGINALS["read_hb_json_from_file"](_file_address)  # -- Raises ph_adorb's own error
+
+
+def convert_hbjson_dict_to_hb_model(_data: dict):
+    if is_extract(_data):
+        return ReviveExtractModel(_data)
+    return _ORIGINALS["convert_hbjson_dict_to_hb_model"](_data)
+
+
+def get_hb_model_construction_quantities(_hb_model) -> dict[str, float]:
+    if isinstance(_hb_model, ReviveExtractModel):
+        return _hb_model.construction_areas
+    return _ORIGINALS["get_hb_model_construction_quantities"](_hb_model)
+
+
+PATCHES = (
+    ("ph_adorb.from_HBJSON.read_HBJSON_file", read_hb_json_from_file),
+    ("ph_adorb.from_HBJSON.read_HBJSON_file", convert_hbjson_dict_to_hb_model),
+    ("ph_adorb.from_HBJSON.create_variant", get_hb_model_construction_quantities),
+)
+
+
+def _parameter_names(_func: Callable) -> list[str]:
+    return list(inspect.signature(_func).parameters)
+
+
+def check_ph_adorb_functions() -> None:
+    """Raise an error if any of the ph_adorb functions the patches replace is missing, or takes other arguments."""
+    problems = []
+    for module_name, replacement in PATCHES:
+        module = importlib.import_module(module_name)
+        current = getattr(module, replacement.__name__, None)
+        if not callable(current):
+            problems.append(f"'{module_name}.{replacement.__name__}' is missing")
+        elif current is not replacement and _parameter_names(current) != _parameter_names(replacement):
+            problems.append(f"'{module_name}.{replacement.__name__}' takes different arguments")
+    if not problems:
+        return
+
+    try:
+        version = importlib.metadata.version(PH_ADORB_DISTRIBUTION)
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    raise RuntimeError(
+        f"The installed ph_adorb ({version}) can not be used with 'revive_extract.py', which replaces some of its "
+        f"internal functions: {'; '.join(problems)}. Please install ph_adorb 0.0.12, or update 'revive_extract.py'."
+    )
+
+
+def install() -> None:
+    """Patch the ph_adorb functions (see the module docstring) so that they also accept a revive extract."""
+    check_ph_adorb_functions()
+    for module_name, replacement in PATCHES:
+        module = importlib.import_module(module_name)
+        current = getattr(module, replacement.__name__)
+        if current is not replacement:
+            _ORIGINALS[replacement.__name__] = current
+            setattr(module, replacement.__name__, replacement)
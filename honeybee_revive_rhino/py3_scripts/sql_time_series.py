@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Read the hourly Report-Variables a job needs from an EnergyPlus SQL file in a single pass, and serve them from memory.
+
+The honeybee_revive resilience output scripts call `get_time_series_data()` once for every
+variable they plot, and each call opens the SQL file and scans `ReportVariableWithTime` again.
+`install()` replaces that function (everywhere it has been imported) with one which answers each
+request from memory. `load(sql_path, names)` reads all the named variables in one query; any
+other variable is read (on its own) the first time it is asked for.
+
+Only one SQL file is loaded at a time. The worker is persistent, so the job must `clear()` the
+loaded data when it is done, rather than holding it for the rest of the Rhino session.
+"""
+
+import importlib
+import os
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+
+# -- The modules which bind `get_time_series_data` by name, and so need to be patched.
+PATCH_MODULES = (
+    "honeybee_revive.output._shared",
+    "honeybee_revive.output.set_calculator",
+    "honeybee_revive.output.resilience_winter_graphs",
+    "honeybee_revive.output.resilience_summer_graphs",
+    "honeybee_revive.output.resilience_hourly_data",
+)
+
+
+class SQLTimeSeries:
+    """All of the (non-design-day) hourly rows from one EnergyPlus SQL file, grouped by variable name."""
+
+    def __init__(self, _sql_path: Path, _names: Iterable[str] = ()) -> None:
+        self.sql_path = Path(_sql_path).resolve()
+        self.signature = self.file_signature(self.sql_path)
+        self._rows: dict[str, list[tuple[str, int, int, int, float]]] = {}
+        self._records: dict[tuple[str, int, bool], list] = {}
+        self._timestamps: dict[tuple[int, int, int, int, bool], pd.Timestamp] = {}
+        self.load_variables(_names)
+
+    @staticmethod
+    def file_signature(_sql_path: Path) -> tuple[int, float]:
+        stat = os.stat(_sql_path)
+        return stat.st_size, stat.st_mtime
+
+    def load_variables(self, _names: Iterable[str]) -> None:
+        """Read the named variables (those not already loaded) from the ReportVariableWithTime table, in one query."""
+        names = sorted(set(_names) - set(self._rows))
+        if not names:
+            return
+
+        rows: dict[str, list[tuple[str, int, int, int, float]]] = defaultdict(list)
+        conn = sqlite3.connect(self.sql_path)
+        try:
+            c = conn.cursor()
+            c.execute(
+                "SELECT Name, KeyValue, Month, Day, Hour, Value FROM 'ReportVariableWithTime' "
+                f"WHERE Name IN ({', '.join('?' for _ in names)}) "
+                "AND DayType NOT IN ('WinterDesignDay', 'SummerDesignDay') "
+                "ORDER BY Month, Day, Hour",
+                names,
+            )
+            for name, key, month, day, hour, value in c:
+                rows[name].append((key, month, day, hour, value))
+        finally:
+            conn.close()
+
+        # -- A variable which is not in the file is stored as empty, so it is not looked for again.
+        for name in names:
+            self._rows[name] = rows.get(name, [])
+        print(f"\t>> Read {len(rows)} of {len(names)} output variables from: '{self.sql_path}'")
+
+    def _timestamp(self, _year: int, _month: int, _day: int, _hour: int, _utc: bool) -> pd.Timestamp:
+        """Return the (shared) timestamp for an hour. Every zone and variable re-uses the same 8,760 values."""
+        k = (_year, _month, _day, _hour, _utc)
+        if k not in self._timestamps:
+            self._timestamps[k] = pd.to_datetime(f"{_year}-{_month}-{_day} {_hour - 1}:00:00", utc=_utc)
+        return self._timestamps[k]
+
+    def get_time_series_data(self, _record_type: type, _output_variable: str, _year: int, _utc: bool) -> list:
+        """Return the variable's rows as Records, exactly as `_shared.get_time_series_data` would."""
+        k = (_output_variable, _year, _utc)
+        if k not in self._records:
+            self.load_variables([_output_variable])
+            self._records[k] = [
+                _record_type(self._timestamp(_year, month, day, hour, _utc), value, key)
+                for key, month, day, hour, value in self._rows[_output_variable]
+            ]
+        # -- Callers are free to modify the list they get back, so never hand out the cached one.
+        return list(self._records[k])
+
+
+_LOADED: SQLTimeSeries | None = None
+
+
+def load(_sql_path: Path, _names: Iterable[str] = ()) -> SQLTimeSeries:
+    """Return the SQLTimeSeries for the file (re-used if loaded and unchanged), with the named variables read."""
+    global _LOADED
+    sql_path = Path(_sql_path).resolve()
+    if _LOADED is None or (_LOADED.sql_path, _LOADED.signature) != (sql_path, SQLTimeSeries.file_signature(sql_path)):
+        _LOADED = SQLTimeSeries(sql_path)
+    _LOADED.load_variables(_names)
+    return _LOADED
+
+
+def clear() -> None:
+    """Drop the loaded SQL data, so the (persistent) worker does not hold on to it after the job."""
+    global _LOADED
+    _LOADED = None
+
+
+def install() -> None:
+    """Replace `get_time_series_data` in the honeybee_revive output modules with the single-pass version."""
+    _shared = importlib.import_module("honeybee_revive.output._shared")
+    record_type = _shared.Record
+
+    def get_time_series_data(source_file_path, output_variable, year=2021, utc=False):
+        return load(source_file_path).get_time_series_data(record_type, output_variable, year, utc)
+
+    for module_name in PATCH_MODULES:
+        try:
+            module = importlib.import_module(module_name)
+        except ModuleNotFoundError:
+            continue  # -- Not in this version of honeybee_revive
+        if hasattr(module, "get_time_series_data"):
+            module.get_time_series_data = get_time_series_data
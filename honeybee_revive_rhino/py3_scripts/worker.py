@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A long-lived Python-3 worker which runs the Honeybee-REVIVE Python-3 scripts on request.
+
+The worker is started once per Rhino session by `honeybee_revive_rhino/gh_compo_io/run_subprocess.py`
+and then reads one JSON job per line from stdin:
+
+    {"id": 1, "script": "/path/to/script.py", "args": ["arg-1", "arg-2"]}
+
+Each job is run exactly as if it were called from the command line (`python script.py arg-1 arg-2`),
+but inside this same interpreter, so the heavy imports (pandas, plotly, honeybee, ph_adorb) are
+only paid for once. When the job is done, a single response line is written to stdout:
+
+    @@HBRV-WORKER@@ {"id": 1, "stdout": "...", "stderr": "...", "exit_code": 0}
+
+If the job has a "stdin" (base64-encoded bytes) the script reads that data from its `sys.stdin`,
+as if it had been piped in. Otherwise its stdin is empty (it is never the worker's own stdin).
+
+If the job has `"stream": true`, each line the script prints is sent on as soon as it is complete
+(so the caller can show progress, and log it), before the final response:
+
+    @@HBRV-WORKER-OUTPUT@@ "the printed line"
+    @@HBRV-WORKER-STDERR@@ "a line written to stderr"
+
+A streamed job's output is not kept by the worker: the response's "stdout" / "stderr" then only hold
+what was not already sent. Either way, the response's stdout ends with the timings of the job (see
+`perf_phases.py`): the whole script as the phase "script", plus any phases the script timed itself:
+
+    @@HBRV-PERF@@ {"phases": [...]}
+
+Any other line found on stdout (ie: from a C-extension writing directly to the file-handle) is
+not part of the protocol and is simply passed along by the caller as extra output.
+
+Send {"command": "shutdown"} (or close stdin) to stop the worker.
+"""
+
+import base64
+import io
+import json
+import logging
+import os
+import runpy
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from time import perf_counter
+
+import perf_phases
+
+RESPONSE_PREFIX = "@@HBRV-WORKER@@ "
+OUTPUT_PREFIX = "@@HBRV-WORKER-OUTPUT@@ "
+STDERR_PREFIX = "@@HBRV-WORKER-STDERR@@ "
+
+
+def _write_protocol_line(_prefix: str, _data) -> None:
+    sys.__stdout__.write("{}{}\n".format(_prefix, json.dumps(_data)))
+    sys.__stdout__.flush()
+
+
+class StreamingOutput(io.TextIOBase):
+    """Sends each complete line the job writes on to the caller straight away, without keeping any of it."""
+
+    def __init__(self, _prefix: str) -> None:
+        super().__init__()
+        self._prefix = _prefix
+        self._partial_line = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, _text: str) -> int:
+        lines = (self._partial_line + _text).split("\n")
+        self._partial_line = lines.pop()
+        for line in lines:
+            _write_protocol_line(self._prefix, line)
+        return len(_text)
+
+    def flush_partial_line(self) -> None:
+        if self._partial_line:
+            _write_protocol_line(self._prefix, self._partial_line)
+            self._partial_line = ""
+
+    def getvalue(self) -> str:
+        return ""
+
+
+def _reset_logging() -> None:
+    """Remove any logging handlers a script added, so the next job's `basicConfig` call takes effect."""
+    for handler in logging.root.handlers[:]:
+        handler.close()
+        logging.root.removeHandler(handler)
+
+
+def _exit_code(_exit: SystemExit) -> int:
+    """Return the integer exit-code for a SystemExit, the same way the interpreter would."""
+    if _exit.code is None:
+        return 0
+    if isinstance(_exit.code, int):
+        return _exit.code
+    print(_exit.code, file=sys.stderr)
+    return 1
+
+
+def _job_stdin(_job: dict) -> io.TextIOWrapper:
+    """Return the job's stdin: its (base64-encoded) "stdin" data, or an empty stream."""
+    data = base64.b64decode(_job["stdin"]) if _job.get("stdin") else b""
+    return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+
+
+def run_job(_job: dict) -> dict:
+    """Run a single script-job in this interpreter and return the response dict.
+
+    Arguments:
+    ----------
+        * _job (dict): The job with the "script" path to run, its command-line "args" and (optionally) "stdin".
+
+    Returns:
+    --------
+        * dict: The response with the "id", "stdout", "stderr" and "exit_code" of the job.
+    """
+    script_path = os.path.abspath(_job["script"])
+    if _job.get("stream"):
+        stdout, stderr = StreamingOutput(OUTPUT_PREFIX), StreamingOutput(STDERR_PREFIX)
+    else:
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+    # -- Make the script see the same environment it would have as a stand-alone process.
+    original_argv, original_path, original_cwd, original_stdin = sys.argv, list(sys.path), os.getcwd(), sys.stdin
+    sys.argv = [script_path] + [str(arg) for arg in _job.get("args", [])]
+    sys.stdin = _job_stdin(_job)
+    sys.path.insert(0, os.path.dirname(script_path))
+
+    exit_code = 0
+    perf_phases.take_phases()  # -- Drop anything left over from outside of a job
+    start = perf_counter()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                runpy.run_path(script_path, run_name="__main__")
+            except SystemExit as e:
+                exit_code = _exit_code(e)
+            except BaseException:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        for stream in (stdout, stderr):
+            if isinstance(stream, StreamingOutput):
+                stream.flush_partial_line()
+        sys.argv, sys.path[:], sys.stdin = original_argv, original_path, original_stdin
+        os.chdir(original_cwd)
+        _reset_logging()
+
+    script_phase = {"name": "script", "seconds": round(perf_counter() - start, 6), "memory_mb": perf_phases.memory_mb()}
+    output = stdout.getvalue()
+    if output and not output.endswith("\n"):
+        output += "\n"
+    output += perf_phases.perf_line([script_phase] + perf_phases.take_phases()) + "\n"
+
+    return {
+        "id": _job.get("id"),
+        "stdout": output,
+        "stderr": stderr.getvalue(),
+        "exit_code": exit_code,
+    }
+
+
+def respond(_response: dict) -> None:
+    """Write a single response line to the protocol stream."""
+    _write_protocol_line(RESPONSE_PREFIX, _response)
+
+
+def main() -> None:
+    """Read jobs from stdin until it is closed, or a 'shutdown' command is received."""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            respond({"id": None, "stdout": "", "stderr": "Invalid job: {}\n{}".format(line, e), "exit_code": 1})
+            continue
+
+        if job.get("command") == "shutdown":
+            break
+
+        respond(run_job(job))
+
+
+if __name__ == "__main__":
+    main()
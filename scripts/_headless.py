@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Load the honeybee_revive_rhino component classes in plain CPython, without Rhino or Grasshopper.
+
+Shared by the benchmarks (`benchmarks/`) and the headless pipeline (`pipeline/`), whose entry
+points put this folder on `sys.path`.
+
+* The `gh_compo_io` sub-package `__init__` files use IronPython-only implicit relative
+  imports, so the packages are registered as empty namespaces and only the component
+  modules themselves are imported.
+* The few Rhino-hosted libraries the components touch (`Grasshopper`, `ladybug_rhino`)
+  get minimal stand-ins, but only if the real one cannot be imported.
+* `StubIGH` replaces `ph_gh_component_io.gh_io.IGH`, collecting the warnings / errors
+  instead of showing them on the canvas.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_NAME = "honeybee_revive_rhino"
+COMPO_PACKAGE_NAME = f"{PACKAGE_NAME}.gh_compo_io"
+
+
+# -----------------------------------------------------------------------------
+# -- IGH
+
+
+class StubIGH:
+    """A stand-in for `gh_io.IGH`, without any Rhino document or Grasshopper component."""
+
+    def __init__(self, _area_unit: str = "M2") -> None:
+        self.area_unit = _area_unit
+        self.warnings: list[str] = []
+        self.errors: list[str] = []
+        self.remarks: list[str] = []
+
+        # -- The Rhino / Grasshopper handles the real IGH holds.
+        self.ghdoc = None
+        self.ghenv = None
+        self.scriptcontext = None
+        self.Rhino = None
+        self.rhinoscriptsyntax = None
+        self.ghpythonlib_components = None
+        self.Grasshopper = None
+
+    def warning(self, _msg) -> None:
+        self.warnings.append(str(_msg))
+
+    def error(self, _msg) -> None:
+        self.errors.append(str(_msg))
+
+    def remark(self, _msg) -> None:
+        self.remarks.append(str(_msg))
+
+    def get_rhino_areas_unit_name(self) -> str:
+        return self.area_unit
+
+
+# -----------------------------------------------------------------------------
+# -- Rhino-hosted library stand-ins
+
+
+class _DataTree:
+    """The parts of `Grasshopper.DataTree` used by the components: `DataTree[T]()` and `.Add(item, path)`."""
+
+    def __init__(self) -> None:
+        self.branches: dict[tuple, list] = {}
+
+    def __class_getitem__(cls, _item):
+        return cls
+
+    def Add(self, _item, _path) -> None:
+        self.branches.setdefault(_path, []).append(_item)
+
+    @property
+    def BranchCount(self) -> int:
+        return len(self.branches)
+
+
+def _GH_Path(*_indices) -> tuple:
+    return tuple(_indices)
+
+
+def _add_module(_name: str, **_attrs) -> types.ModuleType:
+    module = types.ModuleType(_name)
+    module.__dict__.update(_attrs)
+    sys.modules[_name] = module
+    parent_name, _, child_name = _name.rpartition(".")
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+    return module
+
+
+def install_rhino_stand_ins(_rhino_units: str = "m") -> list[str]:
+    """Add stand-ins for the Rhino-hosted libraries which cannot be imported here.
+
+    ### Arguments:
+        * _rhino_units: The unit abbreviation the 'Rhino document' reports (ie: "m", "ft").
+
+    ### Returns:
+        * list[str]: The names of the modules which were replaced by a stand-in.
+    """
+    replaced = []
+
+    try:
+        importlib.import_module("Grasshopper.Kernel.Data")
+    except ImportError:
+        _add_module("Grasshopper", DataTree=_DataTree)
+        _add_module("Grasshopper.Kernel")
+        _add_module("Grasshopper.Kernel.Data", GH_Path=_GH_Path)
+        replaced.append("Grasshopper")
+
+    try:
+        importlib.import_module("ladybug_rhino.config")
+    except ImportError:
+        _add_module("ladybug_rhino")
+        _add_module("ladybug_rhino.config", units_abbreviation=lambda: _rhino_units)
+        replaced.append("ladybug_rhino")
+
+    return replaced
+
+
+# -----------------------------------------------------------------------------
+# -- Component modules
+
+
+def register_packages() -> None:
+    """Register the honeybee_revive_rhino packages without running their (IronPython-only) `__init__` files."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    package_dir = REPO_ROOT / PACKAGE_NAME
+    package_dirs = [package_dir] + sorted(p.parent for p in (package_dir / "gh_compo_io").rglob("__init__.py"))
+    for path in package_dirs:
+        name = ".".join(path.relative_to(REPO_ROOT).parts)
+        if name in sys.modules:
+            continue
+        module = types.ModuleType(name)
+        module.__path__ = [str(path)]
+        module.__package__ = name
+        sys.modules[name] = module
+        parent_name, _, child_name = name.rpartition(".")
+        if parent_name in sys.modules:
+            setattr(sys.modules[parent_name], child_name, module)
+
+
+def import_component_module(_module: str) -> types.ModuleType:
+    """Import a component module by its name relative to `gh_compo_io` (ie: 'adorb.create_fuel')."""
+    return importlib.import_module(f"{COMPO_PACKAGE_NAME}.{_module}")
+
+
+def package_modules() -> list[types.ModuleType]:
+    """Return all of the honeybee_revive_rhino modules imported so far."""
+    return [m for n, m in list(sys.modules.items()) if n.startswith(PACKAGE_NAME) and m is not None]
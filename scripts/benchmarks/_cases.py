@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""The benchmark cases: one for each GHCompo_* class, with the inputs to build it from the sample files."""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable
+
+from _headless import REPO_ROOT, StubIGH, import_component_module
+
+TESTS_DIR = REPO_ROOT / "tests"
+WEATHER_NAME = "USA_MN_Rochester.Intl.AP.726440_TMY3"
+
+DEFAULT_MODEL_PATH = TESTS_DIR / "_source_models" / "phius_rv2024_model.hbjson"
+DEFAULT_EPW_PATH = TESTS_DIR / "_source_weather" / WEATHER_NAME / f"{WEATHER_NAME}.epw"
+DEFAULT_STAT_PATH = TESTS_DIR / "_source_weather" / WEATHER_NAME / f"{WEATHER_NAME}.stat"
+DEFAULT_ADORB_CSV_PATH = TESTS_DIR / "adorb" / "hbrv" / "hb_revive_ADORB_results" / "hb_revive_ADORB_model_yearly.csv"
+
+
+# -----------------------------------------------------------------------------
+# -- Fixtures
+
+
+@dataclass
+class Fixtures:
+    """The input files shared by all of the cases. Optional files which are not given skip the cases needing them."""
+
+    model_path: Path
+    epw_path: Path
+    stat_path: Path
+    output_dir: Path
+    adorb_csv_path: Path | None = None
+    sql_path: Path | None = None
+
+    # -- For the scaling sweep: tile the model out to this many rooms (see `synthetic_model.py`)
+    n_rooms: int | None = None
+    unique_programs: bool = False
+    unique_hvac: bool = False
+
+    def available(self, _need: str) -> bool:
+        path = getattr(self, f"{_need}_path")
+        return path is not None and Path(path).exists()
+
+    @cached_property
+    def _model(self):
+        from synthetic_model import load_model, tile_model
+
+        model = load_model(str(self.model_path))
+        if self.n_rooms is None:
+            return model
+        return tile_model(model, self.n_rooms, self.unique_programs, self.unique_hvac)
+
+    def load(self) -> None:
+        """Read in the model, so that its loading time is not counted against the first case."""
+        self._model
+
+    def model(self):
+        """Return a new copy of the sample (or tiled) model."""
+        return self._model.duplicate()
+
+    def rooms(self) -> list:
+        return self.model().rooms
+
+    def shades(self) -> list:
+        model = self.model()
+        return list(model.orphaned_shades) + [s for r in model.rooms for s in r.shades]
+
+    def pv_shades(self) -> list:
+        """Return the shades, each with PV applied (the sample model's shades have none)."""
+        from honeybee_energy.generator.pv import PVProperties
+
+        shades = self.shades()
+        for shade in shades:
+            shade.properties.energy.pv_properties = PVProperties(f"{shade.identifier}_PV")
+        return shades
+
+    def lighting(self):
+        for room in self.model().rooms:
+            if room.properties.energy.lighting:
+                return room.properties.energy.lighting
+        return None
+
+    def material(self):
+        return self.model().properties.energy.materials[0]
+
+    def folder(self, _name: str) -> str:
+        path = self.output_dir / _name
+        path.mkdir(parents=True, exist_ok=True)
+        return str(path)
+
+
+# -----------------------------------------------------------------------------
+# -- Cases
+
+
+@dataclass
+class BenchmarkCase:
+    """A GHCompo_* class, and how to build its inputs.
+
+    `make_args` returns the constructor arguments (including the IGH) in the same order
+    as the Grasshopper component passes them. Cases whose work grows with the number of
+    rooms are marked `scales` and are the ones run in the room-count sweep. A `variant`
+    names a second case of the same component, run with different options.
+    """
+
+    module: str
+    class_name: str
+    make_args: Callable[[Fixtures, StubIGH], list[Any]]
+    needs: tuple[str, ...] = field(default_factory=tuple)
+    scales: bool = False
+    variant: str = ""
+
+    @property
+    def name(self) -> str:
+        name = f"{self.module}.{self.class_name}"
+        return f"{name}:{self.variant}" if self.variant else name
+
+
+def _analysis_period(*_args):
+    from ladybug.analysisperiod import AnalysisPeriod
+
+    return AnalysisPeriod(*_args)
+
+
+def _sim_output():
+    from honeybee_energy.simulation.output import SimulationOutput
+
+    return SimulationOutput()
+
+
+def _standard_schedule():
+    from honeybee_energy.lib.schedules import schedule_by_identifier
+
+    return schedule_by_identifier("Always On")
+
+
+def _adorb_variant(_fx: Fixtures, _analysis_duration: int):
+    """Return a copy of the model with a different ADORB analysis duration (for the sweep case)."""
+    model = _fx.model()
+    model.properties.revive.analysis_duration = _analysis_duration
+    return model
+
+
+def _load(_case_name: str, _fx: Fixtures, _IGH: StubIGH):
+    """Run another case's component to build an input for this one (ie: load a Program from the standards)."""
+    case = CASES_BY_NAME[_case_name]
+    cls = getattr(import_component_module(case.module), case.class_name)
+    return cls(*case.make_args(_fx, _IGH)).run()
+
+
+APPLIANCE_NAMES = ["Fridge_289W", "Dishwasher_269W", "Clotheswasher_120W", "Clothesdryer_704W", "Range_0W"]
+CO2_MEASURE_NAMES = ["HP Replace 1", "HP Replace 2", "HP Replace 3"]
+
+
+CASES = [
+    # -- adorb
+    BenchmarkCase(
+        "adorb.create_fuel",
+        "GHCompo_CreateADORBFuelType",
+        lambda fx, igh: [False, igh, 1, 0.17, 0.0, 150.0],
+    ),
+    BenchmarkCase(
+        "adorb.set_ADORB_output_variables",
+        "GHCompo_SetADORBSimulationOutputVariables",
+        lambda fx, igh: [igh, _sim_output()],
+    ),
+    BenchmarkCase(
+        "adorb.calc_ADORB_costs",
+        "GHCompo_CalculateADORBCost",
+        lambda fx, igh: [False, igh, "benchmark", fx.folder("adorb"), str(fx.sql_path), fx.model(), True, True],
+        needs=("sql",),
+        scales=True,
+    ),
+    BenchmarkCase(
+        "adorb.calc_ADORB_sweep",
+        "GHCompo_CalculateADORBSweep",
+        lambda fx, igh: [
+            False,
+            igh,
+            "benchmark",
+            fx.folder("adorb_sweep"),
+            str(fx.sql_path),
+            fx.model(),
+            [_adorb_variant(fx, 30), _adorb_variant(fx, 70)],
+            ["duration_30", "duration_70"],
+            True,
+        ],
+        needs=("sql",),
+    ),
+    BenchmarkCase(
+        "adorb.calc_ADORB_batch",
+        "GHCompo_CalculateADORBBatch",
+        lambda fx, igh: [
+            False,
+            igh,
+            "benchmark_batch",
+            fx.folder("adorb_batch"),
+            [str(fx.model_path)] * 4,
+            [str(fx.sql_path)],
+            ["model_1", "model_2", "model_3", "model_4"],
+            None,
+            True,
+        ],
+        needs=("sql",),
+    ),
+    BenchmarkCase(
+        "adorb.calc_ADORB_uncertainty",
+        "GHCompo_CalculateADORBUncertainty",
+        lambda fx, igh: [
+            False,
+            igh,
+            "benchmark",
+            fx.folder("adorb_uncertainty"),
+            str(fx.sql_path),
+            fx.model(),
+            "normal(1.0, 0.15)",
+            "uniform(0.8, 1.5)",
+            "triangular(0.0, 0.01, 0.04)",
+            "uniform(0.7, 1.1)",
+            None,
+            "triangular(0.8, 1.0, 1.4)",
+            10000,
+            1,
+            None,
+            True,
+        ],
+        needs=("sql",),
+    ),
+    BenchmarkCase(
+        "adorb.generate_graphs",
+        "GHCompo_GenerateADORBGraphs",
+        lambda fx, igh: [False, igh, str(fx.adorb_csv_path), fx.folder("adorb_graphs")],
+        needs=("adorb_csv",),
+    ),
+    # -- envelope
+    BenchmarkCase(
+        "envelope.set_material_properties",
+        "GHCompo_SetMaterialProperties",
+        lambda fx, igh: [igh, fx.material(), 12.5, 45.0, 0.4, 40],
+    ),
+    # -- equipment
+    BenchmarkCase(
+        "equipment.appliances_create",
+        "GHCompo_CreateReviveAppliance",
+        lambda fx, igh: [igh, "Benchmark Appliance", 250.0, _standard_schedule(), None, None, 0.0, 0.0, 0.0],
+    ),
+    BenchmarkCase(
+        "equipment.appliances_set_revive_properties",
+        "GHCompo_SetApplianceReviveProperties",
+        lambda fx, igh: [igh, 1200.0, 0.4, 15, _load("standards.load_appliance_from_standards", fx, igh)[0]],
+    ),
+    BenchmarkCase(
+        "equipment.appliances_add_to_room",
+        "GHCompo_AddReviveAppliancesToRooms",
+        lambda fx, igh: [igh, _load("standards.load_appliance_from_standards", fx, igh), fx.rooms()],
+        scales=True,
+    ),
+    BenchmarkCase(
+        "equipment.hvac_create_properties",
+        "GHCompo_CreateReviveHvacEquipmentProperties",
+        lambda fx, igh: [igh, "Benchmark ERV", 4500.0, 0.4, 20],
+    ),
+    BenchmarkCase(
+        "equipment.hvac_add_properties_to_rooms",
+        "GHCompo_AddHvacEquipmentPropertiesToRooms",
+        lambda fx, igh: [igh, [_load("equipment.hvac_create_properties", fx, igh)], fx.rooms()],
+        scales=True,
+    ),
+    BenchmarkCase(
+        "equipment.lighting_set_program_properties",
+        "GHCompo_SetLightingProgramProperties",
+        lambda fx, igh: [igh, 500.0, 0.4, 20, fx.lighting()],
+    ),
+    BenchmarkCase(
+        "equipment.lighting_set_room_properties",
+        "GHCompo_SetRoomLightingProperties",
+        lambda fx, igh: [igh, 500.0, 0.4, 20, fx.rooms()],
+        scales=True,
+    ),
+    BenchmarkCase(
+        "equipment.pv_set_shade_properties",
+        "GHCompo_SetPvShadeProperties",
+        lambda fx, igh: [igh, 12000.0, 0.4, 25, fx.pv_shades()],
+        scales=True,
+    ),
+    # -- model
+    BenchmarkCase(
+        "model.create_CO2_measure",
+        "GHCompo_CreateCO2ReductionMeasure",
+        lambda fx, igh: [igh, "Benchmark Measure", "PERFORMANCE", 20, 8500.0, None, "USA", 0.4],
+    ),
+    BenchmarkCase(
+        "model.add_CO2_measures_to_model",
+        "GHCompo_AddCO2ReductionMeasuresToModel",
+        lambda fx, igh: [igh, _load("standards.load_CO2_measure_from_standards", fx, igh), fx.model()],
+        scales=True,
+    ),
+    BenchmarkCase(
+        "model.set_model_properties",
+        "GHCompo_SetModelProperties",
+        lambda fx, igh: [igh, "USA", "MROWc", 50, 0.4, [], fx.model()],
+        scales=True,
+    ),
+    # -- resiliency
+    BenchmarkCase(
+        "resiliency.calc_dew_point",
+        "GHCompo_CalculateDewPoint",
+        lambda fx, igh: [igh, 300.0, 30.0, 22.0],
+    ),
+    BenchmarkCase(
+        "resiliency.create_epw",
+        "GHCompo_CreateResiliencyEPWFile",
+        lambda fx, igh: [igh, str(fx.epw_path), str(fx.stat_path), fx.folder("epw"), -29.0, -33.0, 34.0, 24.0, True],
+    ),
+    BenchmarkCase(
+        "resiliency.sweep_outage_periods",
+        "GHCompo_SweepResiliencyOutagePeriods",
+        lambda fx, igh: [
+            igh,
+            "benchmark",
+            fx.folder("sweep_outage_periods"),
+            str(fx.epw_path),
+            str(fx.stat_path),
+            -29.0,
+            -33.0,
+            34.0,
+            24.0,
+            [_analysis_period(1, d, 0, 1, d + 6, 23) for d in (2, 9, 16, 23)],
+            [],
+            fx.model(),
+            1,
+            [],
+            None,
+            True,
+        ],
+    ),
+    BenchmarkCase(
+        "resiliency.set_resiliency_output_variables",
+        "GHCompo_SetResiliencySimulationOutputVariables",
+        lambda fx, igh: [igh, _sim_output()],
+    ),
+    BenchmarkCase(
+        "resiliency.set_resiliency_program",
+        "GHCompo_SetResiliencyProgram",
+        lambda fx, igh: [
+            igh,
+            [fx.model()],
+            1,
+            [],
+            None,
+            _analysis_period(2, 1, 0, 2, 7, 23),
+            _analysis_period(7, 1, 0, 7, 7, 23),
+        ],
+        scales=True,
+    ),
+    BenchmarkCase(
+        "resiliency.set_resiliency_program",
+        "GHCompo_SetResiliencyProgram",
+        lambda fx, igh: [
+            igh,
+            [fx.model()],
+            1,
+            [],
+            None,
+            _analysis_period(2, 1, 0, 2, 7, 23),
+            _analysis_period(7, 1, 0, 7, 7, 23),
+            True,
+        ],
+        scales=True,
+        variant="shallow_copy",
+    ),
+    BenchmarkCase(
+        "resiliency.create_output",
+        "GHCompo_CreateResiliencyOutputFiles",
+        lambda fx, igh: [igh, str(fx.sql_path), fx.folder("resiliency")],
+        needs=("sql",),
+    ),
+    BenchmarkCase(
+        "resiliency.generate_winter_output",
+        "GHCompo_ResiliencyWinterOutput",
+        lambda fx, igh: [igh, str(fx.sql_path), fx.folder("resiliency_winter")],
+        needs=("sql",),
+    ),
+    BenchmarkCase(
+        "resiliency.generate_summer_output",
+        "GHCompo_ResiliencySummerOutput",
+        lambda fx, igh: [igh, str(fx.sql_path), fx.folder("resiliency_summer")],
+        needs=("sql",),
+    ),
+    # -- standards
+    BenchmarkCase(
+        "standards.load_schedules_from_standards",
+        "GHCompo_LoadSchedulesFromStandards",
+        lambda fx, igh: [igh, None],
+    ),
+    BenchmarkCase(
+        "standards.load_program_from_standards",
+        "GHCompo_LoadProgramFromStandards",
+        lambda fx, igh: [igh, None, "rv2024_Residence_Annual"],
+    ),
+    BenchmarkCase(
+        "standards.load_appliance_from_standards",
+        "GHCompo_LoadReviveApplianceFromStandardsLibrary",
+        lambda fx, igh: [igh, APPLIANCE_NAMES],
+    ),
+    BenchmarkCase(
+        "standards.load_CO2_measure_from_standards",
+        "GHCompo_LoadCO2ReductionMeasure",
+        lambda fx, igh: [igh, CO2_MEASURE_NAMES],
+    ),
+    BenchmarkCase(
+        "standards.create_revive_residential_program",
+        "GHCompo_CreateReviveResidentialProgram",
+        lambda fx, igh: [igh, "150 M2", 1, 3, _load("standards.load_program_from_standards", fx, igh)],
+    ),
+]
+
+CASES_BY_NAME = {c.module: c for c in CASES if not c.variant}
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Time one benchmark case: wall time, time spent waiting on Python-3 subprocess jobs, and peak memory."""
+
+import functools
+import statistics
+import tracemalloc
+import traceback
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+
+from _headless import COMPO_PACKAGE_NAME, StubIGH, import_component_module, package_modules
+
+from _cases import BenchmarkCase, Fixtures
+
+# -- The run_subprocess functions the components call (each one is imported by name, so every binding is wrapped)
+SUBPROCESS_FUNCTIONS = ("run_subprocess", "run_subprocess_in_worker")
+
+
+class SubprocessTimer:
+    """Adds up the time spent inside the run_subprocess functions."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.calls = 0
+
+    def reset(self) -> None:
+        self.seconds = 0.0
+        self.calls = 0
+
+    def _wrap(self, _func):
+        @functools.wraps(_func)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return _func(*args, **kwargs)
+            finally:
+                self.seconds += perf_counter() - start
+                self.calls += 1
+
+        timed.__benchmark_wrapped__ = True
+        return timed
+
+    def install(self) -> None:
+        """Wrap the run_subprocess functions everywhere they have been imported. Call after importing the components."""
+        run_subprocess = import_component_module("run_subprocess")
+        originals = {name: getattr(run_subprocess, name) for name in SUBPROCESS_FUNCTIONS}
+        wrapped = {name: self._wrap(func) for name, func in originals.items()}
+        for module in package_modules():
+            for name, func in originals.items():
+                if getattr(module, name, None) is func:
+                    setattr(module, name, wrapped[name])
+
+
+@dataclass
+class CaseResult:
+    status: str  # -- "ok", "skipped" or "error"
+    message: str = ""
+    wall_s: list[float] = field(default_factory=list)
+    subprocess_s: list[float] = field(default_factory=list)
+    subprocess_calls: int = 0
+    peak_mem_mb: float | None = None
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        if self.wall_s:
+            d["wall_s_min"] = min(self.wall_s)
+            d["wall_s_median"] = statistics.median(self.wall_s)
+            d["subprocess_s_median"] = statistics.median(self.subprocess_s)
+        return d
+
+
+def measure_case(
+    _case: BenchmarkCase, _fx: Fixtures, _timer: SubprocessTimer, _repeat: int, _area_unit: str
+) -> CaseResult:
+    """Run the case `_repeat` times for the timings, then once more with memory tracing on.
+
+    The inputs are built before each run, outside of the timed section.
+    Memory tracing slows Python down a lot, so it is kept out of the timed runs. The peak
+    memory is that of this (the 'Grasshopper') process only: the Python-3 worker is not included.
+    """
+    missing = [n for n in _case.needs if not _fx.available(n)]
+    if missing:
+        return CaseResult("skipped", "Missing input file(s): {}".format(", ".join(missing)))
+
+    try:
+        cls = getattr(import_component_module(_case.module), _case.class_name)
+    except Exception as e:
+        return CaseResult("error", "Failed to import {}.{}: {}".format(COMPO_PACKAGE_NAME, _case.module, e))
+
+    result = CaseResult("ok")
+    try:
+        for i in range(_repeat + 1):
+            IGH = StubIGH(_area_unit)
+            args = _case.make_args(_fx, IGH)
+            traced = i == _repeat
+
+            _timer.reset()
+            if traced:
+                tracemalloc.start()
+            start = perf_counter()
+
+            cls(*args).run()
+
+            wall = perf_counter() - start
+            if traced:
+                result.peak_mem_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+                tracemalloc.stop()
+            else:
+                result.wall_s.append(wall)
+                result.subprocess_s.append(_timer.seconds)
+                result.subprocess_calls = _timer.calls
+
+            result.warnings, result.errors = IGH.warnings, IGH.errors
+            if IGH.errors:
+                # -- The component gave up (or skipped part of its work): its timings are not comparable.
+                result.status = "error"
+                result.message = IGH.errors[0]
+                break
+    except Exception as e:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        result.status = "error"
+        result.message = "".join(traceback.format_exception_only(type(e), e)).strip()
+        traceback.print_exc()
+
+    return result
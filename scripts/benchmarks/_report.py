@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Write the benchmark report, and compare it against a stored baseline report."""
+
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from _headless import REPO_ROOT
+
+REPORT_FORMAT = "HBRV-BENCHMARK"
+REPORT_VERSION = 1
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def sweep_key(_case_name: str, _n_rooms: int) -> str:
+    """Return the result key for one case / model-size of the room-count sweep."""
+    return f"{_case_name}[n_rooms={_n_rooms}]"
+
+
+def build_report(
+    _results: dict[str, dict], _fixtures: dict[str, str | None], _settings: dict, _sweep: dict | None = None
+) -> dict:
+    """Return the report dict, with the environment it was run in.
+
+    Sweep results are stored flat (one key per case and model-size, see `sweep_key`) so they
+    compare against a baseline sweep exactly like the normal results. `_sweep` records the sizes.
+    """
+    return {
+        "format": REPORT_FORMAT,
+        "version": REPORT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "git_commit": _git_commit(),
+        },
+        "fixtures": _fixtures,
+        "settings": _settings,
+        "sweep": _sweep,
+        "results": _results,
+    }
+
+
+def write_report(_report: dict, _path: Path) -> None:
+    _path.parent.mkdir(parents=True, exist_ok=True)
+    with open(_path, "w") as f:
+        json.dump(_report, f, indent=2, sort_keys=True)
+
+
+def read_report(_path: Path) -> dict:
+    with open(_path, "r") as f:
+        report = json.load(f)
+    if report.get("format") != REPORT_FORMAT:
+        raise ValueError(f"The file: '{_path}' is not a benchmark report.")
+    return report
+
+
+# -----------------------------------------------------------------------------
+# -- Comparison
+
+
+@dataclass
+class Change:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+# -- (metric, smallest absolute change worth reporting): tiny timings are mostly noise.
+COMPARED_METRICS = (
+    ("wall_s_min", 0.005),
+    ("subprocess_s_median", 0.05),
+    ("peak_mem_mb", 1.0),
+)
+
+
+def compare_reports(_current: dict, _baseline: dict, _threshold: float) -> tuple[list[Change], list[str]]:
+    """Compare two reports, case by case.
+
+    ### Arguments:
+        * _current: The new report.
+        * _baseline: The stored baseline report.
+        * _threshold: The fractional change (ie: 0.1 = 10%) above which a metric counts as a regression.
+
+    ### Returns:
+        * tuple
+            - [0] (list[Change]): The metrics which got worse by more than the threshold.
+            - [1] (list[str]): Notes on the cases whose status changed, or which are only in one report.
+    """
+    regressions: list[Change] = []
+    notes: list[str] = []
+
+    current, baseline = _current["results"], _baseline["results"]
+    for case in sorted(set(current) | set(baseline)):
+        if case not in baseline:
+            notes.append(f"{case}: new case (no baseline).")
+            continue
+        if case not in current:
+            notes.append(f"{case}: not run (in the baseline only).")
+            continue
+
+        cur, base = current[case], baseline[case]
+        if cur["status"] != base["status"]:
+            notes.append(f"{case}: status '{base['status']}' -> '{cur['status']}'. {cur.get('message', '')}".strip())
+        if cur["status"] != "ok" or base["status"] != "ok":
+            continue
+
+        for metric, min_change in COMPARED_METRICS:
+            b, c = base.get(metric), cur.get(metric)
+            if b is None or c is None:
+                continue
+            change = Change(case, metric, b, c)
+            if c - b > min_change and change.ratio > _threshold:
+                regressions.append(change)
+
+    return regressions, notes
+
+
+def format_results_table(_report: dict, _baseline: dict | None = None) -> str:
+    """Return a text table of the results, with the change against the baseline (if given)."""
+
+    def _delta(_case: str, _metric: str) -> str:
+        if not _baseline:
+            return ""
+        base = _baseline["results"].get(_case, {}).get(_metric)
+        cur = _report["results"][_case].get(_metric)
+        if not base or cur is None:
+            return ""
+        return f" ({(cur - base) / base:+.0%})"
+
+    lines = [f"{'Case':<62} {'Status':<8} {'Wall [s]':>18} {'Subprocess [s]':>20} {'Peak [MB]':>16}"]
+    for case, result in sorted(_report["results"].items()):
+        if result["status"] != "ok":
+            lines.append(f"{case:<62} {result['status']:<8} {result.get('message', '')}")
+            continue
+        wall = f"{result['wall_s_min']:.3f}{_delta(case, 'wall_s_min')}"
+        sub = f"{result['subprocess_s_median']:.3f}{_delta(case, 'subprocess_s_median')}"
+        mem = f"{result['peak_mem_mb']:.1f}{_delta(case, 'peak_mem_mb')}"
+        lines.append(f"{case:<62} {result['status']:<8} {wall:>18} {sub:>20} {mem:>16}")
+    return "\n".join(lines)
+
+
+def format_sweep_table(_report: dict) -> str:
+    """Return a text table of the sweep: the time (and peak memory) curve of each case against the room count."""
+    sizes = _report["sweep"]["sizes"]
+    results = _report["results"]
+    case_names = sorted({k.rsplit("[n_rooms=", 1)[0] for k in results if "[n_rooms=" in k})
+
+    def _cell(_case: str, _n: int) -> str:
+        result = results.get(sweep_key(_case, _n))
+        if not result or result["status"] != "ok":
+            return result["status"] if result else "-"
+        return f"{result['wall_s_min']:.3f}s/{result['peak_mem_mb']:.0f}MB"
+
+    lines = [f"{'Case  [wall / peak-memory]':<62}" + "".join(f"{n:>16}" for n in sizes)]
+    for case in case_names:
+        lines.append(f"{case:<62}" + "".join(f"{_cell(case, n):>16}" for n in sizes))
+    return "\n".join(lines)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark every GHCompo_* class in honeybee_revive_rhino/gh_compo_io, without Rhino.
+
+Each component is built with a stub IGH and the sample model / weather files in 'tests/',
+then run: the wall time, the time spent in Python-3 subprocess jobs and the peak memory
+are written to a JSON report, which can be compared against a stored baseline report.
+
+Run with the Ladybug Tools Python-3 interpreter (or any Python >= 3.10 with honeybee,
+honeybee-energy, honeybee-revive, ph-units and ph-gh-component-io installed).
+
+Cases which need an EnergyPlus SQL file (ADORB costs, resiliency outputs) are skipped
+unless one is given with --sql.
+
+With --sweep, only the cases whose work grows with the number of rooms are run, once for
+each model size in --sizes (the sample model tiled out by `synthetic_model.py`), giving the
+time and memory curve for each component.
+
+Usage:
+    python scripts/benchmarks/run_benchmarks.py --output=benchmark.json
+    python scripts/benchmarks/run_benchmarks.py --sql=eplusout.sql --baseline=baseline.json --fail-on-regression
+    python scripts/benchmarks/run_benchmarks.py --only=standards --repeat=10
+    python scripts/benchmarks/run_benchmarks.py --sweep --sizes=10,100,1000 --unique-programs --output=sweep.json
+"""
+
+import argparse
+import dataclasses
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+# -- The headless component environment (StubIGH, Rhino stand-ins) is shared with the pipeline, in 'scripts/'
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import _headless  # noqa: E402
+
+from _cases import (  # noqa: E402
+    CASES,
+    DEFAULT_ADORB_CSV_PATH,
+    DEFAULT_EPW_PATH,
+    DEFAULT_MODEL_PATH,
+    DEFAULT_STAT_PATH,
+    Fixtures,
+)
+from _measure import SubprocessTimer, measure_case  # noqa: E402
+from _report import (  # noqa: E402
+    build_report,
+    compare_reports,
+    format_results_table,
+    format_sweep_table,
+    read_report,
+    sweep_key,
+    write_report,
+)
+
+DEFAULT_SWEEP_SIZES = "10,50,100,500,1000,5000"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the Honeybee-REVIVE component classes.")
+    parser.add_argument("--output", dest="output", default="benchmark.json", help="Report file path to write.")
+    parser.add_argument("--baseline", dest="baseline", help="A stored report to compare the results against.")
+    parser.add_argument(
+        "--threshold", dest="threshold", type=float, default=0.10, help="Regression threshold (0.10 = 10%%)."
+    )
+    parser.add_argument("--fail-on-regression", dest="fail_on_regression", action="store_true")
+    parser.add_argument("--repeat", dest="repeat", type=int, default=3, help="Timed runs per case.")
+    parser.add_argument("--only", dest="only", action="append", help="Only run the cases with this text in their name.")
+    parser.add_argument("--model", dest="model", default=str(DEFAULT_MODEL_PATH), help="The HBJSON model to use.")
+    parser.add_argument("--epw", dest="epw", default=str(DEFAULT_EPW_PATH))
+    parser.add_argument("--stat", dest="stat", default=str(DEFAULT_STAT_PATH))
+    parser.add_argument("--adorb-csv", dest="adorb_csv", default=str(DEFAULT_ADORB_CSV_PATH))
+    parser.add_argument("--sql", dest="sql", help="An EnergyPlus SQL file for the ADORB / resiliency cases.")
+    parser.add_argument("--area-unit", dest="area_unit", default="M2", help="The stub Rhino document's area unit.")
+    parser.add_argument("--sweep", dest="sweep", action="store_true", help="Run the room-count scaling sweep.")
+    parser.add_argument("--sizes", dest="sizes", default=DEFAULT_SWEEP_SIZES, help="The sweep's room counts.")
+    parser.add_argument("--unique-programs", dest="unique_programs", action="store_true", help="Sweep: copy programs.")
+    parser.add_argument("--unique-hvac", dest="unique_hvac", action="store_true", help="Sweep: copy HVAC systems.")
+    parser.add_argument("--work-dir", dest="work_dir", help="Folder for the outputs and caches (default: a temp dir).")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # -- Make the components importable in plain CPython
+    stand_ins = _headless.install_rhino_stand_ins()
+    _headless.register_packages()
+    if stand_ins:
+        print("Using stand-ins for: {}".format(", ".join(stand_ins)))
+
+    cases = [c for c in CASES if c.scales or not args.sweep]
+    cases = [c for c in cases if not args.only or any(o in c.name for o in args.only)]
+    if not cases:
+        print("ERROR: No cases match: {}".format(args.only))
+        sys.exit(1)
+
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="hbrv_benchmark_"))
+    fixtures = Fixtures(
+        model_path=Path(args.model),
+        epw_path=Path(args.epw),
+        stat_path=Path(args.stat),
+        output_dir=work_dir / "outputs",
+        adorb_csv_path=Path(args.adorb_csv) if args.adorb_csv else None,
+        sql_path=Path(args.sql) if args.sql else None,
+    )
+
+    # -- Keep all of the caches (ADORB results, Cambium index, ...) out of the user's simulation folder
+    from honeybee.config import folders as hb_folders
+
+    hb_folders.default_simulation_folder = str(work_dir / "simulation")
+
+    # -- Import everything first, so that import time is not counted against the first case
+    for case in cases:
+        try:
+            _headless.import_component_module(case.module)
+        except Exception as e:
+            print("WARNING: Failed to import '{}': {}".format(case.module, e))
+    timer = SubprocessTimer()
+    timer.install()
+
+    results = {}
+    sweep = None
+    if not args.sweep:
+        fixtures.load()
+        for case in cases:
+            print("Running: {}".format(case.name))
+            results[case.name] = measure_case(case, fixtures, timer, args.repeat, args.area_unit).to_dict()
+    else:
+        sizes = sorted(int(n) for n in args.sizes.split(","))
+        sweep = {"sizes": sizes, "unique_programs": args.unique_programs, "unique_hvac": args.unique_hvac}
+        for n_rooms in sizes:
+            sized_fixtures = dataclasses.replace(
+                fixtures, n_rooms=n_rooms, unique_programs=args.unique_programs, unique_hvac=args.unique_hvac
+            )
+            start = perf_counter()
+            sized_fixtures.load()
+            print("Built the {}-room model in {:.2f}s".format(n_rooms, perf_counter() - start))
+            for case in cases:
+                print("Running: {} [{} rooms]".format(case.name, n_rooms))
+                result = measure_case(case, sized_fixtures, timer, args.repeat, args.area_unit)
+                results[sweep_key(case.name, n_rooms)] = result.to_dict()
+
+    report = build_report(
+        results,
+        _fixtures={
+            "model": str(fixtures.model_path),
+            "epw": str(fixtures.epw_path),
+            "stat": str(fixtures.stat_path),
+            "adorb_csv": str(fixtures.adorb_csv_path) if fixtures.adorb_csv_path else None,
+            "sql": str(fixtures.sql_path) if fixtures.sql_path else None,
+        },
+        _settings={"repeat": args.repeat, "area_unit": args.area_unit, "stand_ins": stand_ins},
+        _sweep=sweep,
+    )
+    output_path = Path(args.output)
+    write_report(report, output_path)
+
+    baseline = read_report(Path(args.baseline)) if args.baseline else None
+    print()
+    print(format_sweep_table(report) if sweep else format_results_table(report, baseline))
+    print("\nReport written to: {}".format(output_path))
+
+    if not baseline:
+        return
+
+    regressions, notes = compare_reports(report, baseline, args.threshold)
+    for note in notes:
+        print("NOTE: {}".format(note))
+    for r in regressions:
+        print("REGRESSION: {} {}: {:.3f} -> {:.3f} ({:+.0%})".format(r.case, r.metric, r.baseline, r.current, r.ratio))
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
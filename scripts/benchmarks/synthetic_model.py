@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Build large synthetic Honeybee-Models by tiling the rooms of a sample model, for the scaling benchmarks.
+
+The sample model's rooms are copied onto a square grid until the model has N rooms. By default
+the copies all share the original ProgramType and HVAC objects (as rooms drawn in Rhino with
+the same inputs do); they can instead each be given their own copy, which is the worst case
+for anything that groups rooms by program or HVAC.
+
+Usage:
+    python scripts/benchmarks/synthetic_model.py --rooms=500 --output=model_500.hbjson
+    python scripts/benchmarks/synthetic_model.py --rooms=5000 --unique-programs --unique-hvac --output=m.hbjson
+"""
+
+import argparse
+import math
+from functools import lru_cache
+from pathlib import Path
+
+from honeybee.model import Model
+from ladybug_geometry.geometry3d import Vector3D
+
+# -- The space between the tiled copies, in model units.
+TILE_GAP = 1.0
+
+
+@lru_cache(maxsize=4)
+def load_model(_model_path: str) -> Model:
+    """Read in an HBJSON file (once per path). Do not modify the returned model."""
+    return Model.from_hbjson(_model_path)
+
+
+def _tile_spacing(_model: Model) -> tuple[float, float]:
+    """Return the X / Y step between copies so they do not overlap."""
+    x_min = min(r.geometry.min.x for r in _model.rooms)
+    y_min = min(r.geometry.min.y for r in _model.rooms)
+    x_max = max(r.geometry.max.x for r in _model.rooms)
+    y_max = max(r.geometry.max.y for r in _model.rooms)
+    return (x_max - x_min) + TILE_GAP, (y_max - y_min) + TILE_GAP
+
+
+def tile_model(_base_model: Model, _n_rooms: int, _unique_programs: bool = False, _unique_hvac: bool = False) -> Model:
+    """Return a new model with `_n_rooms` rooms, copied from the base model's rooms on a square grid.
+
+    ### Arguments:
+        * _base_model: The model to copy the rooms (and model-level properties) from.
+        * _n_rooms: The number of rooms the new model should have.
+        * _unique_programs: If True, each room gets its own copy of its ProgramType.
+        * _unique_hvac: If True, each room gets its own copy of its HVAC system.
+
+    ### Returns:
+        * Model: The new model. The orphaned shades and model properties are those of the base model.
+    """
+    if not _base_model.rooms:
+        raise ValueError("The model: '{}' has no rooms to tile.".format(_base_model.display_name))
+
+    new_model = _base_model.duplicate()
+    new_model.remove_rooms()
+    new_model.identifier = "{}_x{}".format(_base_model.identifier, _n_rooms)
+    new_model.display_name = "{} x{}".format(_base_model.display_name, _n_rooms)
+
+    base_rooms = _base_model.rooms
+    step_x, step_y = _tile_spacing(_base_model)
+    tiles_per_row = math.ceil(math.sqrt(math.ceil(_n_rooms / len(base_rooms))))
+
+    rooms = []
+    for i in range(_n_rooms):
+        tile, base_room = divmod(i, len(base_rooms))
+        row, col = divmod(tile, tiles_per_row)
+
+        room = base_rooms[base_room].duplicate()
+        room.add_prefix("T{}".format(tile))
+        room.move(Vector3D(col * step_x, row * step_y, 0))
+
+        room_prop_e = room.properties.energy
+        if _unique_programs and room_prop_e.program_type:
+            program = room_prop_e.program_type.duplicate()
+            program.identifier = "{}_{}".format(program.identifier, i)
+            room_prop_e.program_type = program
+        if _unique_hvac and room_prop_e.hvac:
+            hvac = room_prop_e.hvac.duplicate()
+            hvac.identifier = "{}_{}".format(hvac.identifier, i)
+            room_prop_e.hvac = hvac
+
+        rooms.append(room)
+
+    new_model.add_rooms(rooms)
+    return new_model
+
+
+def main():
+    from _cases import DEFAULT_MODEL_PATH
+
+    parser = argparse.ArgumentParser(description="Build a large synthetic HBJSON model by tiling a sample model.")
+    parser.add_argument("--rooms", dest="rooms", type=int, required=True, help="The number of rooms to build.")
+    parser.add_argument("--output", dest="output", required=True, help="The HBJSON file to write.")
+    parser.add_argument("--model", dest="model", default=str(DEFAULT_MODEL_PATH), help="The HBJSON model to tile.")
+    parser.add_argument("--unique-programs", dest="unique_programs", action="store_true")
+    parser.add_argument("--unique-hvac", dest="unique_hvac", action="store_true")
+    args = parser.parse_args()
+
+    model = tile_model(load_model(args.model), args.rooms, args.unique_programs, args.unique_hvac)
+    output_path = Path(args.output)
+    model.to_hbjson(output_path.stem, str(output_path.parent))
+    print("Wrote {} rooms to: {}".format(len(model.rooms), output_path))
+
+
+if __name__ == "__main__":
+    main()
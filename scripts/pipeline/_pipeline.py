@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""The steps of the headless REVIVE pipeline: each one runs the unchanged `GHCompo_*` class with a `StubIGH`.
+
+For each model:
+    1. Set Resiliency Program: the resiliency (outage) version of the model, using the outage
+       periods found when the resiliency EPW was made (the EPW is made once, for all the models).
+    2. Simulation outputs: the model + `simulation_parameter.json` of the 'annual' (ADORB) and
+       the 'resiliency' simulation are written, each with the components' output variables.
+    3. Simulate (optional): both are run through honeybee-energy / OpenStudio / EnergyPlus.
+    4. Calculate ADORB Costs, from the annual SQL file.
+    5. Generate ADORB Output Graphs, and the resiliency output graphs from the resiliency SQL file.
+"""
+
+import io
+import json
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+import _headless
+
+RESULTS_FILE_NAME = "revive_pipeline_results.csv"
+RESULTS_FIELDS = [
+    "name",
+    "status",
+    "seconds",
+    "annual_sql",
+    "resiliency_sql",
+    "adorb_yearly_csv",
+    "adorb_cumulative_csv",
+    "adorb_graphs",
+    "resiliency_graphs",
+    "warnings",
+    "log",
+    "error",
+]
+
+
+@dataclass
+class PipelineSettings:
+    """The inputs shared by every model in the run."""
+
+    epw_path: str
+    output_folder: str
+    resiliency_epw_path: str
+    winter_period: dict
+    summer_period: dict
+    num_dwellings: int = 1
+    simulate: bool = False
+
+
+@dataclass
+class ModelJob:
+    """One model to run through the pipeline. The SQL files are only given when the simulation is not run here."""
+
+    name: str
+    model_path: str
+    annual_sql: str | None = None
+    resiliency_sql: str | None = None
+
+
+@dataclass
+class ModelResult:
+    name: str
+    status: str = "ok"
+    seconds: float = 0.0
+    annual_sql: str = ""
+    resiliency_sql: str = ""
+    adorb_yearly_csv: str = ""
+    adorb_cumulative_csv: str = ""
+    adorb_graphs: str = ""
+    resiliency_graphs: str = ""
+    warnings: list[str] = field(default_factory=list)
+    log: str = ""
+    error: str = ""
+
+    def to_row(self) -> dict:
+        row = asdict(self)
+        row["warnings"] = " | ".join(self.warnings)
+        return row
+
+
+# -----------------------------------------------------------------------------
+# -- Environment
+
+
+def setup_environment() -> list[str]:
+    """Make the component modules importable in plain CPython. Returns the Rhino libraries stood in for."""
+    stand_ins = _headless.install_rhino_stand_ins()
+    _headless.register_packages()
+    return stand_ins
+
+
+def component(_module: str, _class_name: str):
+    return getattr(_headless.import_component_module(_module), _class_name)
+
+
+def new_IGH() -> _headless.StubIGH:
+    # -- The models are converted to Meters when they are read in.
+    return _headless.StubIGH("M2")
+
+
+def check_IGH(_IGH: _headless.StubIGH, _step: str, _warnings: list[str]) -> None:
+    """Raise on any error the component sent to the IGH, and collect its warnings."""
+    _warnings.extend(f"{_step}: {w}" for w in _IGH.warnings)
+    if _IGH.errors:
+        raise RuntimeError(f"{_step}: {'; '.join(_IGH.errors)}")
+
+
+# -----------------------------------------------------------------------------
+# -- Shared (once per run) step
+
+
+def create_resiliency_epw(
+    _epw_path: str,
+    _stat_path: str,
+    _folder: str,
+    _winter_dry_bulb_C: float,
+    _winter_dew_point_C: float,
+    _summer_dry_bulb_C: float,
+    _summer_dew_point_C: float,
+) -> tuple[str, dict, dict]:
+    """Run 'Create Resiliency EPW'. Returns the new EPW file path and the winter / summer outage periods (as dicts)."""
+    IGH = new_IGH()
+    epw_path, winter_period, summer_period = component("resiliency.create_epw", "GHCompo_CreateResiliencyEPWFile")(
+        IGH,
+        _epw_path,
+        _stat_path,
+        _folder,
+        _winter_dry_bulb_C,
+        _winter_dew_point_C,
+        _summer_dry_bulb_C,
+        _summer_dew_point_C,
+        True,
+    ).run()
+    check_IGH(IGH, "Create Resiliency EPW", [])
+    if not epw_path:
+        raise ValueError("Failed to create the resiliency EPW file. Please check the weather inputs.")
+    return epw_path, winter_period.to_dict(), summer_period.to_dict()
+
+
+# -----------------------------------------------------------------------------
+# -- Per-model steps
+
+
+def load_model(_model_path: str):
+    from honeybee.model import Model
+
+    model = Model.from_hbjson(_model_path)
+    model.convert_to_units("Meters")
+    return model
+
+
+def set_resiliency_program(_settings: PipelineSettings, _model, _warnings: list[str]):
+    from ladybug.analysisperiod import AnalysisPeriod
+
+    IGH = new_IGH()
+    resiliency_model, _ = component("resiliency.set_resiliency_program", "GHCompo_SetResiliencyProgram")(
+        IGH,
+        [_model],
+        _settings.num_dwellings,
+        [],
+        None,
+        AnalysisPeriod.from_dict(_settings.winter_period),
+        AnalysisPeriod.from_dict(_settings.summer_period),
+    ).run()
+    check_IGH(IGH, "Set Resiliency Program", _warnings)
+    if not resiliency_model:
+        raise ValueError("Set Resiliency Program did not return a model.")
+    return resiliency_model
+
+
+def write_simulation_inputs(
+    _folder: Path, _name: str, _model, _module: str, _class_name: str, _warnings: list[str]
+) -> Path:
+    """Write the model and its SimulationParameter (with the component's output variables) to the folder."""
+    from honeybee_energy.simulation.parameter import SimulationParameter
+
+    IGH = new_IGH()
+    sim_output = component(_module, _class_name)(IGH, None).run()
+    check_IGH(IGH, _class_name, _warnings)
+
+    _folder.mkdir(parents=True, exist_ok=True)
+    sim_par = SimulationParameter(output=sim_output)
+    with open(_folder / "simulation_parameter.json", "w") as sim_par_file:
+        json.dump(sim_par.to_dict(), sim_par_file)
+    return Path(_model.to_hbjson(_name, str(_folder)))
+
+
+def simulate(_model_path: Path, _epw_path: str) -> str:
+    """Run the model through OpenStudio / EnergyPlus. Returns the path to the SQL file."""
+    from honeybee_energy.cli.simulate import simulate_model
+
+    sim_folder = _model_path.parent / "openstudio"
+    outputs = simulate_model(
+        str(_model_path),
+        _epw_path,
+        sim_par_json=str(_model_path.parent / "simulation_parameter.json"),
+        folder=str(sim_folder),
+    )
+    sql_paths = [p for p in outputs if p and str(p).endswith(".sql")]
+    if not sql_paths:
+        raise RuntimeError(f"The simulation of '{_model_path}' did not produce a SQL file. See: '{sim_folder}'")
+    return sql_paths[0]
+
+
+def calc_ADORB(_name: str, _folder: Path, _sql_path: str, _model, _warnings: list[str]) -> tuple[str, str]:
+    IGH = new_IGH()
+    yearly_csv, cumulative_csv, _ = component("adorb.calc_ADORB_costs", "GHCompo_CalculateADORBCost")(
+        False, IGH, _name, str(_folder), _sql_path, _model, True
+    ).run()
+    check_IGH(IGH, "Calculate ADORB Costs", _warnings)
+    if not yearly_csv:
+        raise ValueError("Calculate ADORB Costs did not return any results.")
+    return yearly_csv, cumulative_csv
+
+
+def generate_ADORB_graphs(_yearly_csv: str, _folder: Path, _warnings: list[str]) -> str:
+    IGH = new_IGH()
+    graphs_folder = component("adorb.generate_graphs", "GHCompo_GenerateADORBGraphs")(
+        False, IGH, _yearly_csv, str(_folder)
+    ).run()
+    check_IGH(IGH, "Generate ADORB Output Graphs", _warnings)
+    return graphs_folder or ""
+
+
+def generate_resiliency_graphs(_sql_path: str, _folder: Path, _warnings: list[str]) -> str:
+    IGH = new_IGH()
+    outputs_folder = component("resiliency.create_output", "GHCompo_CreateResiliencyOutputFiles")(
+        IGH, _sql_path, str(_folder)
+    ).run()
+    check_IGH(IGH, "Create Resiliency Output Files", _warnings)
+    return outputs_folder or ""
+
+
+def run_steps(_settings: PipelineSettings, _job: ModelJob, _result: ModelResult) -> None:
+    folder = Path(_settings.output_folder) / _job.name
+    warnings = _result.warnings
+
+    print(f"\t>> Loading the model: '{_job.model_path}'")
+    model = load_model(_job.model_path)
+
+    print("\t>> Setting the resiliency program")
+    resiliency_model = set_resiliency_program(_settings, model, warnings)
+
+    print("\t>> Writing the simulation inputs")
+    annual_model_path = write_simulation_inputs(
+        folder / "annual",
+        _job.name,
+        model,
+        "adorb.set_ADORB_output_variables",
+        "GHCompo_SetADORBSimulationOutputVariables",
+        warnings,
+    )
+    resiliency_model_path = write_simulation_inputs(
+        folder / "resiliency",
+        _job.name,
+        resiliency_model,
+        "resiliency.set_resiliency_output_variables",
+        "GHCompo_SetResiliencySimulationOutputVariables",
+        warnings,
+    )
+
+    _result.annual_sql = _job.annual_sql or ""
+    _result.resiliency_sql = _job.resiliency_sql or ""
+    if _settings.simulate:
+        print("\t>> Simulating the annual model")
+        _result.annual_sql = simulate(annual_model_path, _settings.epw_path)
+        print("\t>> Simulating the resiliency model")
+        _result.resiliency_sql = simulate(resiliency_model_path, _settings.resiliency_epw_path)
+
+    if _result.annual_sql:
+        print(f"\t>> Calculating the ADORB costs from: '{_result.annual_sql}'")
+        _result.adorb_yearly_csv, _result.adorb_cumulative_csv = calc_ADORB(
+            _job.name, folder / "adorb", _result.annual_sql, model, warnings
+        )
+        print("\t>> Generating the ADORB graphs")
+        _result.adorb_graphs = generate_ADORB_graphs(_result.adorb_yearly_csv, folder / "adorb", warnings)
+    else:
+        warnings.append("No annual SQL file: the ADORB costs were not calculated.")
+
+    if _result.resiliency_sql:
+        print(f"\t>> Generating the resiliency graphs from: '{_result.resiliency_sql}'")
+        _result.resiliency_graphs = generate_resiliency_graphs(
+            _result.resiliency_sql, folder / "resiliency" / "graphs", warnings
+        )
+    else:
+        warnings.append("No resiliency SQL file: the resiliency graphs were not generated.")
+
+
+def run_model(_settings: PipelineSettings, _job: ModelJob) -> ModelResult:
+    """Run one model through the pipeline. Never raises: a failure is returned as the result's 'error'."""
+    log_path = Path(_settings.output_folder) / "logs" / f"{_job.name}.log"
+    result = ModelResult(_job.name, log=str(log_path))
+
+    output = io.StringIO()
+    start = perf_counter()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            run_steps(_settings, _job, result)
+        except Exception as e:
+            traceback.print_exc()
+            # -- Only the last line: a Python-3 job's error message holds its whole traceback (it is in the log).
+            message = str(e).strip().splitlines()
+            result.status = "failed"
+            result.error = f"{type(e).__name__}: {message[-1] if message else ''}"
+    result.seconds = round(perf_counter() - start, 2)
+
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        log_file.write(output.getvalue())
+    return result
+
+
+def init_pool_process(_simulation_folder: str) -> None:
+    """Set up each pool process the same way as the main process."""
+    setup_environment()
+    from honeybee.config import folders as hb_folders
+
+    hb_folders.default_simulation_folder = _simulation_folder
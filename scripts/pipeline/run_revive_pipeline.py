@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""Run Honeybee-Models through the REVIVE pipeline without Rhino: the same steps as the Grasshopper components.
+
+The resiliency EPW is made once from the EPW / STAT files. Then each model gets the resiliency
+program, the annual (ADORB) and resiliency simulation inputs are written, both are simulated
+(with --simulate, which needs OpenStudio / EnergyPlus) and the ADORB costs, ADORB graphs and
+resiliency graphs are made. Without --simulate, existing SQL files can be given with --sql /
+--resiliency-sql (a single model only).
+
+Each model's output goes to '<output>/logs/<name>.log'. A model which fails is recorded as
+'failed' in '<output>/revive_pipeline_results.csv' and the other models carry on. With --jobs,
+the models are run in parallel, in a pool of processes.
+
+Run with the Ladybug Tools Python-3 interpreter (or any Python >= 3.10 with honeybee,
+honeybee-energy, honeybee-revive, ph-units, ph-gh-component-io and ph-adorb installed).
+
+Usage:
+    python scripts/pipeline/run_revive_pipeline.py model.hbjson --epw=site.epw --stat=site.stat \
+        --winter-dry-bulb=-29 --winter-dew-point=-33 --summer-dry-bulb=34 --summer-dew-point=24 \
+        --sql=eplusout.sql --output=revive_out
+    python scripts/pipeline/run_revive_pipeline.py models/*.hbjson --epw=site.epw --stat=site.stat \
+        --winter-dry-bulb=-29 --winter-dew-point=-33 --summer-dry-bulb=34 --summer-dew-point=24 \
+        --simulate --jobs=8 --output=revive_out
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# -- The headless component environment (StubIGH, Rhino stand-ins) is shared with the benchmarks, in 'scripts/'
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import _pipeline  # noqa: E402
+from _pipeline import RESULTS_FIELDS, RESULTS_FILE_NAME, ModelJob, ModelResult, PipelineSettings  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run Honeybee-Models through the REVIVE pipeline, without Rhino.")
+    parser.add_argument("models", nargs="+", help="The HBJSON model files to run.")
+    parser.add_argument("--epw", dest="epw", required=True, help="The site EPW file.")
+    parser.add_argument("--stat", dest="stat", required=True, help="The site STAT file.")
+    parser.add_argument("--winter-dry-bulb", dest="winter_dry_bulb", type=float, required=True, help="10-yr, deg-C.")
+    parser.add_argument("--winter-dew-point", dest="winter_dew_point", type=float, required=True, help="10-yr, deg-C.")
+    parser.add_argument("--summer-dry-bulb", dest="summer_dry_bulb", type=float, required=True, help="20-yr, deg-C.")
+    parser.add_argument("--summer-dew-point", dest="summer_dew_point", type=float, required=True, help="20-yr, deg-C.")
+    parser.add_argument("--num-dwellings", dest="num_dwellings", type=int, default=1, help="For the resiliency MEL.")
+    parser.add_argument("--output", dest="output", default="revive_pipeline", help="The folder to write to.")
+    parser.add_argument("--simulate", dest="simulate", action="store_true", help="Run the EnergyPlus simulations.")
+    parser.add_argument("--sql", dest="sql", help="The annual SQL file (without --simulate, a single model only).")
+    parser.add_argument("--resiliency-sql", dest="resiliency_sql", help="The resiliency SQL file (as --sql).")
+    parser.add_argument("--jobs", dest="jobs", type=int, default=1, help="The models to run at the same time.")
+    return parser.parse_args()
+
+
+def build_jobs(_args) -> list[ModelJob]:
+    names = [Path(p).stem for p in _args.models]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Each model file needs a unique name. Found more than once: {duplicates}")
+    if (_args.sql or _args.resiliency_sql) and len(_args.models) > 1:
+        raise ValueError("--sql / --resiliency-sql can only be used with a single model.")
+    return [ModelJob(n, str(Path(p).resolve()), _args.sql, _args.resiliency_sql) for n, p in zip(names, _args.models)]
+
+
+def run_jobs(_settings: PipelineSettings, _jobs: list[ModelJob], _n_jobs: int, _simulation_folder: str):
+    """Run every model, in-process or in a pool of processes. Returns the results in the jobs' order."""
+    n_processes = max(1, min(_n_jobs, len(_jobs)))
+    if n_processes == 1:
+        results = []
+        for i, job in enumerate(_jobs, start=1):
+            results.append(_pipeline.run_model(_settings, job))
+            print(f"[{i}/{len(_jobs)}] {job.name}: {results[-1].status} ({results[-1].seconds} s)")
+        return results
+
+    print(f"Running {len(_jobs)} models with {n_processes} processes...")
+    results_by_index: dict[int, ModelResult] = {}
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        n_processes, mp_context=context, initializer=_pipeline.init_pool_process, initargs=(_simulation_folder,)
+    ) as pool:
+        futures = {pool.submit(_pipeline.run_model, _settings, job): i for i, job in enumerate(_jobs)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                results_by_index[i] = future.result()
+            except Exception as e:
+                # -- The pool process itself died (ie: out of memory).
+                results_by_index[i] = ModelResult(_jobs[i].name, status="failed", error=f"{type(e).__name__}: {e}")
+            result = results_by_index[i]
+            print(f"[{done}/{len(_jobs)}] {result.name}: {result.status} ({result.seconds} s)")
+    return [results_by_index[i] for i in range(len(_jobs))]
+
+
+def write_results_table(_results: list[ModelResult], _file_path: Path) -> None:
+    with open(_file_path, "w", newline="", encoding="utf-8") as results_file:
+        writer = csv.DictWriter(results_file, fieldnames=RESULTS_FIELDS)
+        writer.writeheader()
+        for result in _results:
+            writer.writerow(result.to_row())
+
+
+def main():
+    args = parse_args()
+    jobs = build_jobs(args)
+    output_folder = Path(args.output).resolve()
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    stand_ins = _pipeline.setup_environment()
+    if stand_ins:
+        print("Using stand-ins for: {}".format(", ".join(stand_ins)))
+
+    # -- Keep the ADORB results cache and the Cambium index with the outputs
+    from honeybee.config import folders as hb_folders
+
+    simulation_folder = str(output_folder / "_simulation")
+    hb_folders.default_simulation_folder = simulation_folder
+
+    print("Creating the resiliency EPW file...")
+    resiliency_epw_path, winter_period, summer_period = _pipeline.create_resiliency_epw(
+        os.path.abspath(args.epw),
+        os.path.abspath(args.stat),
+        str(output_folder / "weather"),
+        args.winter_dry_bulb,
+        args.winter_dew_point,
+        args.summer_dry_bulb,
+        args.summer_dew_point,
+    )
+    # -- Simulate from a copy of the EPW without a STAT file beside it: honeybee-energy renames any STAT
+    # -- file next to the EPW while EnergyPlus runs, which would clash between the parallel jobs.
+    epw_path = shutil.copy(args.epw, output_folder / "weather" / os.path.basename(args.epw))
+    settings = PipelineSettings(
+        epw_path=str(epw_path),
+        output_folder=str(output_folder),
+        resiliency_epw_path=resiliency_epw_path,
+        winter_period=winter_period,
+        summer_period=summer_period,
+        num_dwellings=args.num_dwellings,
+        simulate=args.simulate,
+    )
+
+    results = run_jobs(settings, jobs, args.jobs, simulation_folder)
+    results_path = output_folder / RESULTS_FILE_NAME
+    write_results_table(results, results_path)
+    print("\nResults table written to: {}".format(results_path))
+
+    failed = [r for r in results if r.status != "ok"]
+    for result in failed:
+        print("FAILED: {}: {} (see: {})".format(result.name, result.error, result.log))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()